@@ -182,6 +182,13 @@ def coverage(session: Session) -> None:
     session.run("coverage", *args)
 
 
+@session(python=python_versions[0])
+def bench(session: Session) -> None:
+    """Run the benchmark suite (e.g. nox -s bench -- --baseline baseline.json)."""
+    session.install(".")
+    session.run("python", "-m", "num2word_greek.benchmark", "suite", *session.posargs)
+
+
 @session(python=python_versions[0])
 def typeguard(session: Session) -> None:
     """Runtime type checking using Typeguard."""
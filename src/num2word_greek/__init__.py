@@ -1,9 +1,15 @@
 """Numbers2Words Greek."""
 
-import logging
+__version__ = "0.0.2a"
 
 
-log = logging.getLogger(__name__)
-log.addHandler(logging.NullHandler())
+def __getattr__(name):
+    # The package logger is created on first use, since importing logging slows down start up
+    if name == "log":
+        import logging
 
-__version__ = "0.0.2a"
\ No newline at end of file
+        global log
+        log = logging.getLogger(__name__)
+        log.addHandler(logging.NullHandler())
+        return log
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
@@ -0,0 +1,121 @@
+# MIT License
+#
+# Copyright (c) [year] [fullname]
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+""" asyncio interface. The conversions run in an executor (so that they do not block the
+    event loop) and the sentences that arrive close together are converted in a single
+    batch, which cuts the overhead per call. E.g.
+        async with AsyncConverter(max_batch_size=64, max_wait=0.002) as converter:
+            words = await converter.convert_sentence("Στις 10:15")
+"""
+
+import asyncio
+
+from num2word_greek.numbers2words import convert_sentence
+
+
+def _convert_batch(sentences: list, to_lower: bool = False) -> list:
+    # Runs in the executor. Errors are returned (not raised) so that they only affect their own sentence.
+    out = []
+    for sentence in sentences:
+        try:
+            out.append(convert_sentence(sentence, to_lower))
+        except Exception as e:
+            out.append(e)
+    return out
+
+
+class AsyncConverter:
+    """ Converts sentences from coroutines, without blocking the event loop.
+        Args:
+            executor: Where the conversions run. None uses the default executor of the event
+                      loop (threads). A concurrent.futures.ProcessPoolExecutor uses more cores.
+            max_batch_size: The maximum number of sentences converted by a single executor call.
+            max_wait: How long (in seconds) to wait for more sentences before converting a batch
+                      which is not full. Use 0 in order to only batch the already waiting sentences.
+            to_lower: Whether to lowercase the sentences before converting them.
+    """
+
+    def __init__(self, executor=None, max_batch_size: int = 64, max_wait: float = 0.002, to_lower: bool = False):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be positive, got {}.".format(max_batch_size))
+        if max_wait < 0:
+            raise ValueError("max_wait cannot be negative, got {}.".format(max_wait))
+        self.executor = executor
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.to_lower = to_lower
+        self._pending = []
+        self._timer = None
+        self._tasks = set()
+
+    async def convert_sentence(self, sentence: str) -> str:
+        """ Converts a sentence (see numbers2words.convert_sentence), possibly batched with others. """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((sentence, future))
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._flush)
+        return await future
+
+    async def convert_many(self, sentences: list) -> list:
+        """ Converts many sentences concurrently and returns the results in the same order. """
+        return list(await asyncio.gather(*(self.convert_sentence(sentence) for sentence in sentences)))
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        while self._pending:
+            batch, self._pending = self._pending[:self.max_batch_size], self._pending[self.max_batch_size:]
+            task = asyncio.ensure_future(self._run_batch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, batch: list):
+        loop = asyncio.get_running_loop()
+        sentences = [sentence for sentence, _ in batch]
+        try:
+            results = await loop.run_in_executor(self.executor, _convert_batch, sentences, self.to_lower)
+        except Exception as e:  # e.g. a broken process pool
+            results = [e] * len(batch)
+        for (_, future), result in zip(batch, results):
+            if future.done():  # Cancelled by the caller
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    async def close(self):
+        """ Converts the waiting sentences and waits for all the running batches. """
+        self._flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
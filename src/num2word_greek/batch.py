@@ -0,0 +1,100 @@
+# MIT License
+#
+# Copyright (c) [year] [fullname]
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+""" Conversion of many integers at once (e.g. a column of amounts from a table).
+    NumPy is used if it is installed (pip install Numbers2Words-Greek[numpy]),
+    otherwise the same results are computed in pure python.
+"""
+
+import operator
+
+from num2word_greek import convert_numbers as _numbers
+from num2word_greek.convert_numbers import _convert_digits, _convert_triads
+from num2word_greek.prefixes import _prefixes, get_inflection
+
+try:
+    import numpy as np
+except ImportError:  # numpy is an optional dependency
+    np = None
+
+
+def convert_numbers_batch(numbers, gender: str = "neuter", case: str = "nominative") -> list:
+    """ Converts a sequence of non negative integers to their greek words. The result
+        is the same as [convert_numbers(str(n), gender, case) for n in numbers] but each
+        distinct value is only converted once.
+        Args:
+            numbers: A sequence (or iterable) of integers (of any size) or a numpy integer
+                     array (of any shape, it will be flattened).
+            gender: The gender that all the numbers agree with ("masculine", "feminine"
+                    or "neuter").
+            case: The case that all the numbers agree with ("nominative", "genitive"
+                  or "accusative").
+        Returns:
+            A list with the words for each number (in the same order).
+        Raises:
+            TypeError: If the input contains non integer values.
+            ValueError: If a number is negative or the gender or the case is unknown.
+    """
+    inflection = None if gender == "neuter" and case == "nominative" else get_inflection(gender, case)
+    if np is not None and isinstance(numbers, np.ndarray):
+        return _convert_array(numbers, inflection)
+    values = [operator.index(number) for number in numbers]  # raises TypeError for floats, strings etc.
+    if np is not None and len(values) > 1:
+        try:
+            return _convert_array(np.asarray(values, dtype=np.int64), inflection)
+        except OverflowError:
+            pass  # Larger than 64 bits, convert them in pure python
+    converted = {}
+    out = []
+    for value in values:
+        words = converted.get(value)
+        if words is None:
+            words = converted[value] = _convert_value(value, inflection)
+        out.append(words)
+    return out
+
+
+def _convert_value(value: int, inflection=None) -> str:
+    if value < 0:
+        raise ValueError("We only accept non negative integers, got {}.".format(value))
+    return _convert_digits(str(value), inflection)
+
+
+def _convert_array(numbers, inflection=None) -> list:
+    numbers = numbers.ravel()
+    if numbers.dtype.kind not in "iu":
+        raise TypeError("Expected an array of integers, got an array of {}.".format(numbers.dtype))
+    if numbers.size == 0:
+        return []
+    unique, inverse = np.unique(numbers, return_inverse=True)  # unique is sorted
+    if unique[0] < 0:
+        raise ValueError("We only accept non negative integers, got {}.".format(unique[0]))
+    # Decompose all the distinct values into triads at once (64 bit integers have at most 7 triads)
+    triads = [(unique // 1000 ** power % 1000).tolist() for power in range(7)]
+    policy = _numbers._long_number_policy
+    limit = None if policy is None else 10 ** policy[0]  # Values which are read digit by digit or in groups
+    words = np.array([_convert_digits(str(value), inflection) if limit is not None and value >= limit
+                      else _convert_triads(*triad, inflection=inflection) if any(triad)
+                      else _prefixes['1digit']['0']
+                      for value, triad in zip(unique.tolist(), zip(*triads))], dtype=object)
+    return words[inverse.ravel()].tolist()
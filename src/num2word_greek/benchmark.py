@@ -0,0 +1,419 @@
+# MIT License
+#
+# Copyright (c) [year] [fullname]
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+""" Benchmarks for the conversion functions. Run them with:
+        python -m num2word_greek.benchmark startup --budget-ms 10
+        python -m num2word_greek.benchmark io --size-mb 1024
+    The results are printed as JSON.
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+import sys
+import tempfile
+import time
+import timeit
+import tracemalloc
+
+
+_words = ["στις", "θα", "πάω", "στο", "σούπερ", "μάρκετ", "και", "αγοράσω", "κιλά", "κρέας", "γύρισα",
+          "συνολικά", "πλήρωσα", "ευρώ", "είναι", "η", "φορά", "που", "για", "ψώνια", "ο", "δρομέας",
+          "τερμάτισε", "σε", "λεπτά", "το", "σκορ", "ήταν", "στη", "σελίδα", "άρθρο", "παράγραφο", "με"]
+
+
+def _random_number(rng: random.Random) -> str:
+    kind = rng.random()
+    if kind < 0.6:
+        return str(rng.choice([rng.randint(0, 100), rng.randint(0, 10000), rng.randint(0, 10 ** 9)]))
+    if kind < 0.75:
+        return "{},{:02d}".format(rng.randint(0, 1000), rng.randint(0, 99))  # decimal
+    if kind < 0.9:
+        return "{}:{}".format(rng.randint(1, 12), rng.choice(["00", "15", "30", "45"]))  # hour
+    return "{}{}".format(rng.randint(1, 1999), rng.choice(["ος", "η", "ο"]))  # ordinal
+
+
+def generate_corpus(path: str, size_bytes: int, digit_density: float = 0.1, seed: int = 0) -> int:
+    """ Writes a reproducible synthetic greek transcript to `path`.
+        Args:
+            path: Where to write the corpus.
+            size_bytes: The (approximate) size of the file.
+            digit_density: The fraction of the words which are numbers (integers,
+                           decimals, hours or ordinals).
+            seed: The seed of the random generator (same seed -> same corpus).
+        Returns:
+            The number of lines that were written.
+    """
+    rng = random.Random(seed)
+    written = lines = 0
+    with open(path, "w", encoding="utf-8") as f:
+        while written < size_bytes:
+            words = [_random_number(rng) if rng.random() < digit_density else rng.choice(_words)
+                     for _ in range(rng.randint(3, 20))]
+            line = " ".join(words) + rng.choice([".", "", "?"]) + "\n"
+            f.write(line)
+            written += len(line.encode("utf-8"))
+            lines += 1
+    return lines
+
+
+def _timed(func, *args, **kwargs) -> float:
+    start = time.perf_counter()
+    func(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+def bench_io(size_mb: float = 1024, buffer_size: int = 1 << 20, workdir: str = None) -> dict:
+    """ Compares the "lines" (default) and "mmap" io modes of the file conversion on a
+        generated corpus of `size_mb` megabytes. For each mode it reports the time to
+        only read the lines of the file and the time to convert the whole file.
+    """
+    from num2word_greek.numbers2words import _convert_file_contents, _io_modes
+
+    with tempfile.TemporaryDirectory(dir=workdir) as tmp:
+        in_path, out_path = os.path.join(tmp, "corpus.txt"), os.path.join(tmp, "out.txt")
+        lines = generate_corpus(in_path, int(size_mb * (1 << 20)))
+        size = os.path.getsize(in_path)
+        results = {"size_bytes": size, "num_lines": lines}
+        for io_mode, buffering in (("lines", 1 << 16), ("mmap", buffer_size)):
+            read_time = _timed(lambda: sum(1 for _ in _io_modes[io_mode](in_path)))
+            convert_time = _timed(_convert_file_contents, in_path, out_path, io_mode=io_mode, buffer_size=buffering)
+            results[io_mode] = {
+                "buffer_size": buffering,
+                "read_seconds": round(read_time, 4),
+                "read_mb_per_second": round(size / (1 << 20) / read_time, 2),
+                "convert_seconds": round(convert_time, 4),
+                "convert_mb_per_second": round(size / (1 << 20) / convert_time, 2),
+            }
+    return results
+
+
+def _sentences(count: int, digit_density: float = 0.2, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    return [" ".join(_random_number(rng) if rng.random() < digit_density else rng.choice(_words)
+                     for _ in range(rng.randint(3, 20))) for _ in range(count)]
+
+
+def _latency_stats(latencies: list, elapsed: float) -> dict:
+    latencies = sorted(latencies)
+    return {
+        "requests_per_second": round(len(latencies) / elapsed, 1),
+        "latency_ms_p50": round(latencies[len(latencies) // 2] * 1000, 3),
+        "latency_ms_p99": round(latencies[int(len(latencies) * 0.99)] * 1000, 3),
+        "latency_ms_max": round(latencies[-1] * 1000, 3),
+    }
+
+
+def bench_async(concurrency: int = 100, requests: int = 5000, max_batch_size: int = 64, max_wait: float = 0.002) -> dict:
+    """ Load test of the asyncio interface: `concurrency` clients send `requests` sentences in
+        total. Compares one executor call per sentence with the micro-batching AsyncConverter.
+    """
+    import asyncio
+
+    from num2word_greek.aio import AsyncConverter
+    from num2word_greek.numbers2words import convert_sentence
+
+    sentences = _sentences(requests)
+
+    async def load(convert) -> dict:
+        queue = iter(sentences)
+        latencies = []
+
+        async def client():
+            for sentence in queue:
+                start = time.perf_counter()
+                await convert(sentence)
+                latencies.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(client() for _ in range(concurrency)))
+        return _latency_stats(latencies, time.perf_counter() - start)
+
+    async def run() -> dict:
+        loop = asyncio.get_running_loop()
+        results = {"concurrency": concurrency, "requests": requests}
+        results["unbatched"] = await load(lambda sentence: loop.run_in_executor(None, convert_sentence, sentence))
+        async with AsyncConverter(max_batch_size=max_batch_size, max_wait=max_wait) as converter:
+            results["batched"] = await load(converter.convert_sentence)
+        results["batched"].update(max_batch_size=max_batch_size, max_wait=max_wait)
+        return results
+
+    return asyncio.run(run())
+
+
+def _us_per_call(func, *args, number: int = 1000, repeat: int = 5) -> float:
+    # The best of `repeat` runs, in microseconds per call
+    timer = timeit.Timer(lambda: func(*args))
+    return round(min(timer.repeat(repeat=repeat, number=number)) / number * 1e6, 3)
+
+
+def bench_functions(number: int = 1000, repeat: int = 5) -> dict:
+    """ Times the word level conversion functions. convert_numbers is timed for every
+        digit length from 1 to 12 (e.g. "convert_numbers_7_digits_us").
+    """
+    from num2word_greek.convert_numbers import convert_numbers
+    from num2word_greek.utils import convert_ordinals, handle_commas, handle_hours
+
+    rng = random.Random(0)
+    results = {}
+    for length in range(1, 13):
+        numbers = [str(rng.randint(10 ** (length - 1), 10 ** length - 1)) for _ in range(100)]
+        per_batch = _us_per_call(lambda: [convert_numbers(n) for n in numbers], number=max(1, number // 100),
+                                 repeat=repeat)
+        results["convert_numbers_{}_digits_us".format(length)] = round(per_batch / 100, 3)
+    for name, func, words in (("convert_ordinals", convert_ordinals, ["2η", "10ος", "187ο", "1999οι", "λέξη"]),
+                              ("handle_commas", handle_commas, ["2,5", "187,50", "λέξη,", ",", "λέξη"]),
+                              ("handle_hours", handle_hours, ["10:15", "8:30", "3:45", "14:00", "λέξη"])):
+        results[name + "_us"] = round(_us_per_call(lambda: [func(w) for w in words], number=number,
+                                                   repeat=repeat) / len(words), 3)
+    return results
+
+
+def bench_sentences(densities: tuple = (0.0, 0.05, 0.2, 0.5), count: int = 1000, repeat: int = 5) -> dict:
+    """ Times convert_sentence (and tokens.convert_tokens, which also keeps the offsets of the
+        tokens) on synthetic transcripts with different fractions of numbers.
+    """
+    from num2word_greek.numbers2words import convert_sentence
+    from num2word_greek.tokens import convert_tokens
+
+    results = {}
+    for density in densities:
+        sentences = _sentences(count, digit_density=density)
+        per_batch = _us_per_call(lambda: [convert_sentence(s) for s in sentences], number=1, repeat=repeat)
+        results["convert_sentence_density_{}_us".format(density)] = round(per_batch / count, 3)
+        per_batch = _us_per_call(lambda: [convert_tokens(s) for s in sentences], number=1, repeat=repeat)
+        results["convert_tokens_density_{}_us".format(density)] = round(per_batch / count, 3)
+    return results
+
+
+def bench_rules(counts: tuple = (0, 10, 100, 500), count: int = 1000, repeat: int = 5) -> dict:
+    """ Times convert_sentence with many registered rules (which never match the synthetic
+        sentences) in order to show that the cost of the single scan stays (almost) flat.
+        For comparison, "separate_passes_<n>_us" applies the same rules one pass at a time.
+    """
+    from num2word_greek import rules
+    from num2word_greek.numbers2words import convert_sentence
+
+    sentences = _sentences(count, digit_density=0.2)
+    patterns = [r"(?<!\S)κανόνας{}(?!\S)", r"€{}(?!\d)"]  # Rules at the start of a word or at a symbol
+    results = {}
+    for rule_count in counts:
+        names = ["bench_rule_{}".format(index) for index in range(rule_count)]
+        try:
+            for index, name in enumerate(names):
+                rules.register_rule(name, patterns[index % 2].format(index), lambda match: " ")
+            per_batch = _us_per_call(lambda: [convert_sentence(s) for s in sentences], number=1, repeat=repeat)
+        finally:
+            for name in names:
+                rules.unregister_rule(name)
+        results["rules_{}_us".format(rule_count)] = round(per_batch / count, 3)
+        compiled = [re.compile(patterns[index % 2].format(index)) for index in range(rule_count)]
+
+        def separate_passes():
+            for sentence in sentences:
+                for pattern in compiled:
+                    sentence = pattern.sub(" ", sentence)
+                convert_sentence(sentence)
+        per_batch = _us_per_call(separate_passes, number=1, repeat=repeat)
+        results["separate_passes_{}_us".format(rule_count)] = round(per_batch / count, 3)
+    return results
+
+
+def _peak_memory(func, *args, **kwargs) -> int:
+    tracemalloc.start()
+    try:
+        func(*args, **kwargs)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def bench_files(size_mb: float = 20, files: int = 200, jobs: int = None, workdir: str = None) -> dict:
+    """ End to end throughput (and peak python memory, measured in a separate run with
+        tracemalloc) of the conversion of a single file and of a directory of `files` files.
+    """
+    from num2word_greek.numbers2words import _convert_file_contents, _convert_files
+
+    jobs = jobs or os.cpu_count() or 1
+    size_bytes = int(size_mb * (1 << 20))
+    results = {}
+    with tempfile.TemporaryDirectory(dir=workdir) as tmp:
+        in_path, out_path = os.path.join(tmp, "corpus.txt"), os.path.join(tmp, "out.txt")
+        generate_corpus(in_path, size_bytes)
+        elapsed = _timed(_convert_file_contents, in_path, out_path)
+        results["file_mb_per_second"] = round(size_mb / elapsed, 3)
+        results["file_peak_memory_bytes"] = _peak_memory(_convert_file_contents, in_path, out_path)
+
+        in_dir, out_dir = os.path.join(tmp, "in"), os.path.join(tmp, "out")
+        os.mkdir(in_dir)
+        os.mkdir(out_dir)
+        tasks = []
+        for i in range(files):
+            name = "{:06d}.txt".format(i)
+            generate_corpus(os.path.join(in_dir, name), size_bytes // files, seed=i)
+            tasks.append((os.path.join(in_dir, name), os.path.join(out_dir, name)))
+        elapsed = _timed(_convert_files, tasks, jobs=jobs)
+        results["directory_mb_per_second"] = round(size_mb / elapsed, 3)
+        results["directory_files_per_second"] = round(files / elapsed, 3)
+        results["directory_jobs"] = jobs
+        results["directory_peak_memory_bytes"] = _peak_memory(_convert_files, tasks, jobs=1)
+    return results
+
+
+# Modules which only the command line needs. Importing the library should not load them.
+_cli_modules = ("argparse", "glob", "tempfile", "shutil", "concurrent.futures", "multiprocessing", "logging")
+
+
+def bench_startup(runs: int = 20, module: str = "num2word_greek.numbers2words", budget_ms: float = None) -> dict:
+    """ Measures the import time of a module in fresh interpreters, using `python -X importtime`
+        (after a first run which writes the bytecode caches, like an installed package has).
+        Args:
+            runs: The number of interpreters to start.
+            module: The module to import.
+            budget_ms: If given, "over_budget" is True when the median import time exceeds it.
+        Returns:
+            The median and minimum cumulative import time of the module (in microseconds)
+            and the command line only modules (see _cli_modules) that it loaded.
+    """
+    import statistics
+    import subprocess
+
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    timings, loaded = [], set()
+    for run in range(runs + 1):
+        stderr = subprocess.run([sys.executable, "-X", "importtime", "-c", "import " + module], env=env,
+                                stderr=subprocess.PIPE, universal_newlines=True, check=True).stderr
+        imported = {}
+        for line in stderr.splitlines():
+            if line.startswith("import time:") and "|" in line and "self [us]" not in line:
+                _, cumulative, name = line[len("import time:"):].split("|")
+                imported[name.strip()] = int(cumulative)
+        if run > 0:  # The first run compiles the modules
+            timings.append(imported[module])
+        loaded.update(name for name in _cli_modules if name in imported)
+    results = {
+        "import_us": statistics.median(timings),
+        "import_min_us": min(timings),
+        "runs": runs,
+        "cli_modules": sorted(loaded),
+    }
+    if budget_ms is not None:
+        results["budget_ms"] = budget_ms
+        results["over_budget"] = results["import_us"] > budget_ms * 1000
+    return results
+
+
+def run_suite(quick: bool = False, workdir: str = None) -> dict:
+    """ Runs all the benchmarks of the suite (with smaller inputs if quick is True). """
+    import platform
+    from num2word_greek import __version__
+
+    return {
+        "meta": {"version": __version__, "python": platform.python_version(), "platform": platform.platform(),
+                 "cpus": os.cpu_count(), "quick": quick},
+        "functions": bench_functions(number=200 if quick else 1000, repeat=3 if quick else 5),
+        "sentences": bench_sentences(count=200 if quick else 1000, repeat=3 if quick else 5),
+        "rules": bench_rules(count=200 if quick else 1000, repeat=3 if quick else 5),
+        "files": bench_files(size_mb=2 if quick else 20, files=20 if quick else 200, workdir=workdir),
+        "startup": bench_startup(runs=5 if quick else 20),
+    }
+
+
+def compare(results: dict, baseline: dict, tolerance: float = 0.1) -> list:
+    """ Compares the timings of two suite runs.
+        Args:
+            results: The output of run_suite.
+            baseline: The output of an older run_suite (e.g. loaded from a stored JSON file).
+            tolerance: The relative change which is considered noise (0.1 -> 10%).
+        Returns:
+            A list of (name, baseline value, new value, relative change) for each metric that
+            got worse by more than the tolerance.
+    """
+    regressions = []
+    for group, metrics in results.items():
+        if group == "meta":
+            continue
+        for name, value in metrics.items():
+            old = baseline.get(group, {}).get(name)
+            if not old or isinstance(value, bool) or not (name.endswith("_us") or name.endswith("_per_second")):
+                continue
+            change = (value - old) / old
+            if name.endswith("_per_second"):
+                change = -change  # Lower throughput is worse
+            if change > tolerance:
+                regressions.append(("{}.{}".format(group, name), old, value, round(change, 3)))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks for num2word_greek (results are printed as JSON).")
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+    suite_parser = subparsers.add_parser("suite", help="Time every conversion stage.")
+    suite_parser.add_argument("--quick", action="store_true", help="Use smaller inputs.")
+    suite_parser.add_argument("--save", default=None, help="Also write the results to this JSON file.")
+    suite_parser.add_argument("--baseline", default=None,
+                              help="A JSON file of a previous run. Exits with 1 if anything got slower.")
+    suite_parser.add_argument("--tolerance", type=float, default=0.1,
+                              help="Relative slowdown (compared to --baseline) which is tolerated.")
+    suite_parser.add_argument("--workdir", default=None, help="Where to create the temporary files.")
+    startup_parser = subparsers.add_parser("startup", help="Time `import num2word_greek.numbers2words`.")
+    startup_parser.add_argument("--runs", type=int, default=20, help="Number of interpreters to start.")
+    startup_parser.add_argument("--module", default="num2word_greek.numbers2words", help="The module to import.")
+    startup_parser.add_argument("--budget-ms", type=float, default=10.0,
+                                help="Exits with 1 if the median import time is larger.")
+    io_parser = subparsers.add_parser("io", help="Compare the io modes of the file conversion.")
+    io_parser.add_argument("--size-mb", type=float, default=1024, help="Size of the generated corpus.")
+    io_parser.add_argument("--buffer-size", type=int, default=1 << 20, help="Write buffer of the mmap mode.")
+    io_parser.add_argument("--workdir", default=None, help="Where to create the temporary files.")
+    async_parser = subparsers.add_parser("async", help="Load test of the asyncio interface.")
+    async_parser.add_argument("--concurrency", type=int, default=100, help="Number of concurrent clients.")
+    async_parser.add_argument("--requests", type=int, default=5000, help="Total number of sentences.")
+    async_parser.add_argument("--max-batch-size", type=int, default=64)
+    async_parser.add_argument("--max-wait", type=float, default=0.002, help="In seconds.")
+    args = parser.parse_args(argv)
+    if args.benchmark == "suite":
+        results = run_suite(args.quick, args.workdir)
+        if args.save is not None:
+            with open(args.save, "w", encoding="utf-8") as f:
+                json.dump(results, f, indent=2, ensure_ascii=False)
+        if args.baseline is not None:
+            with open(args.baseline, "r", encoding="utf-8") as f:
+                regressions = compare(results, json.load(f), args.tolerance)
+            results["regressions"] = [dict(zip(("name", "baseline", "value", "change"), regression))
+                                      for regression in regressions]
+    elif args.benchmark == "startup":
+        results = bench_startup(args.runs, args.module, args.budget_ms)
+    elif args.benchmark == "io":
+        results = bench_io(args.size_mb, args.buffer_size, args.workdir)
+    elif args.benchmark == "async":
+        results = bench_async(args.concurrency, args.requests, args.max_batch_size, args.max_wait)
+    print(json.dumps(results, indent=2, ensure_ascii=False))
+    if results.get("regressions") or results.get("over_budget"):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
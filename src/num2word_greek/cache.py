@@ -0,0 +1,142 @@
+# MIT License
+#
+# Copyright (c) [year] [fullname]
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+""" Opt-in memoization of the word level conversions (convert_numbers, convert_ordinals
+    and handle_hours). The cache is disabled by default. Use it like:
+        from num2word_greek import cache
+        cache.enable_cache(maxsize=10000)
+        ...
+        print(cache.cache_info().hit_rate)
+"""
+
+from collections import OrderedDict, namedtuple
+import functools
+import threading
+
+
+class CacheInfo(namedtuple("CacheInfo", ["hits", "misses", "evictions", "maxsize", "currsize"])):
+    __slots__ = ()
+
+    @property
+    def hit_rate(self) -> float:
+        """ The fraction of lookups that were found in the cache (0 if there were no lookups). """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class LRUCache:
+    """ A thread safe, bounded mapping which evicts the least recently used entry
+        when it is full.
+        Args:
+            maxsize: The maximum number of entries that the cache will hold.
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        if maxsize < 1:
+            raise ValueError("The maximum size of the cache must be positive, got {}.".format(maxsize))
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = self._misses = self._evictions = 0
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self._misses += 1
+                return default
+            self._data.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._evictions, self.maxsize, len(self._data))
+
+
+_cache = None
+_missing = object()
+
+
+def enable_cache(maxsize: int = 4096):
+    """ Starts memoizing the results of convert_numbers, convert_ordinals and handle_hours.
+        Calling it again replaces the current cache (and its statistics) with an empty one.
+        Args:
+            maxsize: The maximum number of results to keep (shared between the functions).
+    """
+    global _cache
+    _cache = LRUCache(maxsize)
+
+
+def disable_cache():
+    """ Stops memoizing and drops the cached results. """
+    global _cache
+    _cache = None
+
+
+def cache_info() -> CacheInfo:
+    """ Returns the hits, misses, evictions and size of the cache (all zeros if it is disabled). """
+    cache = _cache
+    if cache is None:
+        return CacheInfo(0, 0, 0, 0, 0)
+    return cache.info()
+
+
+def cache_clear():
+    """ Empties the cache and resets its statistics, keeping it enabled. """
+    cache = _cache
+    if cache is not None:
+        cache.clear()
+
+
+def cached(func):
+    """ Decorator for functions of a single string argument. Their results will be
+        memoized while the cache is enabled. Exceptions are never cached.
+    """
+    name = func.__name__
+
+    @functools.wraps(func)
+    def wrapper(word, *args, **kwargs):
+        cache = _cache
+        if cache is None or args or kwargs:
+            return func(word, *args, **kwargs)
+        key = (name, word)
+        out = cache.get(key, _missing)
+        if out is _missing:
+            out = func(word)
+            cache.put(key, out)
+        return out
+    return wrapper
@@ -0,0 +1,84 @@
+# MIT License
+#
+# Copyright (c) [year] [fullname]
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+""" Compressed files (gzip, bz2 and xz, with the standard library). They are decompressed and
+    compressed while they are read and written, so a compressed file is converted in a single
+    pass without a decompressed copy on disk.
+"""
+
+import io
+import os
+
+
+# The compression of each extension
+EXTENSIONS = {".gz": "gzip", ".bz2": "bz2", ".xz": "xz"}
+COMPRESSIONS = ("gzip", "bz2", "xz")
+
+
+def detect_compression(filepath: str):
+    """ Returns the compression of a file based on its extension (None if it is not compressed). """
+    return EXTENSIONS.get(os.path.splitext(filepath)[1].lower())
+
+
+def resolve_compression(filepath: str, compression: str = "auto"):
+    """ Returns the compression to use for a file.
+        Args:
+            filepath: The path of the file.
+            compression: "auto" (use the extension of the file), None (not compressed)
+                         or one of "gzip", "bz2" and "xz".
+        Raises:
+            ValueError: If the compression is not known.
+    """
+    if compression == "auto":
+        return detect_compression(filepath)
+    if compression is not None and compression not in COMPRESSIONS:
+        raise ValueError("Unknown compression: {}. Use one of auto, {}.".format(compression, ", ".join(COMPRESSIONS)))
+    return compression
+
+
+def open_text(filepath: str, mode: str, compression: str, level: int = None, buffer_size: int = 1 << 16,
+              newline: str = None):
+    """ Opens a compressed file as a utf-8 text file.
+        Args:
+            filepath: The path of the file.
+            mode: "r" or "w".
+            compression: One of "gzip", "bz2" and "xz".
+            level: The compression level (gzip and bz2: 1-9, xz: 0-9). None uses the default of
+                   each format. Only used for writing.
+            buffer_size: The size (in bytes) of the buffer between the (de)compressor and the text.
+            newline: How the line endings are translated (like the newline argument of open).
+        Returns:
+            An open text file.
+    """
+    if compression == "gzip":
+        import gzip
+        binary = gzip.GzipFile(filepath, mode + "b", compresslevel=9 if level is None else level)
+    elif compression == "bz2":
+        import bz2
+        binary = bz2.BZ2File(filepath, mode + "b", compresslevel=9 if level is None else level)
+    elif compression == "xz":
+        import lzma
+        binary = lzma.LZMAFile(filepath, mode + "b", preset=level if mode == "w" else None)
+    else:
+        raise ValueError("Unknown compression: {}. Use one of {}.".format(compression, ", ".join(COMPRESSIONS)))
+    buffered = io.BufferedReader(binary, buffer_size) if mode == "r" else io.BufferedWriter(binary, buffer_size)
+    return io.TextIOWrapper(buffered, encoding="utf-8", newline=newline)
@@ -21,260 +21,180 @@
 # SOFTWARE.
 
 
-from num2word_greek.prefixes import _prefixes
-import re
+from num2word_greek.cache import cache_clear, cached
+from num2word_greek.prefixes import _prefixes, _scale_words, get_inflection, get_triad_table
 
 
-to_plural = lambda word: re.sub("ερα", "ερις", re.sub("τρία", "τρείς", word))  # for 13 and 14 special cases in plural
-
-
-def convert_numbers(word: str) -> str:
+@cached
+def convert_numbers(word: str, gender: str = "neuter", case: str = "nominative") -> str:
     """ Given a string as input, the function will return its transliteration if
         the string can be transformed to a digit. Otherwise, it will return the
         same word.
         Args:
-            word: A string containing an integer (not decimals allowed).
+            word: A string containing an integer (not decimals allowed) of any length.
+                  Integers with more digits than set by set_long_number_policy are read
+                  digit by digit or in groups (by default all of them are read as numbers).
+            gender: The gender of the noun that follows the number. One of "masculine",
+                    "feminine" or "neuter" (the default), e.g. "3" -> "τρεις" for "masculine".
+            case: The case of the noun that follows the number. One of "nominative" (the
+                  default), "genitive" or "accusative", e.g. "201" -> "διακοσίων ενός" for
+                  "genitive". The words of each form are precomputed tables, see get_inflection.
         Returns:
             The transliteration of the integer if an integer is provided.
             Otherwise, it will return the same word.
             If the word has spaces on its sides then they will be stripped.
         Raises:
-            ValueError: If the input word is an integer of more than 13 digits.
+            ValueError: If the word contains non ascii digits (e.g. "١٢") or the gender
+                        or the case is unknown.
     """
+    inflection = None if gender == "neuter" and case == "nominative" else get_inflection(gender, case)
     word = word.strip()
     if not word.isdigit():
         return word
-    else:
-        if len(word) == 1:
-            return _convert_1digit(word)
-        elif len(word) == 2:
-            return _convert_2digit(word)
-        elif len(word) == 3:
-            return _convert_3digit(word)
-        elif len(word) == 4:
-            return _convert_4digit(word)
-        elif len(word) == 5:
-            return _convert_5digit(word)
-        elif len(word) == 6:
-            return _convert_6digit(word)
-        elif 7 <= len(word) <= 9:  # from 1 million to 999999999
-            return _convert_more_than7_less_than10_digits(word)
-        elif 10 <= len(word) <= 12:  # from 1 billion to 999 999 999 999
-            return _convert_more_than10_less_than13_digits(word)
-        else:
-            raise ValueError("We only accept integers of maximum 13 digits")
-
-
-def _check_input(number: str, length: int, operator: str = None):
-    """ This function checks the validity of the inputs.
-        Args:
-            number: The number which we want to check (must be a string)
-            length: The length of the number (how many digits it is allowed to have)
-            operator: There are 3 choices:
-                      1. None (default): Then there must be as many digits as the length argument (equation)
-                      2. greater_equal (or ge): Then there must be at list *length* digits in the number
-                      3. less_equal (or le): Then there must be at most *length* digits in the number
-    """
-    # Check input
-    assert isinstance(number, str), "Input must be as string."
-    if operator in ["greater_equal", "ge"]:
-        assert len(number) >= length, "The digit must contain more than " + str(length) + " digits."
-    elif operator in ["less_equal", "le"]:
-        assert len(number) <= length, "The digit must contain less than " + str(length) + " digits."
-    else:
-        assert len(number) == length, "The digit must contain " + str(length) + " digits."
-
-
-def _special_case(number: str) -> str:
-    # Special case
-    temp_num = number
-    for index, sub_digit in enumerate(number):
-        if sub_digit == "0":
-            temp_num = number[index + 1:]
-        else:
-            break
-    return temp_num
-
-
-def _convert_1digit(number: str) -> str:
-    _check_input(number, 1)
-    if number not in _prefixes['1digit'].keys():
-        raise ValueError("Digit", number, "is not a valid number.")
-    out = _prefixes['1digit'][number]
-    return out
-
-
-def _convert_2digit(number: str) -> str:
-    _check_input(number, 2)
-    if number in _prefixes['2digit'].keys():  # so if it is 10 then return 'δέκα' (same for 11, 12 , 20, ..., 90)
-        return _prefixes['2digit'][number]
-    first_digit = number[0]  # e.g. from 15 keep only 1
-    number = _special_case(number)
-    if len(number) == 1:
-        return _convert_1digit(number)  # If we had something like 01 then return the word for 1
-    elif len(number) == 0:
-        return ""  # If we had 00 then return nothing
-    # Make sure that the 1st digit exists in the dictionary
-    if first_digit not in _prefixes['2digit'].keys():
-        raise ValueError("Invalid start:", first_digit, ". Occurred while converting the 2 digit number, ", number)
-    # Return the 2 digit start and then call the _convert_1digit to convert the second number
-    # E.g. 13 will become "δεκα" + "τρία" = "δεκατρία"
-    out = _prefixes['2digit'][first_digit] + _convert_1digit(number[1])
-    return out.strip()
-
-
-def _convert_3digit(number: str) -> str:
-    _check_input(number, 3)
-    if number in _prefixes['3digit'].keys():  # E.g. if we have 300 then just return "τριακόσια"
-        return _prefixes['3digit'][number]
-    number = _special_case(number)
-    if len(number) == 2:
-        return _convert_2digit(number)  # If we had something like 012 then return the word for 12
-    elif len(number) == 1:
-        return _convert_1digit(number)  # If we had something like 001 then return the word for 1
-    elif len(number) == 0:
-        return ""  # If we had 00 then return nothing
-    first_digit = number[0]  # e.g. from 387 keep 3
-    # if first_digit == "0":
-    #     return ""
-    if first_digit not in _prefixes['3digit'].keys():
-        raise ValueError("Invalid start:", first_digit, ". Occurred while converting the 3 digit number, ", number)
-    # Return the 3 digit prefix and then the 2 digit prefix
-    # E.g. for 387 return "τριακοσια" + " " + "ογδονταεφτά" = "τριακόσια ογδονταεφτά"
-    out = _prefixes['3digit'][first_digit] + " " + _convert_2digit(number[1:])
-    return out.strip()
+    # The only validation step. Everything below works on plain integer triads.
+    if not word.isascii():
+        raise ValueError("Digit", word, "is not a valid number.")
+    return _convert_digits(word, inflection)
 
 
-def _convert_4digit(number: str) -> str:
-    _check_input(number, 4)
-    if number in _prefixes['4digit'].keys():  # E.g. if we have 7000 then just return "εφτά χιλιάδες"
-        return _prefixes['4digit'][number]
-    first_digit = number[0]  # e.g. from 7879 keep 7
-    number = _special_case(number)
-    if len(number) == 3:
-        return _convert_3digit(number)  # If we had something like 0112 then return the word for 112
-    elif len(number) == 2:
-        return _convert_2digit(number)  # If we had something like 0012 then return the word for 12
-    elif len(number) == 1:
-        return _convert_1digit(number)  # If we had something like 0001 then return the word for 1
-    elif len(number) == 0:
-        return ""  # If we had 00 then return nothing
-    # if first_digit == "0":
-    #     return ""
-    if first_digit not in _prefixes['4digit'].keys():
-        raise ValueError("Invalid start:", first_digit, ". Occurred while converting the 4 digit number, ", number)
-    # Return the 4 digit prefix and then the 4 digit prefix
-    # E.g. for 7879 return "εφτά χιλιάδες" + " " + "οχτακόσια εβδομηνταεννιά" = "εφτά χιλιάδες οχτακόσια εβδομηνταεννιά"
-    out = _prefixes['4digit'][first_digit] + " " + _convert_3digit(number[1:])
-    return out.strip()
+# ------------------------------------ LONG NUMBERS ------------------------------------
+# How to read integers with too many digits to be read as a number (e.g. phone numbers or IDs).
+# None means that every integer is read as a number, otherwise it is (max_digits, read_as, group_size).
+_long_number_policy = None
+_read_as_options = ("digits", "groups")
 
 
-def _convert_5digit(number: str) -> str:
-    _check_input(number, 5)
-    if number in _prefixes['5digit'].keys():  # E.g. if we have 40000 then just return "σαράντα χιλιάδες"
-        return _prefixes['5digit'][number]
-    # Special case
-    number = _special_case(number)
-    if len(number) == 4:
-        return _convert_4digit(number)  # If we had something like 01112 then return the word for 1112
-    if len(number) == 3:
-        return _convert_3digit(number)  # If we had something like 00112 then return the word for 112
-    elif len(number) == 2:
-        return _convert_2digit(number)  # If we had something like 00012 then return the word for 12
-    elif len(number) == 1:
-        return _convert_1digit(number)  # If we had something like 00001 then return the word for 1
-    elif len(number) == 0:
-        return ""  # If we had 00 then return nothing
-    # At first find the 2 digit prefix -> e.g. from 89898 get the word for 89
-    # Special case 13 and 14 where there needs to be a certain plural form (δεκατρείς χιλιάδες instead of δεκατρία).
-    # Then append the word "χιλιάδες"
-    # Then append the 3 digit leftover from _convert_3digit -> e.g. from 78123 get the word for 123
-    out = to_plural(_convert_2digit(number[:2])) + " χιλιάδες " + _convert_3digit(number[2:])
-    return out.strip()
-
-
-def _convert_6digit(number: str) -> str:
-    _check_input(number, 6)
-    if number in _prefixes['6digit'].keys():  # E.g. if we have 400000 then just return "σαράντα χιλιάδες"
-        return _prefixes['6digit'][number]
-    number = _special_case(number)
-    if len(number) == 5:
-        return _convert_5digit(number)  # If we had something like 012112 then return the word for 12112
-    if len(number) == 4:
-        return _convert_4digit(number)  # If we had something like 001112 then return the word for 1112
-    if len(number) == 3:
-        return _convert_3digit(number)  # If we had something like 000112 then return the word for 112
-    elif len(number) == 2:
-        return _convert_2digit(number)  # If we had something like 000012 then return the word for 12
-    elif len(number) == 1:
-        return _convert_1digit(number)  # If we had something like 000001 then return the word for 1
-    elif len(number) == 0:
-        return ""  # If we had 00 then return nothing
-    # Steps:
-    # 1. Check if the number is in the form 000000 (can happen). If so then return nothing
-    # 2. At first find the 3 digit prefix -> e.g. from 131789 get the word for 131
-    # 3. Special case *13 and *14 where there needs to be a certain plural form (δεκατρείς χιλιάδες instead of δεκατρία)
-    # 4. Then append the word "χιλιάδες"
-    # 5. Then append the 3 digit leftover from _convert_3digit -> e.g. from 131789 get the word for 789
-    last_3_digits = _convert_3digit(number[3:])
-    if number[:3] == "000":
-        return last_3_digits  # e.g. if input is 000183 return εκατόν ογδοντατρία
-    first_3_digits = to_plural(_convert_3digit(number[:3]))
-    out = first_3_digits + " χιλιάδες " + last_3_digits
-    return out.strip()
+def set_long_number_policy(max_digits: int = None, read_as: str = "digits", group_size: int = 3):
+    """ Sets how integers with more than max_digits digits are read (by convert_numbers,
+        convert_sentence and convert_numbers_batch).
+        Args:
+            max_digits: The maximum number of digits of an integer which is read as a number.
+                        Use None (the default) in order to read every integer as a number,
+                        e.g. "1000000000000" -> "ένα τρισεκατομμύριο".
+            read_as: How to read the longer integers. One of:
+                     1. "digits": one digit at a time, e.g. "6912" -> "έξι εννιά ένα δύο".
+                     2. "groups": in groups of group_size digits, e.g. "6912" -> "εξήντα εννιά δώδεκα"
+                        (for group_size=2). Leading zeros of a group are read as "μηδέν".
+            group_size: The number of digits of each group (for read_as="groups").
+        Raises:
+            ValueError: If read_as is unknown or max_digits/group_size are not positive.
+    """
+    global _long_number_policy
+    if read_as not in _read_as_options:
+        raise ValueError("Unknown read_as: {}. Use one of {}.".format(read_as, ", ".join(_read_as_options)))
+    if (max_digits is not None and max_digits < 1) or group_size < 1:
+        raise ValueError("max_digits and group_size must be positive, got {} and {}.".format(
+            max_digits, group_size))
+    _long_number_policy = None if max_digits is None else (max_digits, read_as, group_size)
+    cache_clear()  # The cached words may have been computed with the previous policy
+
+
+def _convert_digits(number: str, inflection=None) -> str:
+    """ Converts a string of ascii digits to words, taking the long number policy into account.
+        The numbers (but not the digits or the groups) agree with the inflection, if given.
+    """
+    policy = _long_number_policy
+    if policy is None or len(number) <= policy[0]:
+        return _convert_integer(number, inflection)
+    _, read_as, group_size = policy
+    if read_as == "digits":
+        return " ".join(_prefixes['1digit'][digit] for digit in number)
+    groups = (number[start:start + group_size] for start in range(0, len(number), group_size))
+    return " ".join(_read_group(group) for group in groups)
+
+
+def _read_group(group: str) -> str:
+    # E.g. "05" -> "μηδέν πέντε", "00" -> "μηδέν μηδέν" and "45" -> "σαράντα πέντε"
+    digits = group.lstrip("0")
+    zeros = [_prefixes['1digit']['0']] * (len(group) - len(digits))
+    return " ".join(zeros + [_convert_integer(digits)] if digits else zeros)
+
+
+def _split_triads(number: str) -> list:
+    """ Splits a string of digits into groups of three digits (as integers), starting
+        from the least significant group. E.g. "1234567" -> [567, 234, 1]
+    """
+    triads = []
+    end = len(number)
+    while end > 0:
+        start = max(end - 3, 0)
+        triads.append(int(number[start:end]))
+        end = start
+    return triads
 
 
-def _convert_more_than7_less_than10_digits(number: str) -> str:
-    # From 1000000 (1 million) to 1000000000 (1 billion)
-    _check_input(number, 7, operator="greater_equal")
-    _check_input(number, 9, operator="less_equal")
-    # There is one special case since 1000000 (1 million) wants singular form
-    if len(number) == 7 and number[0] == "1":
-        out = "ένα εκατομμύριο " + _convert_6digit(number[1:])
-        return out
-    # --------------------------------- SPECIAL CASE ----------------------------------
-    # Special case: if called from a larger number then there is a possibility to have all zeroes
-    # E.g. for 3 billion we are going to have a 3 and 9 zeroes after that. We don't want to append "εκκατομυριο" to that
-    number = _special_case(number)
-    # number = re.sub("0", "", temp_num)
-    if len(number) == 6:
-        out = _convert_6digit(number)
-    elif len(number) == 5:
-        out = _convert_5digit(number)
-    elif len(number) == 4:
-        out = _convert_4digit(number)
-    elif len(number) == 3:
-        out = _convert_3digit(number)
-    elif len(number) == 2:
-        out = _convert_2digit(number)
-    elif len(number) == 1:
-        out = _convert_1digit(number)
-    elif len(number) == 0:
-        return ""
-    # --------------------------------- END SPECIAL CASE ----------------------------------
+def _convert_integer(number: str, inflection=None) -> str:
+    """ Converts a string of ascii digits (of any length) to words, one triad at a time.
+        Args:
+            number: The digits to convert. Leading zeros are ignored.
+            inflection: The tables of the gender and the case of the words (see get_inflection).
+                        None for the default (neuter and nominative) form.
+        Returns:
+            The greek words for the number. A single "0" becomes "μηδέν" while
+            a string with more than one zeros (e.g. "000") becomes the empty string.
+    """
+    if len(number) <= 3 and int(number):
+        # The most common case, a single triad
+        return (inflection.units if inflection else get_triad_table("neuter"))[int(number)]
+    triads = _split_triads(number)
+    if not any(triads):
+        return _prefixes['1digit']['0'] if len(number) == 1 else ""
+    return _convert_triads(*triads, inflection=inflection)
 
-    if len(number) == 7:
-        out = _convert_1digit(number[0]) + " εκατομμύρια " + _convert_6digit(number[1:])
-    elif len(number) == 8:
-        out = _convert_2digit(number[:2]) + " εκατομμύρια " + _convert_6digit(number[2:])
-    elif len(number) == 9:
-        out = _convert_3digit(number[:3]) + " εκατομμύρια " + _convert_6digit(number[3:])
-    return out.strip()
 
+# Numbers are read in blocks of 11 triads (up to 10^33 - 1, the largest scale word is 10^33)
+_block_size = len(_scale_words) + 1
 
-def _convert_more_than10_less_than13_digits(number: str) -> str:
-    # From 1 billion to 1 trillion
-    _check_input(number, 10, operator="greater_equal")
-    _check_input(number, 12, operator="less_equal")
-    # There is one special case since 1000000 (1 million) wants singular form
-    if len(number) == 10 and number[0] == "1":
-        out = "ένα δισεκατομμύριο " + _convert_more_than7_less_than10_digits(number[1:])
-        return out
-    if len(number) == 10:
-        out = _convert_1digit(number[0]) + " δισεκατομμύρια " + _convert_more_than7_less_than10_digits(number[1:])
-    elif len(number) == 11:
-        out = _convert_2digit(number[:2]) + " δισεκατομμύρια " + _convert_more_than7_less_than10_digits(number[2:])
-    elif len(number) == 12:
-        out = _convert_3digit(number[:3]) + " δισεκατομμύρια " + _convert_more_than7_less_than10_digits(number[3:])
-    return out.strip()
 
+def _convert_triads(*triads: int, inflection=None) -> str:
+    """ Joins the words of each (non zero) triad of a number with the corresponding
+        scale words. E.g. (3, 0, 1, 0) -> "ένα εκατομμύριο τρία"
+        Args:
+            triads: The triads of the number, starting from the least significant one.
+            inflection: The tables of the gender and the case of the words (see get_inflection).
+                        None for the default (neuter and nominative) form.
+        Returns:
+            The words of the number (the empty string if all the triads are zero).
+    """
+    if inflection is None:
+        inflection = get_inflection()
+    if len(triads) <= _block_size:
+        return _convert_block(triads, inflection)
+    # Larger numbers are read as nested multiples of the largest scale word, e.g. 10^36 is
+    #  "χίλια δεκάκις εκατομμύρια" and 10^66 is "ένα δεκάκις εκατομμύριο δεκάκις εκατομμύρια".
+    #  Each triad is converted once, so the time is linear in the number of digits.
+    # Only the last block agrees with the noun, the others are multiples of a (neuter) scale word.
+    multiplier = get_inflection("neuter", inflection.case)
+    out = []
+    higher = 0  # What the blocks read so far amount to: 0 (zero), 1 (exactly one) or 2 (more)
+    for index in range((len(triads) - 1) // _block_size, -1, -1):
+        block = triads[index * _block_size:(index + 1) * _block_size]
+        if higher:
+            out.append(inflection.scales[-1][0 if higher == 1 else 1])
+        words = _convert_block(block, inflection if index == 0 else multiplier)
+        if words:
+            out.append(words)
+        if higher or words:
+            higher = 1 if not higher and block[0] == 1 and not any(block[1:]) else 2
+    return " ".join(out)
+
+
+def _convert_block(triads, inflection) -> str:
+    # Words for (at most _block_size) triads, starting from the least significant one
+    multipliers = inflection.multipliers
+    scales = inflection.scales
+    out = []
+    for index in range(len(triads) - 1, 1, -1):
+        triad = triads[index]
+        if triad:
+            # E.g. for 3 billion we are going to have "τρία δισεκατομμύρια" (singular only for 1 billion)
+            singular, plural = scales[index - 2]
+            out.append(inflection.one + " " + singular if triad == 1 else multipliers[triad] + " " + plural)
+    thousands = triads[1] if len(triads) > 1 else 0
+    if thousands:
+        # The thousands must agree with "χιλιάδες" (e.g. δεκατρείς χιλιάδες instead of δεκατρία).
+        out.append(inflection.one_thousand if thousands == 1
+                   else inflection.thousands_multipliers[thousands] + " " + inflection.thousands)
+    if triads[0]:
+        out.append(inflection.units[triads[0]])
+    return " ".join(out)
@@ -0,0 +1,104 @@
+# MIT License
+#
+# Copyright (c) [year] [fullname]
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+""" Finds the files of a corpus (e.g. nested speaker/session directories with millions of
+    transcripts) with os.scandir. The paths are yielded as soon as they are found, so that
+    their conversion starts before the whole tree is searched.
+"""
+
+import fnmatch
+import os
+import re
+
+
+def find_files(root: str, include=("*",), exclude=(), recursive: bool = True, onerror=None):
+    """ Lazily finds the files under root which match any of the include patterns and none of
+        the exclude ones.
+        Args:
+            root: The directory to search.
+            include: Glob patterns of the files to find (e.g. "*.txt"). Patterns without a "/"
+                     match the name of a file (at any depth), the rest match its path relative
+                     to root with "/" as separator (e.g. "spk*/*.lab"). A leading "/" anchors a
+                     pattern to root (e.g. "/*.txt" only matches the files of root itself).
+                     Like fnmatch, "*" also matches "/".
+            exclude: Glob patterns (as above) of the files and the directories to skip. The
+                     directories which match are not searched at all.
+            recursive: Whether to search the subdirectories.
+            onerror: Called with the OSError if a directory cannot be read (like os.walk).
+                     By default the directory is skipped.
+        Returns:
+            A generator of the paths of the files, relative to root. The entries of each
+            directory are sorted by name and the files of a directory come before the files
+            of its subdirectories.
+    """
+    included, excluded = _compile(include), _compile(exclude)
+    stack = [(root, "")]
+    while stack:
+        directory, prefix = stack.pop()
+        files, subdirectories = _select(_scandir(directory, onerror), prefix, included, excluded, recursive)
+        yield from files
+        stack.extend(reversed(subdirectories))
+
+
+def _scandir(directory: str, onerror) -> list:
+    # The entries of a directory, sorted by name (none if it cannot be read)
+    try:
+        with os.scandir(directory) as it:
+            return sorted(it, key=lambda entry: entry.name)
+    except OSError as e:
+        if onerror is not None:
+            onerror(e)
+        return []
+
+
+def _select(entries: list, prefix: str, included: tuple, excluded: tuple, recursive: bool) -> tuple:
+    # The (relative) paths of the matching files of a directory and the (path, prefix) pairs of
+    #  its subdirectories which must be searched
+    files = []
+    subdirectories = []
+    for entry in entries:
+        path = prefix + entry.name
+        if _matches(excluded, entry.name, path):
+            continue
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                if recursive:
+                    subdirectories.append((entry.path, path + "/"))
+            elif entry.is_file() and _matches(included, entry.name, path):
+                files.append(path if os.sep == "/" else path.replace("/", os.sep))
+        except OSError:
+            continue  # E.g. removed while searching
+    return files, subdirectories
+
+
+def _compile(patterns) -> tuple:
+    # A single regular expression for the patterns of the names and one for the patterns of the paths
+    names = [pattern for pattern in patterns if "/" not in pattern]
+    paths = [pattern[1:] if pattern.startswith("/") else pattern for pattern in patterns if "/" in pattern]
+    return tuple(re.compile("|".join(fnmatch.translate(pattern) for pattern in group)).match if group else None
+                 for group in (names, paths))
+
+
+def _matches(matchers: tuple, name: str, path: str) -> bool:
+    match_name, match_path = matchers
+    return ((match_name is not None and match_name(name) is not None)
+            or (match_path is not None and match_path(path) is not None))
@@ -0,0 +1,98 @@
+# MIT License
+#
+# Copyright (c) [year] [fullname]
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+""" Error policies of the line based conversions (convert_lines, convert_stream, the file
+    functions and the command line). A line which cannot be converted either:
+        - "fail": raises the exception (the default).
+        - "skip_line": is written unchanged.
+        - "keep_token": is converted, except for the tokens which failed (which are kept as they are).
+    The failures are collected in an ErrorReport, which may be written as JSON lines, e.g.
+        {"file": "a.txt", "line": 12, "token": "12345678901234", "error": "ValueError", "message": "..."}
+"""
+
+import json
+from collections import namedtuple
+
+
+ERROR_POLICIES = ("fail", "skip_line", "keep_token")
+
+# A single failure. The line numbers start from 1. The file, the line and the token are None if they are
+#  not known (e.g. a file which could not be read at all).
+ErrorRecord = namedtuple("ErrorRecord", ["file", "line", "token", "error", "message"])
+
+
+def check_error_policy(errors: str):
+    if errors not in ERROR_POLICIES:
+        raise ValueError("Unknown error policy: {}. Use one of {}.".format(errors, ", ".join(ERROR_POLICIES)))
+
+
+class ErrorReport:
+    """ Collects the failures of a conversion.
+        Args:
+            dst: Where to write each failure (as a JSON line) as soon as it happens, e.g. an open
+                 file. If None, the failures are kept in `records`.
+    """
+
+    def __init__(self, dst=None):
+        self.dst = dst
+        self.records = []
+        self.count = 0
+        # The exception which caused the last failures. It is raised afterwards (with the "fail"
+        #  policy) and it must not be recorded again.
+        self.last_exception = None
+        self._owned = False  # Whether dst was opened by the report
+
+    @classmethod
+    def open(cls, filepath: str):
+        """ Creates a report which writes to filepath (use it as a context manager, or close it). """
+        report = cls(open(filepath, "w", encoding="utf-8"))
+        report._owned = True
+        return report
+
+    def close(self):
+        if self._owned:
+            self.dst.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def add(self, file, line, token, exception: BaseException):
+        """ Records a failure. """
+        self.add_record(ErrorRecord(file, line, token, type(exception).__name__, str(exception)))
+
+    def add_record(self, record: ErrorRecord):
+        self.count += 1
+        if self.dst is None:
+            self.records.append(record)
+        else:
+            self.dst.write(json.dumps(record._asdict(), ensure_ascii=False) + "\n")
+
+    def write(self, dst):
+        """ Writes the kept failures as JSON lines. """
+        for record in self.records:
+            dst.write(json.dumps(record._asdict(), ensure_ascii=False) + "\n")
+
+    def __len__(self) -> int:
+        return self.count
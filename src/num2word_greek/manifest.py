@@ -0,0 +1,113 @@
+# MIT License
+#
+# Copyright (c) [year] [fullname]
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import hashlib
+import json
+import os
+from tempfile import mkstemp
+
+from num2word_greek import __version__
+
+
+def file_sha256(filepath: str, block_size: int = 1 << 20) -> str:
+    sha = hashlib.sha256()
+    with open(filepath, "rb") as f:
+        block = f.read(block_size)
+        while block:
+            sha.update(block)
+            block = f.read(block_size)
+    return sha.hexdigest()
+
+
+def options_fingerprint(options: dict) -> str:
+    """ Returns a hash of the conversion options (a dict of JSON serializable values). """
+    return hashlib.sha256(json.dumps(options, sort_keys=True, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+class Manifest:
+    """ Remembers the size, modification time and content hash of each converted file,
+        together with the version of the package and the options that converted it. It is
+        stored as JSON inside the output directory and is used in order to skip the files
+        that have not changed since the previous run.
+        Args:
+            directory: The output directory (where the manifest is stored).
+            version: The version of the converter. A manifest which was written by
+                     another version is ignored, so everything will be converted again.
+            options: The conversion options (e.g. the format and the number separators). A manifest
+                     which was written with other options is also ignored.
+    """
+    filename = ".num2word_manifest.json"
+
+    def __init__(self, directory: str, version: str = __version__, options: dict = None):
+        self.path = os.path.join(directory, self.filename)
+        self.version = version
+        self.options = options_fingerprint(options or {})
+        self.files = {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            data = {}  # Missing or corrupted manifest: convert everything
+        if isinstance(data, dict) and data.get("version") == version and data.get("options") == self.options:
+            self.files = data.get("files", {})
+
+    def is_unchanged(self, key: str, filepath: str, out_path: str) -> bool:
+        """ Checks whether the file was converted (by this version) and has not changed since.
+            The contents are only hashed if the size is the same but the modification time is not.
+        """
+        entry = self.files.get(key)
+        if entry is None or not os.path.exists(out_path):
+            return False
+        stat = os.stat(filepath)
+        if stat.st_size != entry["size"]:
+            return False
+        if stat.st_mtime_ns == entry["mtime_ns"]:
+            return True
+        if file_sha256(filepath) == entry["sha256"]:
+            entry["mtime_ns"] = stat.st_mtime_ns  # The file was only touched
+            return True
+        return False
+
+    def record(self, key: str, filepath: str):
+        """ Stores the current fingerprint of a file (call it after converting the file). """
+        stat = os.stat(filepath)
+        self.files[key] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": file_sha256(filepath)}
+
+    def discard(self, key: str):
+        self.files.pop(key, None)
+
+    def prune(self, directory: str):
+        """ Drops the files which no longer exist (the keys are paths relative to the input directory). """
+        self.files = {key: entry for key, entry in self.files.items()
+                      if os.path.isfile(os.path.join(directory, key))}
+
+    def save(self):
+        """ Atomically writes the manifest to the output directory. """
+        fh, tmp_path = mkstemp(dir=os.path.dirname(self.path), suffix=".tmp")
+        try:
+            with os.fdopen(fh, "w", encoding="utf-8") as f:
+                json.dump({"version": self.version, "options": self.options, "files": self.files}, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
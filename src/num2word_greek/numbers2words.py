@@ -20,61 +20,374 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-import argparse
-
+# Only what convert_sentence needs is imported here. The modules used by the file
+#  functions and the command line (argparse, glob, tempfile, multiprocessing, ...) are
+#  imported when they are first used, so that importing the library stays fast.
 import sys
 import os
-import glob
 import re
 
-from tempfile import mkstemp
-from shutil import move
+from functools import partial
+from time import perf_counter
+
+from num2word_greek import rules as _rules
+from num2word_greek import stats as _stats
+from num2word_greek.stats import ConversionStats
+from num2word_greek.utils import _ordinal_suffixes, handle_commas, handle_hours, convert_ordinals
+from num2word_greek import convert_numbers as _numbers
+from num2word_greek.convert_numbers import _read_group, convert_numbers, set_long_number_policy
+
+
+# The default rules (see the rules module), i.e. the spans of a (whitespace normalized) sentence which
+#  are converted in a single left-to-right scan:
+#   - literal: a whole word which is a number with thousands separators, a decimal part and/or a sign
+#              (e.g. 1.000.000, 2,5 and -3), see set_number_format
+#   - hours, commas: a whole word containing ":" or "," (e.g. hours like 10:15 and other decimals like 2,5%)
+#   - ordinal: a whole word made of digits and a (one or two letter) suffix (e.g. 2η, 10ος)
+#   - integer: any other run of digits, even inside a word (e.g. είναι2 -> είναι δύο)
+# Everything else is plain text and is copied to the output as is.
+def _build_rules(decimal: str, thousands: str) -> list:
+    # Separators which are whitespace (e.g. thin spaces) are removed before scanning, see _join_groups
+    thousands = "".join(separator for separator in thousands if not separator.isspace())
+    grouped = r"\d{{1,3}}(?:[{}]\d{{3}})+|".format(re.escape(thousands)) if thousands else ""
+    separators = re.escape(decimal + thousands)
+    # Plain integers are left to the (faster) integer rule, a literal has a sign or a separator. It has
+    #  at most one sign, a trailing sign is only accepted without a leading one (e.g. +3- is not a literal).
+    literal = (r"(?<!\S)(?=[-−+]\d|\d+(?:[" + separators + r"]\d|[-−+][.?!;]?(?:\s|$)))"
+               r"(?P<lead>[-−+])?(?P<whole>" + grouped + r"\d+)"
+               r"(?:[" + re.escape(decimal) + r"](?P<fraction>\d+))?(?(lead)|(?P<trail>[-−+])?)(?=[.?!;]?(?:\s|$))")
+    return [
+        _rules.Rule("literal", literal, _convert_literal, 40),
+        _rules.Rule("hours", r"(?<!\S)[^\s,:]*:\S*", _convert_punctuated, 30),
+        _rules.Rule("commas", r"(?<!\S)[^\s,:]*,\S*", _convert_punctuated, 30),
+        _rules.Rule("ordinal", r"(?<!\S)\d+(?P<suffix>[^\W\d_]{1,2})(?!\S)", _convert_ordinal, 20),
+        _rules.Rule("integer", r"\d+", _convert_integer_span, 10),
+    ]
+
 
-from num2word_greek.utils import handle_commas, handle_hours, convert_ordinals
-from num2word_greek.convert_numbers import convert_numbers
+def _build_group_joiner(thousands: str):
+    # Matches the whitespace thousands separators between groups of digits (e.g. the thin spaces of 1 000 000)
+    spaces = "".join(separator for separator in thousands if separator.isspace())
+    return re.compile(r"(?<=\d)[{}](?=\d{{3}}(?!\d))".format(spaces)) if spaces else None, spaces
+
+
+_decimal_separators = ","
+_thousands_separators = ".\u2009\u202f"  # Dot, thin space and narrow no-break space
+_group_joiner, _space_separators = _build_group_joiner(_thousands_separators)
+_signs = {"-": "μείον", "−": "μείον", "+": "συν"}
+
+
+def set_number_format(decimal: str = ",", thousands: str = ".\u2009\u202f"):
+    """ Sets which characters separate the decimals and the thousands of the numbers of a sentence.
+        Args:
+            decimal: The decimal separators. The default is the greek "," (e.g. 2,5). Use ",."
+                     in order to also accept a decimal point (e.g. 3.14).
+            thousands: The thousands separators, e.g. 1.000.000 or 1 000 000 (with thin spaces).
+                       A separator which is also a decimal separator is read as a thousands
+                       separator when it is followed by exactly three digits (e.g. 1.000).
+        Raises:
+            ValueError: If there is no decimal separator or a separator is a digit.
+    """
+    global _decimal_separators, _thousands_separators, _group_joiner, _space_separators
+    if not decimal or any(separator.isdigit() for separator in decimal + thousands):
+        raise ValueError("Invalid separators: decimal={!r}, thousands={!r}.".format(decimal, thousands))
+    _decimal_separators, _thousands_separators = decimal, thousands
+    _rules._set_default_rules(_build_rules(decimal, thousands))
+    _group_joiner, _space_separators = _build_group_joiner(thousands)
+
+
+_digits = re.compile(r"\d+")
 
 
 def convert_sentence(sentence: str, to_lower: bool = False):
+    """ Converts all the numbers (integers, decimals, hours and ordinals) of a sentence
+        to greek words. E.g. "Στις 10:15 θα αγοράσω 2 κιλά" -> "Στις δέκα και τέταρτο θα αγοράσω δύο κιλά".
+        Args:
+            sentence: The text to convert. All whitespace will be replaced by single spaces.
+            to_lower: Whether to lowercase the sentence before converting it.
+        Returns:
+            The converted sentence (or the input itself if it only contains whitespace).
+    """
+    if _stats._collector is not None:
+        return _convert_sentence_profiled(sentence, to_lower, _stats._collector)
     if sentence.strip() == "":
         return sentence
-    final_sent = []
     if to_lower:
         sentence = sentence.lower()
-    sentence = re.sub(r"\s+", " ", sentence).strip()
-    for word_complex in sentence.split():
-        # Handle commas (convert to decimals) and handle hours
-        word_complex = handle_commas(word_complex)
-        word_complex = handle_hours(word_complex)
-        word_complex = convert_ordinals(word_complex)
-        for word in word_complex.split():
-            # word = word.lower()
-            if word.strip() == "":
-                continue
-            # Split words into words and digits (numbers). E.g. είναι2 -> είναι 2.
-            words = re.split(r"(\d+)", word)  # may have spaces
-            words = (w for w in words if w.strip() != "")  # remove spaces from list
-            for w in words:
-                if w.strip() == "":
-                    continue
-                # Convert numbers to words (if they exist).
-                final_sent.append(convert_numbers(w))
+    normalized = " ".join(sentence.split())
+    scanner, convert, _, custom = _rules._compiled
+    if custom or ":" in normalized or _digits.search(normalized) is not None:
+        if _space_separators and any(separator in sentence for separator in _space_separators):
+            normalized = " ".join(_group_joiner.sub("", sentence).split())  # E.g. 1 000 000 -> 1000000
+        sentence = " ".join(scanner.sub(convert, normalized).split())
+    else:
+        # Nothing to convert. Commas which are not between digits are simply removed.
+        sentence = " ".join(normalized.replace(",", " ").split()) if "," in normalized else normalized
     # Concatenate punctuation (e.g. from "they had 9 . the others had 10 ." to "they had nine. the others had 10.")
-    #  -> Note that the space before the dots appears deliberately (check process_word in utils.py).
-    final_sent = " ".join(final_sent)
-    final_sent = re.sub(r"\s+", " ", final_sent)
-    final_sent = re.sub(r"\s\.", ".", final_sent)
-    final_sent = re.sub(r"\s\?", "?", final_sent)
-    final_sent = re.sub(r"\s\n", "\n", final_sent)
-    final_sent = re.sub(r"\s\t", "\t", final_sent)
-    return final_sent
+    return sentence.replace(" .", ".").replace(" ?", "?")
+
+
+# The handlers of the default rules. Numbers are surrounded by spaces so that they are
+#  separated from the surrounding text (the extra spaces are removed afterwards).
+def _convert_literal(match) -> str:
+    return " " + _read_literal(match) + " "
+
+
+def _convert_ordinal(match) -> str:
+    span = match.group()
+    if match.group("suffix").lower() in _ordinal_suffixes:
+        span = convert_ordinals(span)  # Returns the input if it cannot be converted (e.g. 0ος)
+    return _digits.sub(_convert_integer_span, span)
+
+
+def _convert_punctuated(match) -> str:
+    span = match.group()
+    if ":" not in span and _digits.search(span) is None:
+        return span.replace(",", " ")
+    # Handle commas (convert to decimals) and handle hours
+    return _digits.sub(_convert_integer_span, convert_ordinals(handle_hours(handle_commas(span))))
+
+
+def _convert_integer_span(match) -> str:
+    return " " + convert_numbers(match.group()) + " "
+
+
+def _read_literal(match) -> str:
+    # E.g. -1.000,05 -> "μείον χίλια κόμμα μηδέν πέντε"
+    whole, fraction, sign = match.group("whole"), match.group("fraction"), match.group("lead") or match.group("trail")
+    if not whole.isdigit():
+        whole = "".join(character for character in whole if character.isdigit())  # Drop the thousands separators
+    words = convert_numbers(whole)
+    if fraction is not None:
+        words += " κόμμα " + _read_group(fraction)  # The zeros of the decimals are read, e.g. 2,05
+    return _signs[sign] + " " + words if sign else words
+
+
+_rules._set_default_rules(_build_rules(_decimal_separators, _thousands_separators))
+
+
+# The same steps as convert_sentence and _convert_span, with each stage timed (see the stats module)
+def _convert_sentence_profiled(sentence: str, to_lower: bool, collector):
+    stats = ConversionStats()
+    start = perf_counter()
+    if sentence.strip() != "":
+        sentence = stats.time("normalize", _normalize, sentence, to_lower)
+        stats.tokens = sentence.count(" ") + 1
+        scanner, _, handlers, custom = _rules._compiled
+        if custom or ":" in sentence or _digits.search(sentence) is not None:
+            convert = partial(_convert_span_profiled, stats, handlers)
+            sentence = stats.time("scan", scanner.sub, convert, sentence)
+            sentence = stats.time("cleanup", _cleanup, sentence)
+        else:
+            sentence = stats.time("cleanup", _cleanup, sentence.replace(",", " "))
+    stats.sentences = 1
+    stats.total_seconds = perf_counter() - start
+    collector.add(stats)
+    return sentence
+
+
+def _normalize(sentence: str, to_lower: bool) -> str:
+    if to_lower:
+        sentence = sentence.lower()
+    if _space_separators and any(separator in sentence for separator in _space_separators):
+        sentence = _group_joiner.sub("", sentence)
+    return " ".join(sentence.split())
+
 
+def _cleanup(sentence: str) -> str:
+    return " ".join(sentence.split()).replace(" .", ".").replace(" ?", "?")
 
-def _convert_file_contents(filepath: str, out_path: str):
+
+def _convert_span_profiled(stats: ConversionStats, handlers: dict, match) -> str:
+    span = match.group()
+    handler = handlers[match.lastgroup]
+    split_digits = partial(_convert_integer_span_profiled, stats)
+    if handler is _convert_integer_span:
+        return " " + _convert_number_profiled(stats, span) + " "
+    if handler is _convert_literal:
+        return " " + stats.time("literals", _read_literal, match) + " "
+    if handler is not _convert_punctuated and handler is not _convert_ordinal:
+        return stats.time("rules", handler, match)
+    if handler is _convert_ordinal:
+        if match.group("suffix").lower() in _ordinal_suffixes:
+            span = stats.time("ordinals", convert_ordinals, span)
+        return stats.time("split_digits", _digits.sub, split_digits, span)
+    if ":" not in span and _digits.search(span) is None:
+        return span.replace(",", " ")
+    span = stats.time("commas", handle_commas, span)
+    span = stats.time("hours", handle_hours, span)
+    span = stats.time("ordinals", convert_ordinals, span)
+    return stats.time("split_digits", _digits.sub, split_digits, span)
+
+
+def _convert_integer_span_profiled(stats: ConversionStats, match) -> str:
+    return " " + _convert_number_profiled(stats, match.group()) + " "
+
+
+def _convert_number_profiled(stats: ConversionStats, number: str) -> str:
+    stats.numbers[len(number)] += 1
+    return stats.time("numbers", convert_numbers, number)
+
+
+def convert_lines(lines, to_lower: bool = False, record_format: str = "text", fields=None, header: bool = False,
+                  errors: str = "fail", report=None, source: str = None):
+    """ Lazily converts the numbers of each line to the corresponding greek words.
+        Args:
+            lines: Any iterable of strings, e.g. an open text file, sys.stdin, an io.StringIO
+                   or a generator. Only one line is read at a time.
+            to_lower: Whether to lowercase the lines (or the converted fields) before converting them.
+            record_format: "text" (the default) converts the whole lines. One of "kaldi", "tsv",
+                           "csv" or "jsonl" only converts the selected fields of each record and
+                           keeps the rest of the line byte for byte (see records.convert_records).
+            fields: The columns (tsv/csv) or keys (jsonl) to convert.
+            header: Whether the first line of a tsv/csv file contains the names of the columns.
+            errors: What to do with a line which cannot be converted (see the errors module):
+                    "fail" (default) raises the exception, "skip_line" keeps the line unchanged
+                    and "keep_token" only keeps the tokens which failed unchanged.
+            report: An errors.ErrorReport where the failures are recorded (optional).
+            source: The name of the file of the lines (only used in the report).
+        Returns:
+            A generator of the converted lines. Each of them ends with a newline
+            (blank lines become just "\n").
+    """
+    recovery = None
+    convert = partial(convert_sentence, to_lower=to_lower)
+    if errors != "fail" or report is not None:
+        from num2word_greek.errors import check_error_policy
+        check_error_policy(errors)
+        recovery = _Recovery(to_lower, errors, report, source)
+        lines = recovery.numbered(lines)
+        convert = recovery.convert
+    if record_format != "text":
+        from num2word_greek.records import convert_records
+        yield from convert_records(lines, convert, record_format, fields, header,
+                                   None if recovery is None else recovery.recover)
+        return
+    for line in lines:
+        if line.strip() == "":
+            yield "\n"
+        elif recovery is None:
+            yield convert_sentence(line, to_lower) + "\n"
+        else:
+            try:
+                converted = recovery.convert(line)
+            except Exception as e:
+                converted = recovery.recover(line.rstrip("\r\n"), e)
+            yield converted + "\n"
+
+
+class _Recovery:
+    """ Applies the error policy of convert_lines and records the failures of each line. """
+    __slots__ = ("to_lower", "errors", "report", "source", "line")
+
+    def __init__(self, to_lower: bool, errors: str, report, source: str):
+        self.to_lower = to_lower
+        self.errors = errors
+        self.report = report
+        self.source = source
+        self.line = None
+
+    def numbered(self, lines):
+        for self.line, line in enumerate(lines, 1):
+            yield line
+
+    def convert(self, sentence: str) -> str:
+        try:
+            return convert_sentence(sentence, self.to_lower)
+        except Exception as e:
+            # Convert it again, span by span, in order to find the tokens which failed
+            failed = []
+            try:
+                converted = _convert_sentence_tolerant(sentence, self.to_lower, failed)
+            except Exception:
+                failed.clear()
+            if self.report is not None:
+                for token, error in failed or [(None, e)]:
+                    self.report.add(self.source, self.line, token, error)
+                self.report.last_exception = e
+            if self.errors == "keep_token" and failed:
+                return converted
+            raise
+
+    def recover(self, line: str, exception: Exception) -> str:
+        # Called with the line (without its ending) which could not be converted
+        if self.report is not None and exception is not self.report.last_exception:
+            self.report.add(self.source, self.line, None, exception)  # E.g. a line which is not JSON
+        if self.errors == "fail":
+            raise exception
+        return line
+
+
+# The same steps as convert_sentence, except that a span which cannot be converted is kept as it is
+#  (and appended to `failed` together with the exception).
+def _convert_sentence_tolerant(sentence: str, to_lower: bool, failed: list) -> str:
+    if sentence.strip() == "":
+        return sentence
+    scanner, _, handlers, _ = _rules._compiled
+    convert = partial(_convert_span_tolerant, handlers, failed)
+    return _cleanup(scanner.sub(convert, _normalize(sentence, to_lower)))
+
+
+def _convert_span_tolerant(handlers: dict, failed: list, match) -> str:
+    try:
+        return handlers[match.lastgroup](match)
+    except Exception as e:
+        failed.append((match.group(), e))
+        return " " + match.group() + " "
+
+
+def convert_stream(src, dst, to_lower: bool = False, buffer_size: int = 1 << 16, **options) -> int:
+    """ Converts the lines of src and writes them to dst, using constant memory.
+        Args:
+            src: Any iterable of lines (e.g. a file opened for reading, sys.stdin or a socket's makefile()).
+            dst: Any object with a write method accepting strings (e.g. sys.stdout or an io.StringIO).
+            to_lower: Whether to lowercase the lines before converting them.
+            buffer_size: How many characters to collect before each call of dst.write.
+                         Use 0 in order to write each line as soon as it is converted.
+            options: The other options of convert_lines (e.g. record_format, fields, header,
+                     errors and report).
+        Returns:
+            The number of lines that were written.
+    """
+    buffer = []
+    buffered = 0
+    count = 0
+    for line in convert_lines(src, to_lower, **options):
+        count += 1
+        buffer.append(line)
+        buffered += len(line)
+        if buffered >= buffer_size:
+            dst.write("".join(buffer))
+            buffer.clear()
+            buffered = 0
+    if buffer:
+        dst.write("".join(buffer))
+    return count
+
+
+def _convert_file_contents(filepath: str, out_path: str, io_mode: str = "lines", buffer_size: int = 1 << 16,
+                           compression: str = "auto", compress_level: int = None, **options):
     """ Replaces the numbers of each sentence in the provided input file, to the corresponding 
         greek word.
         Args:
             filepath: The path to the file for which you want to change the numbers to words.
-            out_path: The output file where the new content will be saved.
+            out_path: The output file where the new content will be saved. If it is the same
+                      as filepath then the file is atomically replaced once it is converted.
+            io_mode: How to read the input file. One of:
+                     1. "lines" (default): Read it line by line.
+                     2. "mmap": Memory-map it and find the lines with a fast newline search
+                        (faster for big files, only "\n" line endings are recognized).
+                     The record formats keep the line endings of the file as they are (e.g. "\r\n").
+                     It is not used for compressed files.
+            buffer_size: The size (in bytes) of the write buffer (and of the read buffer of
+                         compressed files).
+            compression: The compression of the input and the output file. "auto" (default) uses
+                         their extensions (.gz, .bz2 or .xz), None means not compressed and "gzip",
+                         "bz2" or "xz" is used for both. Compressed files are decompressed and
+                         compressed while they are converted (see the compression module).
+            compress_level: The compression level of the output file (None for the default one).
+            options: The other options of convert_lines (e.g. record_format, fields, header,
+                     errors and report). The failures are reported with filepath as their file.
         Returns:
             Nothing
     """
@@ -83,33 +396,183 @@ def _convert_file_contents(filepath: str, out_path: str):
         raise FileNotFoundError("Could not locate the path that you provided:", filepath)
     if (not os.path.exists(os.path.dirname(out_path))) and (not os.path.isfile(out_path)):
         raise ValueError("Cannot create {} since its parent directory does not exist.".format(out_path))
-    if os.path.samefile(filepath, out_path):
-        # Create temporary file which will replace the old one.
-        fh, abs_path = mkstemp()
-        with os.fdopen(fh, 'w') as newf:
-            with open(filepath, "r", encoding="utf-8") as f:
-                line = f.readline()
-                while line:
-                    if line.strip() == "":
-                        newf.write("\n")
-                    else:
-                        newf.write(convert_sentence(line) + "\n")
-                    line = f.readline()
-        # Remove old file
-        os.remove(filepath)
-        # Move new file
-        move(abs_path, filepath)
-        return
+    if io_mode not in _io_modes:
+        raise ValueError("Unknown io mode: {}. Use one of {}.".format(io_mode, ", ".join(_io_modes)))
+    # The record formats keep every byte of the lines which are not converted, so the line endings
+    #  are not translated (the mmap mode never translates them).
+    newline = None if options.get("record_format", "text") == "text" else ""
+    read_lines = _io_modes[io_mode] if io_mode == "mmap" else partial(_read_lines, newline=newline)
+    input_compression = output_compression = None
+    if compression is not None:
+        from num2word_greek.compression import resolve_compression
+        input_compression = resolve_compression(filepath, compression)
+        output_compression = resolve_compression(out_path, compression)
+    if input_compression is not None:
+        read_lines = partial(_read_lines_compressed, compression=input_compression, buffer_size=buffer_size,
+                             newline=newline)
+    options.setdefault("source", filepath)
+    if os.path.exists(out_path) and os.path.samefile(filepath, out_path):
+        from shutil import copymode
+        from tempfile import mkstemp
+        # Create a temporary file (in the same directory) which will atomically replace the old one.
+        fh, abs_path = mkstemp(dir=os.path.dirname(os.path.abspath(filepath)), suffix=".tmp")
+        os.close(fh)
+        try:
+            with _open_output(abs_path, output_compression, compress_level, buffer_size, newline) as newf:
+                convert_stream(read_lines(filepath), newf, buffer_size=buffer_size, **options)
+            copymode(filepath, abs_path)
+            os.replace(abs_path, filepath)
+        except BaseException:
+            os.remove(abs_path)
+            raise
     else:
-        with open(filepath, "r", encoding="utf-8") as fr:
-            with open(out_path, "w", encoding="utf-8") as fw:
-                line = fr.readline()
-                while line:
-                    if line.strip() == "":
-                        fw.write("\n")
-                    else:
-                        fw.write(convert_sentence(line) + "\n")
-                    line = fr.readline()
+        with _open_output(out_path, output_compression, compress_level, buffer_size, newline) as fw:
+            convert_stream(read_lines(filepath), fw, buffer_size=buffer_size, **options)
+
+
+def _read_lines(filepath: str, newline: str = None):
+    with open(filepath, "r", encoding="utf-8", newline=newline) as f:
+        yield from f
+
+
+def _read_lines_compressed(filepath: str, compression: str, buffer_size: int = 1 << 16, newline: str = None):
+    from num2word_greek.compression import open_text
+    with open_text(filepath, "r", compression, buffer_size=buffer_size, newline=newline) as f:
+        yield from f
+
+
+def _open_output(out_path: str, compression: str, level: int, buffer_size: int, newline: str = None):
+    if compression is None:
+        return open(out_path, "w", encoding="utf-8", buffering=buffer_size, newline=newline)
+    from num2word_greek.compression import open_text
+    return open_text(out_path, "w", compression, level, buffer_size, newline)
+
+
+def _read_lines_mmap(filepath: str, block_size: int = 1 << 16):
+    import mmap
+    with open(filepath, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return  # Empty files cannot be memory-mapped
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            size = len(mm)
+            start = 0
+            while start < size:
+                # Decode a big block of whole lines at once (it ends at the last newline of the block)
+                end = mm.rfind(b"\n", start, start + block_size) + 1 if start + block_size < size else size
+                if end <= start:  # A single line longer than the block
+                    end = mm.find(b"\n", start) + 1 or size
+                lines = mm[start:end].decode("utf-8").split("\n")
+                last = lines.pop()  # Empty if the block ended with a newline
+                for line in lines:
+                    yield line + "\n"  # The lines keep their endings, like the lines of a file
+                if last:
+                    yield last
+                start = end
+
+
+_io_modes = {
+    "lines": _read_lines,
+    "mmap": _read_lines_mmap
+}
+
+
+def _convert_file_task(task: tuple, report_errors: bool = False, **kwargs) -> tuple:
+    """ Converts a single (input path, output path) pair. Never raises, so that a file
+        which cannot be converted does not abort the conversion of the rest.
+        Args:
+            task: The input and output paths.
+            report_errors: Whether to collect the failures of the file (see the errors module).
+            kwargs: Passed to _convert_file_contents (e.g. io_mode, buffer_size, errors).
+        Returns:
+            A tuple of the input path, the status ("processed", "skipped" or "failed"),
+            an error message (None if the file was processed) and the list of the
+            errors.ErrorRecord of the file (empty if report_errors is False).
+    """
+    filepath, out_path = task
+    if not os.path.isfile(filepath):
+        return filepath, "skipped", "not a regular file", []
+    report = None
+    if report_errors:
+        from num2word_greek.errors import ErrorReport
+        report = ErrorReport()
+    try:
+        _convert_file_contents(filepath, out_path, report=report, **kwargs)
+    except Exception as e:
+        if report is not None and e is not report.last_exception:
+            report.add(filepath, None, None, e)  # E.g. a file which could not be decoded
+        return filepath, "failed", "{}: {}".format(type(e).__name__, e), [] if report is None else report.records
+    return filepath, "processed", None, [] if report is None else report.records
+
+
+def _convert_files(tasks: list, jobs: int = 1, **kwargs) -> list:
+    """ Converts many (input path, output path) pairs, using a pool of `jobs` processes.
+        Returns:
+            The results of _convert_file_task for each pair, in the same order as `tasks`.
+    """
+    return list(_iter_convert_files(tasks, jobs, **kwargs))
+
+
+def _iter_convert_files(tasks, jobs: int = 1, chunksize: int = 16, **kwargs):
+    """ Lazily converts the (input path, output path) pairs of any iterable (e.g. the files
+        which are still being discovered), using a pool of `jobs` processes. Only a few chunks
+        of `chunksize` pairs are sent to the workers at a time, so the pairs are consumed
+        as they are converted.
+        Returns:
+            A generator of the results of _convert_file_task for each pair, in the same order
+            as `tasks`.
+    """
+    convert_task = partial(_convert_file_task, **kwargs)
+    if jobs <= 1:
+        yield from map(convert_task, tasks)
+        return
+    from collections import deque
+    from concurrent.futures import ProcessPoolExecutor
+    from itertools import islice
+    tasks = iter(tasks)
+    pending = deque()
+    # The workers use the same settings (they do not inherit them if they are spawned)
+    settings = (_numbers._long_number_policy, _decimal_separators, _thousands_separators)
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=settings) as executor:
+        while True:
+            # Keep every worker busy, with the next chunks already waiting
+            while len(pending) < 2 * jobs:
+                chunk = list(islice(tasks, chunksize))
+                if not chunk:
+                    break
+                pending.append(executor.submit(_convert_file_chunk, chunk, **kwargs))
+            if not pending:
+                return
+            yield from pending.popleft().result()
+
+
+def _convert_file_chunk(chunk: list, **kwargs) -> list:
+    # Send the files to the workers in chunks so that the overhead per file stays low
+    return [_convert_file_task(task, **kwargs) for task in chunk]
+
+
+def _mirror_tasks(path: str, outpath: str, relpaths):
+    # The (input path, output path) pairs which mirror the tree of `path` under `outpath`
+    #  (the output directories are created as they are needed)
+    created = set()
+    for relpath in relpaths:
+        directory = os.path.dirname(relpath)
+        if directory and directory not in created:
+            os.makedirs(os.path.join(outpath, directory), exist_ok=True)
+            created.add(directory)
+        yield os.path.join(path, relpath), os.path.join(outpath, relpath)
+
+
+def _init_worker(long_number_policy, decimal: str, thousands: str):
+    if long_number_policy is not None:
+        set_long_number_policy(*long_number_policy)
+    set_number_format(decimal, thousands)
+
+
+def _print_summary(counts: dict, problems: list):
+    print("Processed: {}, skipped: {}, failed: {}, errors: {}".format(
+        counts["processed"], counts["skipped"], counts["failed"], counts["errors"]))
+    for filepath, status, error in sorted(problems):
+        print("  [{}] {}: {}".format(status, filepath, error))
 
 
 def _replace_file_prompt(filepath: str) -> bool:
@@ -119,7 +582,11 @@ def _replace_file_prompt(filepath: str) -> bool:
     return False
 
 
-def cmdline():
+def _build_parser():
+    import argparse
+    from num2word_greek import words2numbers
+    from num2word_greek.errors import ERROR_POLICIES
+
     msg = """ Use this script if you want to convert the digits of a file to their equivalent greek words.
               You may provide a path to a text file containing only the transcript of an audio file and the 
               contents of it will be replace with so that there are not digits.
@@ -141,7 +608,15 @@ def cmdline():
     parser.add_argument("-p", "--path", required=False, default=None,
                         help="Path to a file or a directory containing the text files.")
     parser.add_argument("-e", "--extension", required=False, default=".txt",
-                        help="Extension of the text files containing the transcripts.")
+                        help="Extension of the text files containing the transcripts (if --include is not used).")
+    parser.add_argument("-r", "--recursive", required=False, action="store_true",
+                        help="Also convert the files of the subdirectories of --path. The tree is mirrored "
+                             "under --out-path.")
+    parser.add_argument("--include", required=False, action="append", default=None,
+                        help="Glob pattern of the files to convert, e.g. '*.lab' (a name) or 'spk*/*.txt' "
+                             "(a path relative to --path). May be used more than once.")
+    parser.add_argument("--exclude", required=False, action="append", default=None,
+                        help="Glob pattern of the files or directories to skip. May be used more than once.")
     parser.add_argument("-o", "--out-path", required=False, default=None,
                         help="Where the new file/files will be placed. Will only be used "
                              "if you provided the --path option. Cases: "
@@ -154,12 +629,112 @@ def cmdline():
                              "       your output (the names will be the same as before)."
                              "3. If --out-path is not used then we will replace the file after"
                              "   prompting you.")
-    args = parser.parse_args()
+    parser.add_argument("-j", "--jobs", required=False, type=int, default=os.cpu_count() or 1,
+                        help="How many processes to use when --path is a directory "
+                             "(defaults to the number of CPUs).")
+    parser.add_argument("--io-mode", required=False, default="lines", choices=sorted(_io_modes),
+                        help="How to read the input files. 'mmap' memory-maps them, which is "
+                             "faster for big files with '\\n' line endings.")
+    parser.add_argument("--buffer-size", required=False, type=int, default=1 << 16,
+                        help="Size (in bytes) of the write buffer of each output file (and of the read "
+                             "buffer of the compressed input files).")
+    parser.add_argument("--compression", required=False, default="auto",
+                        choices=["auto", "none", "gzip", "bz2", "xz"],
+                        help="Compression of the input and output files. 'auto' uses their extensions "
+                             "(.gz, .bz2 or .xz).")
+    parser.add_argument("--compress-level", required=False, type=int, default=None,
+                        help="Compression level of the compressed output files (gzip/bz2: 1-9, xz: 0-9).")
+    parser.add_argument("--incremental", required=False, action="store_true",
+                        help="Only convert the files of the directory which changed since the previous "
+                             "run (tracked in a manifest inside --out-path).")
+    parser.add_argument("--force", required=False, action="store_true",
+                        help="Convert all files even if they have not changed (implies --incremental, "
+                             "so the manifest is rewritten).")
+    parser.add_argument("--format", required=False, default="text",
+                        choices=["text", "kaldi", "tsv", "csv", "jsonl"],
+                        help="The format of the files. 'text' converts whole lines, the others only "
+                             "convert the selected fields and keep the rest of each line as is: "
+                             "'kaldi' (the transcript after the utterance ID), 'tsv'/'csv' (--fields) "
+                             "and 'jsonl' (--fields, default 'text').")
+    parser.add_argument("--fields", required=False, default=None,
+                        help="Comma separated columns (indices starting from 0, or names with --header) "
+                             "or JSON keys (e.g. 'text,meta.title') to convert.")
+    parser.add_argument("--header", required=False, action="store_true",
+                        help="The first line of the tsv/csv files contains the names of the columns.")
+    parser.add_argument("--errors", required=False, default="fail", choices=ERROR_POLICIES,
+                        help="What to do with a line which cannot be converted: 'fail' stops (the file), "
+                             "'skip_line' keeps the line unchanged and 'keep_token' only keeps the tokens "
+                             "which failed unchanged.")
+    parser.add_argument("--error-report", required=False, default=None,
+                        help="Write the failures (file, line, token and exception) to this file, as JSON lines.")
+    parser.add_argument("--max-digits", required=False, type=int, default=None,
+                        help="Integers with more digits (e.g. phone numbers or IDs) are read as set by "
+                             "--read-long-as instead of as numbers.")
+    parser.add_argument("--read-long-as", required=False, default="digits", choices=["digits", "groups"],
+                        help="How to read the integers with more than --max-digits digits.")
+    parser.add_argument("--group-size", required=False, type=int, default=3,
+                        help="Number of digits of each group (with --read-long-as groups).")
+    parser.add_argument("--decimal-separators", required=False, default=",",
+                        help="The characters which separate the decimals of a number (use ',.' in order to "
+                             "also read 3.14 as a decimal).")
+    parser.add_argument("--thousands-separators", required=False, default=".\u2009\u202f",
+                        help="The characters which separate the thousands of a number (e.g. 1.000.000). "
+                             "The default is '.' and the thin spaces.")
+    subparsers = parser.add_subparsers(dest="command", metavar="{serve,bench,words}")
+    serve_parser = subparsers.add_parser("serve", help="Keep a converter running and serve it over a unix "
+                                                       "domain socket or a localhost TCP port (newline "
+                                                       "delimited JSON).")
+    serve_parser.add_argument("--socket", default=None, help="Path of the unix domain socket to listen on.")
+    serve_parser.add_argument("--host", default="127.0.0.1", help="Host to listen on (if --socket is not used).")
+    serve_parser.add_argument("--port", type=int, default=8765, help="Port to listen on (if --socket is not used).")
+    serve_parser.add_argument("--queue-size", type=int, default=1024,
+                              help="Maximum number of requests waiting to be converted.")
+    serve_parser.add_argument("--max-batch-size", type=int, default=64,
+                              help="Maximum number of requests converted together.")
+    bench_parser = subparsers.add_parser("bench", add_help=False,
+                                         help="Run the benchmarks (see `bench --help`).")
+    bench_parser.add_argument("bench_args", nargs=argparse.REMAINDER)
+    words_parser = subparsers.add_parser("words", help="Convert greek words back to numbers.")
+    words2numbers.add_arguments(words_parser)
+    return parser
+
+
+def _run_command(args, unknown: list):
+    # Runs the subcommand (or converts the --test-word) and exits, if one was given
+    if args.command == "serve":
+        from num2word_greek.server import serve
+        serve(args.socket, args.host, args.port, args.queue_size, args.max_batch_size)
+        sys.exit(0)
+    if args.command == "bench":
+        from num2word_greek.benchmark import main as bench
+        bench(args.bench_args + unknown)
+        sys.exit(0)
+    if args.command == "words":
+        from num2word_greek import words2numbers
+        words2numbers.run(args)
+        sys.exit(0)
     if args.test_word is not None:
         print(convert_sentence(args.test_word))
         print("Converted test word, now exiting...")
         sys.exit(0)
 
+
+def cmdline():
+    import argparse
+
+    parser = _build_parser()
+    # The options of `bench` are parsed by the benchmark module itself
+    args, unknown = parser.parse_known_args()
+    if unknown and args.command != "bench":
+        parser.error("unrecognized arguments: " + " ".join(unknown))
+    set_long_number_policy(args.max_digits, args.read_long_as, args.group_size)
+    set_number_format(args.decimal_separators, args.thousands_separators)
+    _run_command(args, unknown)
+
+    options = dict(record_format=args.format, header=args.header, errors=args.errors,
+                   fields=args.fields.split(",") if args.fields else None,
+                   compression=None if args.compression == "none" else args.compression,
+                   compress_level=args.compress_level)
     if args.path is None:
         return argparse.ArgumentTypeError("You should provide at least on of the --test-word "
                                           "or --path arguments. Aborting...")
@@ -169,58 +744,17 @@ def cmdline():
         raise argparse.ArgumentTypeError("Could not locate the path that you provided: {}.".format(args.path))
     path = os.path.abspath(args.path)
 
-    # Handle out path.
-    if args.out_path is not None:
-        # Take the path provided in the arguments
-        outpath = os.path.abspath(args.out_path)
-    else:
-        if os.path.isfile(path):
-            # use the same directory
-            outpath = os.path.dirname(path)
-        elif os.path.isdir(path):
-            # use the same directory
-            outpath = path
-        else:
-            # The only way we will get here is if --path was not a file, but this would be caught above.
-            print("Unexpected Error. Aborting...")
-            sys.exit(1)
+    outpath = _out_path(args, path)
 
     # ------------------------ CASE 1: INPUT IS FILE ---------------------------
     if os.path.isfile(path):
-        if os.path.isdir(outpath):
-            outpath = os.path.join(outpath, os.path.basename(path))
-        # Delete previous content or create new file.
-        with open(outpath, "w") as f:
-            f.write("")
-        if os.path.samefile(path, outpath):
-            if not _replace_file_prompt(path):
-                print("Aborting...")
-                sys.exit(1)
-        _convert_file_contents(path, outpath)
-        print("Success!")
-        print("Done processing file:", path)
-        print("The output is saved in:", outpath)
-        sys.exit(0)
+        _convert_file_command(path, outpath, args, options)
     if not os.path.exists(outpath):
         os.mkdir(outpath)
     
     # ------------------------ CASE 2: INPUT IS DIR ---------------------------
     if os.path.isdir(path) and os.path.isdir(outpath):
-        if os.path.samefile(path, outpath):
-            if not _replace_file_prompt(path):
-                print("Aborting...")
-                sys.exit(1)
-        text_file_dir = glob.glob(os.path.join(path, "*" + args.extension))
-        if len(text_file_dir) == 0:
-            raise ValueError("The directory that you provided is empty. Aborting...")
-        for text_file in text_file_dir:
-            new_out = os.path.join(outpath, os.path.basename(text_file))
-            with open(new_out, "w") as f:
-                f.write("")
-            _convert_file_contents(text_file, new_out)
-        print("Success!")
-        print("Done processing files from the directory:", path)
-        sys.exit(0)
+        _convert_directory_command(path, outpath, args, options)
     else:  # outpath is a file while the input path is a directory.
         print("--out-path is not a directory while --path is. If you want to replace the "
               "contents of {} then leave the --out-path option blank.".format(path))
@@ -229,5 +763,126 @@ def cmdline():
     sys.exit(1)
 
 
+def _out_path(args, path: str) -> str:
+    # Handle out path.
+    if args.out_path is not None:
+        # Take the path provided in the arguments
+        return os.path.abspath(args.out_path)
+    if os.path.isfile(path):
+        # use the same directory
+        return os.path.dirname(path)
+    if os.path.isdir(path):
+        # use the same directory
+        return path
+    # The only way we will get here is if --path was not a file, but this would be caught above.
+    print("Unexpected Error. Aborting...")
+    sys.exit(1)
+
+
+def _convert_file_command(path: str, outpath: str, args, options: dict):
+    from num2word_greek.errors import ErrorReport
+
+    if os.path.isdir(outpath):
+        outpath = os.path.join(outpath, os.path.basename(path))
+    if os.path.exists(outpath) and os.path.samefile(path, outpath):
+        if not _replace_file_prompt(path):
+            print("Aborting...")
+            sys.exit(1)
+    report = ErrorReport.open(args.error_report) if args.error_report is not None else None
+    try:
+        _convert_file_contents(path, outpath, io_mode=args.io_mode, buffer_size=args.buffer_size,
+                               report=report, **options)
+    finally:
+        if report is not None:
+            report.close()
+    print("Success!")
+    print("Done processing file:", path)
+    print("The output is saved in:", outpath)
+    if report is not None and len(report) > 0:
+        print("Errors: {} (see {})".format(len(report), args.error_report))
+    sys.exit(0)
+
+
+def _convert_directory_command(path: str, outpath: str, args, options: dict):
+    from collections import Counter
+    from num2word_greek.discovery import find_files
+    from num2word_greek.errors import ErrorReport
+
+    if os.path.samefile(path, outpath):
+        if not _replace_file_prompt(path):
+            print("Aborting...")
+            sys.exit(1)
+    include, exclude = _directory_patterns(args, path, outpath)
+    manifest = _open_manifest(args, outpath, options)
+    counts = Counter()
+    problems = []
+    # The files are converted while the tree is still being searched
+    tasks = _mirror_tasks(path, outpath, find_files(path, include, exclude, args.recursive))
+    if manifest is not None and not args.force:
+        tasks = _changed_tasks(tasks, path, manifest, counts)
+    report = ErrorReport.open(args.error_report) if args.error_report is not None else None
+    try:
+        results = _iter_convert_files(tasks, jobs=args.jobs, io_mode=args.io_mode, buffer_size=args.buffer_size,
+                                      report_errors=report is not None, **options)
+        _collect_results(results, path, counts, problems, report, manifest)
+    finally:
+        if report is not None:
+            report.close()
+    if manifest is not None:
+        manifest.prune(path)
+        manifest.save()
+    if counts["processed"] + counts["skipped"] + counts["failed"] == 0:
+        raise ValueError("The directory that you provided does not contain any matching files. Aborting...")
+    _print_summary(counts, problems)
+    print("Done processing files from the directory:", path)
+    sys.exit(1 if counts["failed"] else 0)
+
+
+def _directory_patterns(args, path: str, outpath: str) -> tuple:
+    # The include and exclude patterns of the files of the directory (see discovery.find_files)
+    from num2word_greek.manifest import Manifest
+
+    include = args.include or ["*" + args.extension]
+    exclude = (args.exclude or []) + ["/" + Manifest.filename]
+    if outpath != path and os.path.commonpath([path, outpath]) == path:
+        # Do not convert the output files again
+        exclude.append("/" + re.sub(r"([*?[])", r"[\1]", os.path.relpath(outpath, path).replace(os.sep, "/")))
+    return include, exclude
+
+
+def _open_manifest(args, outpath: str, options: dict):
+    if not (args.incremental or args.force):
+        return None
+    from num2word_greek.manifest import Manifest
+    # The files are converted again when any option which changes the output is different
+    return Manifest(outpath, options=dict(
+        options, max_digits=args.max_digits, read_long_as=args.read_long_as, group_size=args.group_size,
+        decimal_separators=args.decimal_separators, thousands_separators=args.thousands_separators))
+
+
+def _changed_tasks(tasks, path: str, manifest, counts):
+    for src, out in tasks:
+        if manifest.is_unchanged(os.path.relpath(src, path), src, out):
+            counts["skipped"] += 1  # Not changed since the previous run (of the same version)
+            continue
+        yield src, out
+
+
+def _collect_results(results, path: str, counts, problems: list, report, manifest):
+    # Counts the converted files and records their failures and (in the manifest) their fingerprints
+    for src, status, error, records in results:
+        counts[status] += 1
+        counts["errors"] += len(records)
+        if status != "processed":
+            problems.append((src, status, error))
+        if report is not None:
+            for record in records:
+                report.add_record(record)
+        if manifest is not None and status == "processed":
+            manifest.record(os.path.relpath(src, path), src)
+        elif manifest is not None and status == "failed":
+            manifest.discard(os.path.relpath(src, path))
+
+
 if __name__ == '__main__':
     cmdline()
@@ -20,6 +20,8 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+from collections import namedtuple
+
 
 _prefixes = {
     "1digit": {
@@ -91,15 +93,326 @@ _plural_forms = {
     "9": "εννιά"
 }
 
-# Update with 4 digits
-_prefixes['4digit'] = {'1': 'χίλια'}
-_prefixes['4digit'].update({key: (_plural_forms[key] + " χιλιάδες").strip() for key, val in _prefixes['1digit'].items()
-                            if key != "1"})
+# The (singular, plural) scale words of each triad after the thousands, i.e. of 10^6, 10^9, ..., 10^33
+_scale_words = (
+    ("εκατομμύριο", "εκατομμύρια"),
+    ("δισεκατομμύριο", "δισεκατομμύρια"),
+    ("τρισεκατομμύριο", "τρισεκατομμύρια"),
+    ("τετράκις εκατομμύριο", "τετράκις εκατομμύρια"),
+    ("πεντάκις εκατομμύριο", "πεντάκις εκατομμύρια"),
+    ("εξάκις εκατομμύριο", "εξάκις εκατομμύρια"),
+    ("επτάκις εκατομμύριο", "επτάκις εκατομμύρια"),
+    ("οκτάκις εκατομμύριο", "οκτάκις εκατομμύρια"),
+    ("εννεάκις εκατομμύριο", "εννεάκις εκατομμύρια"),
+    ("δεκάκις εκατομμύριο", "δεκάκις εκατομμύρια"),
+)
+
+
+# ------------------------------------ TRIAD TABLES ------------------------------------
+# Complete words for every number in [0, 999] (a "triad"). They are built once, on first
+# use, so that converting a number only needs one lookup per group of three digits.
+#   - "neuter": The default form, e.g. 203 -> "διακόσια τρία" (also used before "εκατομμύρια").
+#   - "feminine": The form of the default output before "χιλιάδες". Only the units and the whole
+#                 hundreds change, e.g. 203 -> "διακοσια τρείς" and 200 -> "διακόσιες" (so that
+#                 203000 -> "διακοσια τρείς χιλιάδες"). The inflected forms (see get_inflection) use
+#                 fully feminine multipliers instead, e.g. "διακόσιες τρεις χιλιάδες".
+_triad_tables = {}
+
+# Units which change when they are part of a compound number in the plural form (δεκατρείς, εικοσιτέσσερις)
+_compound_plural_forms = {
+    "3": "τρείς",
+    "4": "τέσσερις"
+}
+
+
+def _tens_words(number: int, plural: bool = False) -> str:
+    # Words for a number in [1, 99]. E.g. 13 -> "δεκα" + "τρία" = "δεκατρία"
+    key = str(number)
+    if key in _prefixes['2digit'] and number >= 10:  # so if it is 10 then return 'δέκα' (same for 11, 12 , 20, ..., 90)
+        return _prefixes['2digit'][key]
+    units = key[-1]
+    units = (plural and _compound_plural_forms.get(units)) or _prefixes['1digit'][units]
+    return units if number < 10 else _prefixes['2digit'][key[0]] + units
+
+
+def _triad_words(number: int, plural: bool = False) -> str:
+    # Words for a number in [1, 999]. E.g. 387 -> "τριακόσια ογδονταεφτά"
+    hundreds, rest = divmod(number, 100)
+    if hundreds == 0:
+        return _tens_words(rest, plural)
+    if rest == 0:
+        return _prefixes['3digit'][str(number)]  # E.g. if we have 300 then just return "τριακόσια"
+    return _prefixes['3digit'][str(hundreds)] + " " + _tens_words(rest, plural)
+
+
+def _build_triad_table(form: str) -> tuple:
+    if form == "neuter":
+        return ("",) + tuple(_triad_words(number) for number in range(1, 1000))
+    if form == "feminine":
+        table = [""] + [_triad_words(number, plural=True) for number in range(1, 1000)]
+        table[1:10] = ["μία"] + [_plural_forms[str(digit)] for digit in range(2, 10)]
+        # Round hundreds: "διακόσια" -> "διακόσιες" (but "εκατό" stays as is)
+        for hundreds in range(2, 10):
+            table[hundreds * 100] = table[hundreds * 100][:-1] + "ες"
+        return tuple(table)
+    raise ValueError("Unknown triad form: {}. Use one of 'neuter' or 'feminine'.".format(form))
+
+
+def get_triad_table(form: str = "neuter") -> tuple:
+    """ Returns the words for every number from 0 to 999 in the requested form.
+        Args:
+            form: Either "neuter" (the default, e.g. "τρία") or "feminine"
+                  (the form that agrees with "χιλιάδες", e.g. "τρεις").
+        Returns:
+            A tuple of 1000 strings where the i-th element contains the words
+            for i. The element for 0 is the empty string.
+        Raises:
+            ValueError: If the form is not one of the above.
+    """
+    table = _triad_tables.get(form)
+    if table is None:
+        table = _triad_tables[form] = _build_triad_table(form)
+    return table
+
+
+def triad_words(number: int, form: str = "neuter") -> str:
+    """ Returns the words for an integer in the range [0, 999] (0 gives the empty string).
+        E.g. triad_words(4, "feminine") -> "τέσσερις"
+    """
+    return get_triad_table(form)[number]
+
+
+# --------------------------------- INFLECTION TABLES ----------------------------------
+# Cardinals that agree with the gender and the case of the following noun, e.g. "ένας άντρας",
+# "μιας γυναίκας", "τριών παιδιών". Only 1, 3, 4, the hundreds (200-900) and 1000 are inflected.
+GENDERS = ("masculine", "feminine", "neuter")
+CASES = ("nominative", "genitive", "accusative")
+
+# The (nominative, genitive, accusative) forms of each gender (masculine, feminine, neuter)
+_inflected_units = {
+    1: (("ένας", "ενός", "έναν"), ("μία", "μιας", "μία"), ("ένα", "ενός", "ένα")),
+    3: (("τρεις", "τριών", "τρεις"), ("τρεις", "τριών", "τρεις"), ("τρία", "τριών", "τρία")),
+    4: (("τέσσερις", "τεσσάρων", "τέσσερις"), ("τέσσερις", "τεσσάρων", "τέσσερις"),
+        ("τέσσερα", "τεσσάρων", "τέσσερα")),
+}
+_inflected_thousand = (("χίλιοι", "χιλίων", "χίλιους"), ("χίλιες", "χιλίων", "χίλιες"), ("χίλια", "χιλίων", "χίλια"))
+# The hundreds are inflected as adjectives, e.g. διακόσιοι, διακοσίων, διακόσιους
+_hundreds_endings = (("ιοι", "ίων", "ιους"), ("ιες", "ίων", "ιες"), ("ια", "ίων", "ια"))
+_unaccent = str.maketrans("άέήίόύώ", "αεηιουω")
+
+_Inflection = namedtuple("_Inflection", ["gender", "case", "units", "multipliers", "thousands_multipliers",
+                                         "one_thousand", "thousands", "scales", "one"])
+_inflections = {}
+
+
+def _inflected_tens(number: int, gender: int, case: int) -> str:
+    # Words for a number in [1, 99] in the given gender and case. E.g. 23 -> "εικοσιτριών" (genitive)
+    units = number % 10
+    if units not in _inflected_units or 10 <= number <= 12:
+        return _tens_words(number)
+    word = _inflected_units[units][gender][case]
+    if number < 10:
+        return word
+    if word.startswith("μ"):
+        return _tens_words(number - units) + " " + word  # E.g. είκοσι μία (instead of εικοσιμία)
+    if word == "τρεις":
+        word = "τρείς"  # The compounds are accented, e.g. δεκατρείς
+    return _prefixes['2digit'][str(number // 10)] + word
+
+
+def _inflected_triad_words(number: int, gender: int, case: int) -> str:
+    # Words for a number in [1, 999] in the given gender and case. E.g. 204 -> "διακόσιοι τέσσερις"
+    hundreds, rest = divmod(number, 100)
+    out = []
+    if hundreds == 1:
+        out.append(_prefixes['3digit']["100" if rest == 0 else "1"])  # εκατό is not inflected
+    elif hundreds:
+        stem = _prefixes['3digit'][str(hundreds * 100)][:-2]  # E.g. "διακόσ"
+        out.append((stem.translate(_unaccent) if case == 1 else stem) + _hundreds_endings[gender][case])
+    if rest:
+        out.append(_inflected_tens(rest, gender, case))
+    return " ".join(out)
+
+
+def _inflected_table(gender: str, case: str) -> tuple:
+    # The words for every number in [0, 999] in the given gender and case
+    if gender == "neuter" and case != "genitive":
+        # The accusative of the neuter is the same as its nominative, i.e. the default table
+        return get_triad_table("neuter")
+    table = _triad_tables.get((gender, case))
+    if table is None:
+        g, c = GENDERS.index(gender), CASES.index(case)
+        table = ("",) + tuple(_inflected_triad_words(number, g, c) for number in range(1, 1000))
+        _triad_tables[(gender, case)] = table
+    return table
+
+
+def _build_inflection(gender: str, case: str) -> _Inflection:
+    if gender not in GENDERS or case not in CASES:
+        raise ValueError("Unknown gender or case: {}, {}. Use one of {} and one of {}.".format(
+            gender, case, ", ".join(GENDERS), ", ".join(CASES)))
+    g, c = GENDERS.index(gender), CASES.index(case)
+    units = _inflected_table(gender, case)
+    if gender == "neuter" and case == "nominative":
+        # The default form keeps the words of the default output (e.g. εικοσιένα χιλιάδες)
+        thousands_multipliers = get_triad_table("feminine")
+    else:
+        # "χιλιάδες" is a feminine noun, so its multiplier is feminine (e.g. διακόσιες μία χιλιάδες)
+        thousands_multipliers = _inflected_table("feminine", case)
+        if case != "genitive":
+            thousands_multipliers = thousands_multipliers[:2] + (_plural_forms["2"],) + thousands_multipliers[3:]  # δυο
+    if case == "genitive":
+        multipliers = _inflected_table("neuter", case)
+        thousands = "χιλιάδων"
+        # E.g. "εκατομμύριο" -> "εκατομμυρίου" and "εκατομμύρια" -> "εκατομμυρίων"
+        scales = tuple((singular[:-4] + "υρίου", singular[:-4] + "υρίων") for singular, _ in _scale_words)
+    else:
+        # The scale words are neuter nouns and the nominative and the accusative of their
+        #  multipliers are the same, so the default table is used.
+        multipliers = get_triad_table("neuter")
+        thousands = "χιλιάδες"
+        scales = _scale_words
+    return _Inflection(gender, case, units, multipliers, thousands_multipliers,
+                       _inflected_thousand[g][c], thousands, scales, _inflected_units[1][2][c])
+
+
+def get_inflection(gender: str = "neuter", case: str = "nominative") -> _Inflection:
+    """ Returns the (lazily built) tables for the cardinals of the given gender and case.
+        Args:
+            gender: One of "masculine", "feminine" or "neuter" (the default).
+            case: One of "nominative" (the default), "genitive" or "accusative".
+        Returns:
+            A named tuple whose `units` field contains the words for every number from 0 to
+            999 in the requested form (e.g. get_inflection("masculine", "accusative").units[201]
+            == "διακόσιους έναν") while the rest of the fields contain the words of the
+            thousands and of the larger scales in the same case.
+        Raises:
+            ValueError: If the gender or the case is not one of the above.
+    """
+    inflection = _inflections.get((gender, case))
+    if inflection is None:
+        inflection = _inflections[(gender, case)] = _build_inflection(gender, case)
+    return inflection
+
+
+# ----------------------------------- ORDINAL TABLES -----------------------------------
+# The stems of the ordinals (without their suffix). A suffix is appended to every word of an
+# ordinal, e.g. 23η -> "εικοστή τρίτη". The stems without an accent take the accented suffix
+# (εικοστ + ος -> εικοστός) while the others keep it as is (τρίτ + ος -> τρίτος).
+_ordinal_units = {
+    1: "πρώτ",
+    2: "δεύτερ",
+    3: "τρίτ",
+    4: "τέταρτ",
+    5: "πέμπτ",
+    6: "έκτ",
+    7: "έβδομ",
+    8: "όγδο",
+    9: "ένατ",
+}
+
+_ordinal_tens = {
+    2: "εικοστ",
+    3: "τριαντακοστ",
+    4: "τεσσαρακοστ",
+    5: "πεντηκοστ",
+    6: "εξηκοστ",
+    7: "εβδομηκοστ",
+    8: "ογδοηκοστ",
+    9: "ενενηκοστ",
+}
+
+_ordinal_hundreds = {
+    1: "εκατοστ",
+    2: "διακοσιοστ",
+    3: "τριακοσιοστ",
+    4: "τετρακοσιοστ",
+    5: "πεντακοσιοστ",
+    6: "εξακοσιοστ",
+    7: "εφτακοσιοστ",
+    8: "οχτακοσιοστ",
+    9: "εννιακοσιοστ",
+}
+
+# 1000, 2000, ..., 10000 (other multiples of 1000 are read as e.g. "είκοσι χιλιοστός")
+_ordinal_thousands = {
+    1: "χιλιοστ",
+    2: "δισχιλιοστ",
+    3: "τρισχιλιοστ",
+    4: "τετρακισχιλιοστ",
+    5: "πεντακισχιλιοστ",
+    6: "εξακισχιλιοστ",
+    7: "επτακισχιλιοστ",
+    8: "οκτακισχιλιοστ",
+    9: "εννεακισχιλιοστ",
+    10: "δεκακισχιλιοστ",
+}
+
+# The stems of the scale words of _scale_words (10^6, 10^9, ..., 10^33)
+_ordinal_scales = (
+    "εκατομμυριοστ",
+    "δισεκατομμυριοστ",
+    "τρισεκατομμυριοστ",
+    "τετράκις εκατομμυριοστ",
+    "πεντάκις εκατομμυριοστ",
+    "εξάκις εκατομμυριοστ",
+    "επτάκις εκατομμυριοστ",
+    "οκτάκις εκατομμυριοστ",
+    "εννεάκις εκατομμυριοστ",
+    "δεκάκις εκατομμυριοστ",
+)
+
+# The accented suffixes. Other spellings (e.g. in capitals) go through _accents,
+#  which accents every lower case vowel.
+_accented_suffixes = {
+    "ος": "ός",
+    "ες": "ές",
+    "ο": "ό",
+    "η": "ή",
+    "α": "ά",
+    "οι": "οί",
+}
+_accents = str.maketrans("αεηιουω", "άέήίόύώ")
+
+_ordinal_tables = {}
+
+
+def accented_suffix(suffix: str) -> str:
+    """ Returns the suffix that follows an ordinal stem without an accent (e.g. "ος" -> "ός"). """
+    return _accented_suffixes.get(suffix) or suffix.translate(_accents)
+
 
-# For 10, 11, 12, 20, 30, 40, ..., 90 take the prefixes from the 2 digit pronunciations
-#   and convert them to 10000, 11000, 12000, 20000, ..., 90000
-_prefixes['5digit'] = {key + "000": val + " χιλιάδες" for key, val in _prefixes['2digit'].items() if len(key) > 1}
+def _ordinal_triad_stems(number: int) -> list:
+    # The (stem, takes the accented suffix) pairs of a number in [1, 999]
+    hundreds, rest = divmod(number, 100)
+    stems = [(_ordinal_hundreds[hundreds], True)] if hundreds else []
+    tens, units = divmod(rest, 10)
+    if 10 <= rest <= 12:
+        stems.append((_triad_words(rest) + "τ", False))  # δέκατ, έντεκατ, δώδεκατ
+        return stems
+    if tens == 1:
+        stems.append(("δέκατ", False))  # E.g. 13 -> δέκατος τρίτος
+    elif tens:
+        stems.append((_ordinal_tens[tens], True))
+    if units:
+        stems.append((_ordinal_units[units], False))
+    return stems
 
-# Update for 6 digits. Replace "διακόσια" with "διακόσιες" in order to bring to plural form
-_prefixes['6digit'] = {key + "000": val[:-2] + "ιες" + " χιλιάδες" for key, val in _prefixes['3digit'].items()}
 
+def get_ordinal_table(suffix: str) -> tuple:
+    """ Returns the ordinals of every number from 0 to 999 with the given suffix.
+        Args:
+            suffix: The suffix of the ordinals, e.g. "ος", "η", "ο", "οι", "ες" or "α".
+        Returns:
+            A tuple of 1000 strings where the i-th element contains the ordinal of i,
+            e.g. get_ordinal_table("η")[23] == "εικοστή τρίτη". The element for 0 is the
+            empty string.
+    """
+    table = _ordinal_tables.get(suffix)
+    if table is None:
+        accented = accented_suffix(suffix)
+        table = ("",) + tuple(" ".join(stem + (accented if accent else suffix)
+                                       for stem, accent in _ordinal_triad_stems(number))
+                              for number in range(1, 1000))
+        _ordinal_tables[suffix] = table
+    return table
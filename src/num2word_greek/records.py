@@ -0,0 +1,232 @@
+# MIT License
+#
+# Copyright (c) [year] [fullname]
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+""" Structured record formats. Only the selected fields of each record are converted while
+    the rest of the line (IDs, other columns, the JSON syntax, the separators) is kept
+    byte for byte. The records are read one line at a time, like the plain text.
+        - "kaldi": Kaldi `text` files (`<utterance id> <transcript>`). The transcript is converted.
+        - "tsv": Tab separated columns (selected by their index or, with a header, their name).
+        - "csv": Comma separated columns, which may be quoted ("..." with "" for a quote).
+        - "jsonl": One JSON object per line. The string values of the selected keys are
+                   converted (nested keys are separated by dots, e.g. "meta.title").
+"""
+
+import json
+import re
+from functools import partial
+
+
+RECORD_FORMATS = ("text", "kaldi", "tsv", "csv", "jsonl")
+
+_kaldi = re.compile(r"(\S+\s+)(.*)", re.DOTALL)
+_csv_field = re.compile(r'"(?:[^"]|"")*"|[^,]*')
+_csv_special = re.compile(r'[",\r\n]')
+_json_whitespace = re.compile(r"[ \t\n\r]*")
+_json_decoder = json.JSONDecoder()
+
+
+def convert_records(lines, convert, record_format: str, fields=None, header: bool = False, on_error=None):
+    """ Lazily converts the selected fields of each record.
+        Args:
+            lines: Any iterable of lines (with or without their line endings).
+            convert: The function which converts the text of a field (e.g. convert_sentence).
+            record_format: One of "kaldi", "tsv", "csv" or "jsonl".
+            fields: The fields to convert. Column indices (starting from 0) or names (if there is
+                    a header) for "tsv"/"csv" and keys for "jsonl" (default: "text"). Not used
+                    for "kaldi".
+            header: Whether the first line of a "tsv"/"csv" file contains the names of the
+                    columns. It is not converted.
+            on_error: Called with the line (without its ending) and the exception if a record
+                      cannot be converted. It returns the line to write instead (or raises).
+                      By default the exception is raised.
+        Returns:
+            A generator of the converted lines. Each of them keeps its line ending (or ends
+            with "\n" if it had none) and blank lines are kept as they are.
+        Raises:
+            ValueError: If the format or the fields are not valid, or a line of a "jsonl"
+                        file is not a JSON object.
+    """
+    converter = _format_converter(record_format, fields, convert)
+    for body, ending in _csv_records(lines) if record_format == "csv" else _split_endings(lines):
+        if converter is None:
+            names = _split_columns(body, record_format) if header else None
+            converter = partial(_convert_columns, record_format=record_format,
+                                indices=_column_indices(fields, names), convert=convert)
+            if header:
+                yield body + ending
+                continue
+        yield _convert_record(body, converter, on_error) + ending
+
+
+def _format_converter(record_format: str, fields, convert):
+    # The function which converts the body of a record. None for tsv/csv, since their columns may be
+    #  named in the header (see convert_records).
+    if record_format == "kaldi":
+        return partial(_convert_kaldi, convert=convert)
+    if record_format in ("tsv", "csv"):
+        if not fields:
+            raise ValueError("The columns to convert must be given for the {} format.".format(record_format))
+        return None
+    if record_format == "jsonl":
+        paths = [field.split(".") for field in (fields or ["text"])]
+        return partial(_convert_json, paths=paths, convert=convert)
+    raise ValueError("Unknown record format: {}. Use one of {}.".format(
+        record_format, ", ".join(RECORD_FORMATS[1:])))
+
+
+def _split_endings(lines):
+    # (body, line ending) pairs. A line without an ending gets "\n".
+    for line in lines:
+        body = line.rstrip("\r\n")
+        yield body, line[len(body):] or "\n"
+
+
+def _csv_records(lines):
+    # The same as _split_endings, except that the lines of a record with a quoted newline are joined
+    pending = None  # The first lines of a record with a quoted newline
+    for body, ending in _split_endings(lines):
+        if pending is not None or body.count('"') % 2:
+            pending = body if pending is None else pending + "\n" + body
+            if pending.count('"') % 2:
+                continue  # The record continues in the next line
+            body, pending = pending, None
+        yield body, ending
+    if pending is not None:
+        raise ValueError("The last record of the csv file has an unterminated quote.")
+
+
+def _convert_record(body: str, converter, on_error) -> str:
+    if not body.strip():
+        return body  # Blank lines are kept as they are
+    if on_error is None:
+        return converter(body)
+    try:
+        return converter(body)
+    except Exception as e:
+        return on_error(body, e)
+
+
+def _convert_kaldi(body: str, convert) -> str:
+    match = _kaldi.fullmatch(body)
+    if match is None:
+        return body  # Only an utterance ID
+    return match.group(1) + convert(match.group(2))
+
+
+def _split_columns(body: str, record_format: str) -> list:
+    if record_format == "tsv":
+        return body.split("\t")
+    # The fields of a csv line, still quoted. A field starts at the beginning of the line or after a comma.
+    columns = []
+    position = 0
+    while True:
+        match = _csv_field.match(body, position)
+        columns.append(match.group())
+        position = match.end()
+        if position >= len(body) or body[position] != ",":
+            return columns
+        position += 1
+
+
+def _unquote(column: str) -> str:
+    if len(column) >= 2 and column[0] == column[-1] == '"':
+        return column[1:-1].replace('""', '"')
+    return column
+
+
+def _quote(text: str) -> str:
+    return '"' + text.replace('"', '""') + '"'
+
+
+def _column_indices(fields, names) -> set:
+    indices = set()
+    for field in fields:
+        if isinstance(field, int) or field.isdigit():
+            indices.add(int(field))
+        elif names is not None and field in [_unquote(name) for name in names]:
+            indices.add([_unquote(name) for name in names].index(field))
+        else:
+            raise ValueError("Unknown column: {}. Use a column index or a name of the header.".format(field))
+    return indices
+
+
+def _convert_columns(body: str, record_format: str, indices: set, convert) -> str:
+    columns = _split_columns(body, record_format)
+    for index in indices:
+        if index >= len(columns):
+            continue  # A short row
+        if record_format == "tsv":
+            columns[index] = convert(columns[index])
+            continue
+        column = columns[index]
+        text = convert(_unquote(column))
+        columns[index] = _quote(text) if column[:1] == '"' or _csv_special.search(text) else text
+    return ("\t" if record_format == "tsv" else ",").join(columns)
+
+
+def _convert_json(body: str, paths: list, convert) -> str:
+    index = _json_whitespace.match(body).end()
+    if body[index:index + 1] != "{":
+        raise ValueError("Expected a JSON object in: {}".format(body))
+    out = []
+    end = _convert_json_object(body, index, paths, convert, out)
+    if body[_json_whitespace.match(body, end).end():]:
+        raise ValueError("Extra data after the JSON object in: {}".format(body))
+    out.append(body[end:])
+    return "".join(out)
+
+
+def _convert_json_object(body: str, index: int, paths: list, convert, out: list) -> int:
+    """ Scans the JSON object which starts at body[index] ("{") and appends it to out, with the
+        string values of the paths converted. Returns the index after the object.
+    """
+    start = index  # The beginning of the text which has not been appended to out
+    index = _json_whitespace.match(body, index + 1).end()
+    if body[index:index + 1] == "}":
+        out.append(body[start:index + 1])
+        return index + 1
+    while True:
+        if body[index:index + 1] != '"':
+            raise ValueError("Expected a key at position {} of: {}".format(index, body))
+        key, index = json.decoder.scanstring(body, index + 1)
+        index = _json_whitespace.match(body, index).end()
+        if body[index:index + 1] != ":":
+            raise ValueError("Expected ':' at position {} of: {}".format(index, body))
+        index = _json_whitespace.match(body, index + 1).end()
+        selected = [path[1:] for path in paths if path[0] == key]
+        if [] in selected and body[index:index + 1] == '"':
+            value, end = json.decoder.scanstring(body, index + 1)
+            out.append(body[start:index])
+            out.append(json.dumps(convert(value), ensure_ascii=False))
+            start = index = end
+        elif selected and body[index:index + 1] == "{":
+            out.append(body[start:index])
+            index = start = _convert_json_object(body, index, [path for path in selected if path], convert, out)
+        else:
+            _, index = _json_decoder.raw_decode(body, index)  # Skip any other value
+        index = _json_whitespace.match(body, index).end()
+        if body[index:index + 1] == "}":
+            out.append(body[start:index + 1])
+            return index + 1
+        if body[index:index + 1] != ",":
+            raise ValueError("Expected ',' or '}}' at position {} of: {}".format(index, body))
+        index = _json_whitespace.match(body, index + 1).end()
@@ -0,0 +1,306 @@
+# MIT License
+#
+# Copyright (c) [year] [fullname]
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+""" A registry of the rules which convert the spans of a sentence (see convert_sentence).
+    Each rule has a regular expression and a handler which returns the replacement of each
+    match. All the patterns are compiled into a single alternation of named groups, so a
+    sentence is scanned once, no matter how many rules are registered. At each position the
+    rules are tried in order of (descending) priority and then of registration, and the first
+    one that matches wins. The built-in conversions (numbers, hours, commas, ordinals) are the
+    default rules, e.g. in order to read 25% as "εικοσιπέντε τοις εκατό":
+
+        from num2word_greek.convert_numbers import convert_numbers
+        from num2word_greek.rules import register_rule
+
+        register_rule("percent", r"(?<!\\S)(?P<percent_value>\\d+)%",
+                      lambda match: " " + convert_numbers(match.group("percent_value")) + " τοις εκατό ")
+"""
+
+import itertools
+import re
+from collections import namedtuple
+
+
+class Rule(namedtuple("Rule", ["name", "pattern", "handler", "priority"])):
+    """ A conversion rule.
+        Args:
+            name: The name of the rule. It must be a valid (and unique) name of a regex group.
+            pattern: The regular expression of the spans to convert. The names of its groups
+                     must not be used by any other rule. Only named groups are supported
+                     (e.g. (?P<value>\\d+) and (?P=value)), since the patterns of all the rules
+                     are joined and the groups are renumbered.
+            handler: A function which takes the match and returns the replacement of the span.
+                     The whitespace of the sentence is normalized afterwards, so a replacement
+                     may be surrounded by spaces in order to separate it from the text around it.
+            priority: Rules with a higher priority are tried first at each position of the sentence.
+    """
+    __slots__ = ()
+
+
+# The priorities of the default rules are between 10 and 40, so the other rules are tried first by default
+DEFAULT_PRIORITY = 100
+
+# The kinds of the tokens (see the tokens module): the built-in kinds, followed by the names of the
+#  registered rules. A rule gets its code when it is registered and the list is only appended to,
+#  so the codes never change.
+KINDS = ["text", "integer", "decimal", "time", "ordinal"]
+_kind_codes = {kind: code for code, kind in enumerate(KINDS)}
+
+_registry = {}  # Name -> (rule, registration order)
+_defaults = {}  # Name -> the default rule (set by numbers2words)
+_order = itertools.count()
+_never = re.compile(r"(?!)")
+
+# The compiled rules, used by convert_sentence. They are replaced at once, so that a sentence which is
+#  converted while a rule is registered (e.g. by another thread) uses either the old or the new rules.
+#   - scanner: The alternation of the patterns of all the rules.
+#   - convert: Calls the handler of the rule of a match of the scanner.
+#   - handlers: Name -> handler.
+#   - custom: Whether the rules differ from the default ones.
+_Compiled = namedtuple("_Compiled", ["scanner", "convert", "handlers", "custom"])
+_compiled = _Compiled(_never, None, {}, False)
+
+
+def register_rule(name: str, pattern: str, handler, priority: int = DEFAULT_PRIORITY, replace: bool = False):
+    """ Registers a rule (see Rule) which will be applied by convert_sentence.
+        Args:
+            name: The name of the rule. E.g. "currency".
+            pattern: The regular expression of the rule. It must not match the empty string.
+            handler: The function which converts each match.
+            priority: Rules with higher priority are tried first at each position. Rules with the
+                      same priority are tried in the order of their registration.
+            replace: Whether to replace a rule with the same name (e.g. one of the default rules
+                     "literal", "hours", "commas", "ordinal" and "integer"). It keeps its position
+                     among the rules of the same priority.
+        Raises:
+            ValueError: If the name is taken (and replace is False) or is not a valid group name,
+                        or the pattern is invalid, matches the empty string or has numbered
+                        groups or backreferences (e.g. (\\d+) or \\1).
+    """
+    if not name.isidentifier():
+        raise ValueError("Invalid rule name: {}. It must be a valid identifier.".format(name))
+    if name in _registry and not replace:
+        raise ValueError("There is already a rule named {}. Use replace=True to replace it.".format(name))
+    _check_pattern(name, pattern)
+    if name not in _kind_codes:
+        _kind_codes[name] = len(KINDS)
+        KINDS.append(name)
+    previous = _registry.get(name)
+    _registry[name] = (Rule(name, pattern, handler, priority), previous[1] if previous else next(_order))
+    try:
+        _compile()
+    except re.error as e:  # E.g. a group name which is used by another rule
+        if previous is None:
+            del _registry[name]
+        else:
+            _registry[name] = previous
+        _compile()
+        raise ValueError("Cannot add the rule {}: {}".format(name, e))
+
+
+def _check_pattern(name: str, pattern: str):
+    try:
+        compiled = re.compile(pattern)
+    except re.error as e:
+        raise ValueError("Invalid pattern for the rule {}: {}".format(name, e))
+    if compiled.match("") is not None:
+        raise ValueError("The pattern of the rule {} matches the empty string.".format(name))
+    if compiled.groups > len(compiled.groupindex) or _has_numbered_reference(pattern):
+        # The numbers of the groups change once the pattern is joined with the others (see _compile)
+        raise ValueError("The pattern of the rule {} has numbered groups or backreferences. Use named "
+                         "groups instead, e.g. (?P<value>...) or (?:...) and (?P=value).".format(name))
+
+
+def unregister_rule(name: str):
+    """ Removes a rule (it may also be one of the default rules).
+        Raises:
+            KeyError: If there is no rule with this name.
+    """
+    del _registry[name]
+    _compile()
+
+
+def get_rules() -> list:
+    """ Returns the registered rules in the order in which they are tried. """
+    return [rule for rule, _ in sorted(_registry.values(), key=_sort_key)]
+
+
+def reset_rules():
+    """ Removes every rule which is not a default one and restores the default rules. """
+    _registry.clear()
+    for rule in _defaults.values():
+        _registry[rule.name] = (rule, next(_order))
+    _compile()
+
+
+def _sort_key(item: tuple) -> tuple:
+    rule, order = item
+    return -rule.priority, order
+
+
+def _set_default_rules(rules: list):
+    # Called by numbers2words (also when the number format changes). The default rules which
+    #  were removed or replaced by the user stay so.
+    global _defaults
+    for rule in rules:
+        current = _registry.get(rule.name)
+        if current is None and rule.name not in _defaults:
+            _registry[rule.name] = (rule, next(_order))
+        elif current is not None and current[0] == _defaults.get(rule.name):
+            _registry[rule.name] = (rule, current[1])
+    _defaults = {rule.name: rule for rule in rules}
+    _compile()
+
+
+# Most rules start at the beginning of a word. They share a single check of it, see _compile.
+_word_start = r"(?<!\S)"
+_special = set(".^$*+?{}[]\\|()")
+_quantifiers = set("*+?{")
+
+
+def _literal_prefix(pattern: str) -> tuple:
+    """ Splits a pattern into its literal prefix and the rest, e.g. r"€(?P<x>\\d+)" -> (["€"], r"(?P<x>\\d+)").
+        A leading (?<!\\S) is a single (zero width) item of the prefix. Patterns with a top level "|"
+        have no prefix.
+    """
+    if _has_top_level_alternation(pattern):
+        return [], pattern
+    prefix = []
+    index = 0
+    if pattern.startswith(_word_start):
+        prefix.append(_word_start)
+        index = len(_word_start)
+    while index < len(pattern):
+        character, end = pattern[index], index + 1
+        if character == "\\" and index + 1 < len(pattern) and not pattern[index + 1].isalnum():
+            character, end = pattern[index + 1], index + 2  # An escaped symbol, e.g. \\.
+        elif character in _special:
+            break
+        if end < len(pattern) and pattern[end] in _quantifiers:
+            break  # E.g. the "a" of "ab?" is a prefix but the "b" is not
+        prefix.append(character)
+        index = end
+    if prefix[:1] == [_word_start] and len(prefix) > 1:
+        # Start with the character instead, so that the rule can be merged with the others that start
+        #  with it, and check that it is the first character of a word right after it.
+        prefix[:2] = [prefix[1], r"(?<!\S" + re.escape(prefix[1]) + ")"]
+    return prefix, pattern[index:]
+
+
+def _has_top_level_alternation(pattern: str) -> bool:
+    depth = 0
+    in_class = False
+    index = 0
+    while index < len(pattern):
+        character = pattern[index]
+        if character == "\\":
+            index += 1  # Skip the escaped character
+        elif in_class:
+            in_class = character != "]"
+        elif character == "[":
+            in_class = True
+            if pattern[index + 1:index + 2] == "^":
+                index += 1
+            if pattern[index + 1:index + 2] == "]":
+                index += 1  # A "]" right after "[" (or "[^") is a literal
+        elif character == "(":
+            depth += 1
+        elif character == ")":
+            depth -= 1
+        elif character == "|" and depth == 0:
+            return True
+        index += 1
+    return False
+
+
+def _has_numbered_reference(pattern: str) -> bool:
+    # A backreference to a numbered group (\1 to \99, which are octal escapes in a character class)
+    #  or a conditional on one, e.g. (?(1)a|b)
+    in_class = False
+    index = 0
+    while index < len(pattern):
+        character = pattern[index]
+        if character == "\\":
+            if not in_class and "1" <= pattern[index + 1:index + 2] <= "9":
+                return True
+            index += 1  # Skip the escaped character
+        elif in_class:
+            in_class = character != "]"
+        elif character == "[":
+            in_class = True
+            if pattern[index + 1:index + 2] == "^":
+                index += 1
+            if pattern[index + 1:index + 2] == "]":
+                index += 1  # A "]" right after "[" (or "[^") is a literal
+        elif pattern.startswith("(?(", index) and pattern[index + 3:index + 4].isdigit():
+            return True
+        index += 1
+    return False
+
+
+def _alternation(entries: list) -> str:
+    """ Builds the alternation of (prefix, rest, name) entries (in the order in which they must be
+        tried) as a trie of their literal prefixes, e.g. "€(?:5(?P<a>)|6(?P<b>))" instead of
+        "€5(?P<a>)|€6(?P<b>)". Only neighbouring entries are merged, and only when this cannot change
+        which of them matches first: entries which start with different characters cannot match at
+        the same position, while a zero width item (e.g. (?<!\\S)) is only merged with the same item.
+    """
+    branches = []
+    groups = {}  # The first item of the prefix -> the entries of the current run that start with it
+    for prefix, rest, name in entries + [(None, None, None)]:
+        first = prefix[0] if prefix else None
+        zero_width = first is not None and first.startswith("(?")
+        if groups and (first is None or (first not in groups if zero_width else
+                                         any(key.startswith("(?") for key in groups))):
+            for item, group in groups.items():  # The end of a run of entries which may be reordered
+                if len(group) == 1:
+                    branches.append(_escape(group[0][0]) + "(?:{})(?P<{}>)".format(*group[0][1:]))
+                else:
+                    branches.append(_escape([item]) + "(?:" + _alternation([(p[1:], r, n) for p, r, n in group]) + ")")
+            groups = {}
+        if first is not None:
+            groups.setdefault(first, []).append((prefix, rest, name))
+        elif name is not None:
+            branches.append("(?:{})(?P<{}>)".format(rest, name))
+    return "|".join(branches)
+
+
+def _escape(prefix: list) -> str:
+    return "".join(item if item.startswith("(?") else re.escape(item) for item in prefix)
+
+
+def _compile():
+    global _compiled
+    rules = get_rules()
+    # Each rule is followed by an empty group with its name, which tells which rule matched (it is
+    #  the last group to close). The literal prefixes of the rules are shared (see _alternation), so
+    #  the regex engine rejects all the rules which cannot match at a position with a few checks.
+    #  This keeps the cost of a scan (almost) independent of the number of rules.
+    scanner = re.compile(_alternation([_literal_prefix(rule.pattern) + (rule.name,) for rule in rules])) \
+        if rules else _never
+    handlers = {rule.name: rule.handler for rule in rules}
+
+    def convert(match):
+        return handlers[match.lastgroup](match)
+
+    custom = handlers.keys() != _defaults.keys() or any(rule != _defaults[rule.name] for rule in rules)
+    _compiled = _Compiled(scanner, convert, handlers, custom)
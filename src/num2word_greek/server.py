@@ -0,0 +1,276 @@
+# MIT License
+#
+# Copyright (c) [year] [fullname]
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+""" A long running conversion server, which avoids paying the start up cost of python for
+    every small job. Start it with:
+        python -m num2word_greek serve --socket /tmp/num2word.sock   (or --port 8765)
+    The protocol is newline delimited JSON. Each request is a single line with either a
+    "text" (single sentence) or a "texts" (list of sentences) field and an optional "id":
+        {"id": 1, "text": "Στις 10:15"}             -> {"id": 1, "text": "Στις δέκα και τέταρτο"}
+        {"id": 2, "texts": ["2 κιλά", "3 ευρώ"]}    -> {"id": 2, "texts": ["δύο κιλά", "τρία ευρώ"]}
+    Invalid requests get a response with an "error" field instead. The responses of a
+    connection are sent in the same order as its requests.
+"""
+
+import asyncio
+import json
+import os
+import signal
+import socket
+
+from num2word_greek.numbers2words import convert_sentence
+
+
+def _handle_request(line: bytes) -> bytes:
+    request_id = None
+    try:
+        request = json.loads(line)
+        if not isinstance(request, dict):
+            raise ValueError("The request must be a JSON object.")
+        request_id = request.get("id")
+        if "text" in request:
+            response = {"text": convert_sentence(request["text"])}
+        elif "texts" in request:
+            response = {"texts": [convert_sentence(text) for text in request["texts"]]}
+        else:
+            raise ValueError("The request must contain a 'text' or a 'texts' field.")
+    except Exception as e:
+        response = {"error": "{}: {}".format(type(e).__name__, e)}
+    response["id"] = request_id
+    return json.dumps(response, ensure_ascii=False).encode("utf-8") + b"\n"
+
+
+def _handle_batch(lines: list) -> list:
+    return [_handle_request(line) for line in lines]
+
+
+class Server:
+    """ Serves conversions over a unix domain socket (if socket_path is given) or a TCP port.
+        Args:
+            socket_path: Path of the unix domain socket to listen on.
+            host: The host to listen on when socket_path is not given.
+            port: The TCP port to listen on when socket_path is not given.
+            queue_size: Maximum number of requests waiting to be converted. When the queue
+                        is full the server stops reading from the connections (backpressure).
+            max_batch_size: Maximum number of requests converted by a single executor call.
+    """
+
+    def __init__(self, socket_path: str = None, host: str = "127.0.0.1", port: int = 8765,
+                 queue_size: int = 1024, max_batch_size: int = 64):
+        self.socket_path = socket_path
+        self.host = host
+        self.port = port
+        self.max_batch_size = max_batch_size
+        self.queue_size = queue_size
+        self._queue = None
+        self._server = None
+        self._stopping = None
+        self._readers = set()
+        self._connections = set()
+
+    async def start(self):
+        self._queue = asyncio.Queue(self.queue_size)
+        self._stopping = asyncio.Event()
+        if self.socket_path is not None:
+            if os.path.exists(self.socket_path):
+                os.remove(self.socket_path)  # Left over from a server that was killed
+            self._server = await asyncio.start_unix_server(self._handle_connection, path=self.socket_path)
+        else:
+            self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+            self.port = self._server.sockets[0].getsockname()[1]  # In case port was 0
+        self._worker = asyncio.ensure_future(self._convert_requests())
+
+    def stop(self):
+        """ Stops accepting connections and requests. The queued requests are still answered. """
+        self._stopping.set()
+
+    async def serve_forever(self):
+        await self.start()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, self.stop)
+            except (NotImplementedError, RuntimeError):  # e.g. on windows or outside the main thread
+                pass
+        await self._stopping.wait()
+        await self.shutdown()
+
+    async def shutdown(self):
+        """ Stops listening, answers the requests that were already received and closes the connections. """
+        self._stopping.set()
+        self._server.close()
+        for reader in list(self._readers):
+            reader.feed_eof()  # Stop reading more requests from the open connections
+        await self._queue.join()
+        if self._connections:
+            await asyncio.gather(*self._connections)
+        await self._server.wait_closed()
+        self._worker.cancel()
+        if self.socket_path is not None and os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+
+    async def _handle_connection(self, reader, writer):
+        # Each received line is queued together with a future for its response. The responses are
+        # written by a separate task in the order of the requests.
+        responses = asyncio.Queue()
+        sender = asyncio.ensure_future(self._send_responses(responses, writer))
+        self._readers.add(reader)
+        self._connections.add(sender)
+        try:
+            while not self._stopping.is_set():
+                line = await reader.readline()
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                future = asyncio.get_running_loop().create_future()
+                await responses.put(future)
+                await self._queue.put((line, future))  # Blocks while the queue is full
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass  # ValueError: a line longer than the limit of the stream reader
+        finally:
+            self._readers.discard(reader)
+            await responses.put(None)
+            await sender
+            self._connections.discard(sender)
+
+    async def _send_responses(self, responses, writer):
+        try:
+            while True:
+                future = await responses.get()
+                if future is None:
+                    break
+                writer.write(await future)
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def _convert_requests(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self.max_batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            try:
+                responses = await loop.run_in_executor(None, _handle_batch, [line for line, _ in batch])
+            except Exception as e:
+                error = json.dumps({"error": "{}: {}".format(type(e).__name__, e)}).encode("utf-8") + b"\n"
+                responses = [error] * len(batch)
+            for (_, future), response in zip(batch, responses):
+                if not future.done():
+                    future.set_result(response)
+                self._queue.task_done()
+
+
+def serve(socket_path: str = None, host: str = "127.0.0.1", port: int = 8765, queue_size: int = 1024,
+          max_batch_size: int = 64):
+    """ Runs a Server until it receives SIGINT or SIGTERM. """
+    server = Server(socket_path, host, port, queue_size, max_batch_size)
+    asyncio.run(server.serve_forever())
+
+
+class Client:
+    """ A tiny blocking client of the conversion server. If the server cannot be reached the
+        sentences are converted in this process instead (unless fallback is False).
+        Args:
+            socket_path: The unix domain socket of the server.
+            host: The host of the server (when socket_path is not given).
+            port: The TCP port of the server (when socket_path is not given).
+            timeout: Timeout (in seconds) of the socket operations.
+            fallback: Whether to convert in-process when the server is unavailable.
+    """
+
+    def __init__(self, socket_path: str = None, host: str = "127.0.0.1", port: int = 8765,
+                 timeout: float = 30.0, fallback: bool = True):
+        self.socket_path = socket_path
+        self.address = socket_path if socket_path is not None else (host, port)
+        self.timeout = timeout
+        self.fallback = fallback
+        self._sock = None
+        self._file = None
+        self._next_id = 0
+
+    def _connect(self):
+        family = socket.AF_UNIX if self.socket_path is not None else socket.AF_INET
+        sock = socket.socket(family, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(self.address)
+        except OSError:
+            sock.close()
+            raise
+        self._sock = sock
+        self._file = sock.makefile("rwb")
+
+    def _request(self, request: dict) -> dict:
+        if self._sock is None:
+            self._connect()
+        self._next_id += 1
+        request["id"] = self._next_id
+        try:
+            self._file.write(json.dumps(request, ensure_ascii=False).encode("utf-8") + b"\n")
+            self._file.flush()
+            line = self._file.readline()
+        except OSError:
+            self.close()
+            raise
+        if not line:
+            self.close()
+            raise ConnectionError("The server closed the connection.")
+        response = json.loads(line)
+        if "error" in response:
+            raise ValueError(response["error"])
+        return response
+
+    def convert(self, text: str) -> str:
+        """ Converts a single sentence (see numbers2words.convert_sentence). """
+        try:
+            return self._request({"text": text})["text"]
+        except OSError:
+            if not self.fallback:
+                raise
+            return convert_sentence(text)
+
+    def convert_batch(self, texts: list) -> list:
+        """ Converts many sentences with a single request. """
+        try:
+            return self._request({"texts": list(texts)})["texts"]
+        except OSError:
+            if not self.fallback:
+                raise
+            return [convert_sentence(text) for text in texts]
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+        if self._sock is not None:
+            self._sock.close()
+        self._sock = self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
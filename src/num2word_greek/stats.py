@@ -0,0 +1,168 @@
+# MIT License
+#
+# Copyright (c) [year] [fullname]
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+""" Opt-in instrumentation of convert_sentence. While enabled, every sentence records the
+    time spent (and the number of calls) in each stage of the conversion, the number of
+    tokens it had and the digit lengths of the numbers it converted. Use it like:
+        from num2word_greek import stats
+
+        with stats.collect_stats() as collected:
+            convert_sentence("Στις 10:15 θα αγοράσω 2 κιλά")
+        print(collected.as_dict())
+    or pass a hook (called with the statistics of each sentence) in order to forward
+    them to a metrics system. Instrumentation is disabled by default and then costs a
+    single attribute lookup per sentence.
+"""
+
+from collections import Counter
+from contextlib import contextmanager
+from time import perf_counter
+import threading
+
+
+# The stages of convert_sentence, in the order they are applied. Timings are exclusive,
+#  e.g. the time of "split_digits" does not include the conversion of the numbers it finds
+#  ("literals", the numbers with separators or signs, includes their conversion though).
+#  "rules" is the time spent in the handlers of the registered (non default) rules.
+STAGES = ("normalize", "scan", "literals", "commas", "hours", "ordinals", "split_digits", "numbers", "rules",
+          "cleanup")
+
+
+class ConversionStats:
+    """ Cumulative timings and counters of one or more converted sentences.
+        Attributes:
+            seconds: Stage name -> time spent in the stage (see STAGES).
+            calls: Stage name -> number of times the stage was run.
+            sentences: The number of converted sentences.
+            tokens: The number of (whitespace separated) tokens of the converted sentences.
+            numbers: Digit length -> number of integers of that length that were converted.
+            total_seconds: The total time spent in convert_sentence.
+    """
+
+    def __init__(self):
+        self.seconds = Counter()
+        self.calls = Counter()
+        self.sentences = 0
+        self.tokens = 0
+        self.numbers = Counter()
+        self.total_seconds = 0.0
+        self._nested = 0.0  # Time of the stages run by the current stage
+
+    def time(self, stage: str, func, *args):
+        """ Calls func(*args) and adds its duration (minus the duration of the stages it
+            ran itself) to the given stage.
+        """
+        outer, self._nested = self._nested, 0.0
+        start = perf_counter()
+        try:
+            return func(*args)
+        finally:
+            elapsed = perf_counter() - start
+            self.seconds[stage] += elapsed - self._nested
+            self.calls[stage] += 1
+            self._nested = outer + elapsed
+
+    def merge(self, other: "ConversionStats"):
+        """ Adds the timings and counters of other to these ones. """
+        self.seconds.update(other.seconds)
+        self.calls.update(other.calls)
+        self.sentences += other.sentences
+        self.tokens += other.tokens
+        self.numbers.update(other.numbers)
+        self.total_seconds += other.total_seconds
+
+    def as_dict(self) -> dict:
+        """ Returns the statistics as a (JSON serializable) dictionary. """
+        return {
+            "sentences": self.sentences,
+            "tokens": self.tokens,
+            "total_seconds": self.total_seconds,
+            "stages": {stage: {"seconds": self.seconds[stage], "calls": self.calls[stage]}
+                       for stage in STAGES if self.calls[stage]},
+            "numbers_by_digits": dict(sorted(self.numbers.items())),
+        }
+
+    def __repr__(self):
+        return "ConversionStats(sentences={}, tokens={}, total_seconds={:.6f})".format(
+            self.sentences, self.tokens, self.total_seconds)
+
+
+class _Collector:
+    # The statistics gathered while instrumentation is enabled and the hook to call per sentence
+    def __init__(self, hook=None):
+        self.stats = ConversionStats()
+        self.hook = hook
+        self._lock = threading.Lock()
+
+    def add(self, stats: ConversionStats):
+        with self._lock:
+            self.stats.merge(stats)
+        if self.hook is not None:
+            self.hook(stats)
+
+
+_collector = None
+
+
+def enable_stats(hook=None) -> ConversionStats:
+    """ Starts collecting statistics in every call of convert_sentence. Calling it again
+        replaces the current statistics with empty ones.
+        Args:
+            hook: An optional callable which will be called with the ConversionStats
+                  of each converted sentence (from the thread that converted it).
+        Returns:
+            The ConversionStats object which accumulates the statistics of all sentences.
+    """
+    global _collector
+    _collector = _Collector(hook)
+    return _collector.stats
+
+
+def disable_stats():
+    """ Stops collecting statistics. """
+    global _collector
+    _collector = None
+
+
+def get_stats():
+    """ Returns the statistics collected since enable_stats (None if they are disabled). """
+    collector = _collector
+    return None if collector is None else collector.stats
+
+
+@contextmanager
+def collect_stats(hook=None):
+    """ Collects statistics for the duration of a with block. The previous state
+        (enabled or disabled) is restored afterwards.
+        Args:
+            hook: See enable_stats.
+        Returns:
+            The ConversionStats of the sentences converted inside the block.
+    """
+    global _collector
+    previous = _collector
+    _collector = _Collector(hook)
+    try:
+        yield _collector.stats
+    finally:
+        _collector = previous
@@ -0,0 +1,212 @@
+# MIT License
+#
+# Copyright (c) [year] [fullname]
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+""" Converts a sentence to a stream of tokens which keep the span (the character offsets) of
+    the original sentence that each of them came from, e.g. for aligning audio, highlighting
+    the text or projecting labels:
+        tokens = convert_tokens("Στις  10:15 ήρθαν 2")
+        [(token.start, token.end, token.text, token.kind) for token in tokens]
+        # [(0, 4, 'Στις', 'text'), (6, 11, 'δέκα και τέταρτο', 'time'), (12, 17, 'ήρθαν', 'text'),
+        #  (18, 19, 'δύο', 'integer')]
+    The offsets, the kinds and the texts of the tokens are kept in arrays (a few bytes per token),
+    the Token tuples are only created when they are accessed.
+"""
+
+from array import array
+from collections import namedtuple
+
+import re
+
+from num2word_greek import numbers2words as _n2w
+from num2word_greek import rules as _rules
+
+
+# The kinds of the tokens. A token of a registered rule has the name of the rule as its kind
+#  (added to KINDS by rules.register_rule).
+KINDS = _rules.KINDS
+
+_words = re.compile(r"\S+")
+_decimal = re.compile(r"\d,\d")
+_ordinal = re.compile(r"\d+([^\W\d_]{1,2})")
+
+
+class Token(namedtuple("Token", ["start", "end", "text", "kind"])):
+    """ A token of a converted sentence. sentence[start:end] is the original text of the
+        token and `text` its converted text (a number may become more than one words).
+    """
+    __slots__ = ()
+
+
+class TokenStream:
+    """ The tokens of a converted sentence (see convert_tokens). It is a sequence of Token.
+        Args:
+            source: The original sentence.
+            text: The converted sentence (the same as numbers2words.convert_sentence).
+            lower: Whether the tokens which were not converted are lowercased.
+    """
+    __slots__ = ("source", "text", "_lower", "_spans", "_texts")
+
+    def __init__(self, source: str, text: str = "", lower: bool = False):
+        self.source = source
+        self.text = text
+        self._lower = lower
+        self._spans = array("I")  # The start, the end and the kind of each token
+        self._texts = []  # None if the text of the token is its span of the source
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def __getitem__(self, index: int) -> Token:
+        text = self._texts[index]
+        if index < 0:
+            index += len(self._texts)
+        start, end, kind = self._spans[3 * index:3 * index + 3]
+        if text is None:
+            text = self.source[start:end].lower() if self._lower else self.source[start:end]
+        return Token(start, end, text, KINDS[kind])
+
+    def __iter__(self):
+        for index in range(len(self._texts)):
+            yield self[index]
+
+    def __repr__(self) -> str:
+        return "TokenStream({!r}, {!r})".format(self.source, self.text)
+
+
+def convert_tokens(sentence: str, to_lower: bool = False) -> TokenStream:
+    """ Converts the numbers of a sentence (like numbers2words.convert_sentence) and keeps the
+        original span of each token.
+        Args:
+            sentence: The text to convert.
+            to_lower: Whether to lowercase the sentence before converting it.
+        Returns:
+            A TokenStream with a token per word of the sentence (or per converted span, e.g.
+            "10:15" -> "δέκα και τέταρτο"). Spans whose text is empty once converted
+            (e.g. a lone comma) have no token.
+    """
+    normalized, shift, offsets = _normalize(sentence, to_lower)
+    scanner, _, handlers, _ = _rules._compiled
+    tokens = TokenStream(sentence, lower=to_lower)
+    spans, texts = tokens._spans, tokens._texts
+    pieces = []  # The same pieces as scanner.sub(...) of convert_sentence
+    position = 0
+    for match in scanner.finditer(normalized):
+        start, end = match.span()
+        if start > position:
+            pieces.append(normalized[position:start])
+            _append_words(tokens, normalized, shift, offsets, position, start)
+        name = match.lastgroup
+        handler = handlers[name]
+        converted = handler(match)
+        pieces.append(converted)
+        text = " ".join(converted.split())
+        if text:
+            if offsets is None:
+                spans.extend((start + shift, end + shift, _kind(name, handler, match)))
+            else:
+                spans.extend((offsets[start], offsets[end - 1] + 1, _kind(name, handler, match)))
+            texts.append(text)
+        position = end
+    if position < len(normalized):
+        pieces.append(normalized[position:])
+        _append_words(tokens, normalized, shift, offsets, position, len(normalized))
+    tokens.text = _n2w._cleanup("".join(pieces)) if pieces else sentence
+    return tokens
+
+
+def _normalize(sentence: str, to_lower: bool) -> tuple:
+    # The same as numbers2words._normalize, together with the position in `sentence` of each of the
+    #  characters of the normalized sentence. Usually the normalized sentence is a part of the
+    #  sentence (e.g. without its newline), so the positions are just shifted (by `shift`).
+    #  Otherwise they are returned in `offsets`.
+    joiner, separators = _n2w._group_joiner, _n2w._space_separators
+    if not separators or not any(separator in sentence for separator in separators):
+        lowered = sentence.lower() if to_lower else sentence
+        normalized = " ".join(lowered.split())
+        shift = len(lowered) - len(lowered.lstrip())
+        if len(lowered) == len(sentence) and lowered.startswith(normalized, shift):
+            return normalized, shift, None
+        positions, joined = None, sentence
+    else:
+        # Remove the whitespace thousands separators (e.g. 1 000 000), keeping the positions of the rest
+        pieces, positions, last = [], [], 0
+        for match in joiner.finditer(sentence):
+            pieces.append(sentence[last:match.start()])
+            positions.extend(range(last, match.start()))
+            last = match.end()
+        pieces.append(sentence[last:])
+        positions.extend(range(last, len(sentence)))
+        joined = "".join(pieces)
+    words = []
+    offsets = array("I")
+    for match in _words.finditer(joined):
+        start, end = match.span()
+        word = match.group()
+        if offsets:
+            offsets.append(offsets[-1] + 1)  # The space between the words
+        span = range(start, end) if positions is None else positions[start:end]
+        if to_lower:
+            lowered = word.lower()
+            if len(lowered) != len(word):
+                # Some lowercase letters are longer (e.g. İ), all their characters have the position of the letter
+                span = [position for position, character in zip(span, word) for _ in character.lower()]
+            word = lowered
+        offsets.extend(span)
+        words.append(word)
+    return " ".join(words), 0, offsets
+
+
+def _append_words(tokens: TokenStream, normalized: str, shift: int, offsets, start: int, end: int):
+    # The words between two converted spans are text tokens
+    spans, texts = tokens._spans, tokens._texts
+    if offsets is None:
+        for match in _words.finditer(normalized, start, end):
+            spans.extend((match.start() + shift, match.end() + shift, 0))
+            texts.append(None)
+        return
+    source = tokens.source
+    for match in _words.finditer(normalized, start, end):
+        word = match.group()
+        first, last = offsets[match.start()], offsets[match.end() - 1] + 1
+        spans.extend((first, last, 0))
+        original = source[first:last]
+        texts.append(None if (original.lower() if tokens._lower else original) == word else word)
+
+
+def _kind(name: str, handler, match) -> int:
+    if handler is _n2w._convert_integer_span:
+        return 1
+    if handler is _n2w._convert_literal:
+        return 1 if match.group("fraction") is None else 2
+    if handler is _n2w._convert_ordinal:
+        return 4 if match.group("suffix").lower() in _n2w._ordinal_suffixes else 1
+    if handler is _n2w._convert_punctuated:
+        span = match.group()
+        if _n2w._digits.search(span) is None:
+            return 0
+        if ":" in span:
+            return 3
+        if _decimal.search(span) is not None:
+            return 2
+        ordinal = _ordinal.fullmatch(span.replace(",", ""))  # E.g. "2η,"
+        return 4 if ordinal is not None and ordinal.group(1).lower() in _n2w._ordinal_suffixes else 1
+    return _rules._kind_codes[name]
@@ -21,50 +21,76 @@
 # SOFTWARE.
 
 
-from num2word_greek.convert_numbers import convert_numbers
+from num2word_greek.cache import cached
+from num2word_greek.convert_numbers import _block_size, _convert_triads, _split_triads
+from num2word_greek.prefixes import (_ordinal_scales, _ordinal_thousands, accented_suffix, get_ordinal_table,
+                                     triad_words)
 import re
 
 
 def handle_commas(word: str, comma_symbol=",") -> str:
-    # If , (comma) is not between two numbers then erase it.
-    comma_index = word.find(comma_symbol)
-    while comma_index != -1:
-        if comma_index == 0:
-            word = word[1:]
-        elif comma_index == len(word) - 1:  # if it is the last character
-            if word[comma_index-1].isdigit():
-                word = word.replace(comma_symbol, " κόμμα")  # e.g. if word=102, then we expect another digit after that
-            else:
-                word = word.replace(comma_symbol, "")
-        else:
-            word = re.sub(r"\s+", " ", word)
-            # --------------- Start ignore spaces ---------------
-            # So, for example, if word == 102 , 98 then convert it to 102, 98 and then to 102,98 (remove spaces)
-            if word[comma_index-1] == " ":
-                word = word[:comma_index-1] + word[comma_index:]
-                comma_index -= 1  # The index went one place back
-            try:
-                if word[comma_index+1] == " ":
-                    word = word[:comma_index+1] + word[comma_index+2:]
-            except IndexError:
-                pass
-            # ----------------- End ignore spaces ----------------
-            try:
-                # Check left and right if they are digits
-                if word[comma_index-1].isdigit() and word[comma_index+1].isdigit():
-                    # if word=2,98 then convert it to δυο κόμμα ενενήντα οχτώ (keep the comma since it is pronounced)
-                    word = word[:comma_index] + " κόμμα " + word[comma_index+1:]
-                else:
-                    # Otherwise, delete the comma
-                    word = word[:comma_index] + " " + word[comma_index+1:]
-            except IndexError:
-                # Otherwise, delete the comma
-                word = word[comma_index-1]
-                break
-        comma_index = word.find(comma_symbol)
-    return word
+    # If , (comma) is not between two numbers then erase it. The word is scanned once, from left
+    #  to right, and the output is built in a list (the text before the current comma).
+    #   - A comma between two digits is pronounced: 2,98 -> 2 κόμμα 98
+    #   - Spaces around a comma are ignored: 102 , 98 -> 102 κόμμα 98
+    #   - A comma after the last digit of the word is pronounced too (we expect another digit after it)
+    #   - Every other comma is replaced by a space (or removed if it is the first/last character)
+    if comma_symbol not in word:
+        return word
+    if _whitespace.search(word) is not None:
+        word = _whitespace.sub(" ", word)
+    out = []
+    start = 0
+    while True:
+        comma_index = word.find(comma_symbol, start)
+        if comma_index == -1:
+            out.append(word[start:])
+            break
+        if comma_index > start:
+            out.append(word[start:comma_index])
+        start = comma_index + len(comma_symbol)
+        if not out:
+            continue  # The first character, just drop it
+        start = _replace_comma(word, start, out, comma_symbol)
+        if start == -1:
+            break
+    return "".join(out)
+
+
+def _replace_comma(word: str, start: int, out: list, comma_symbol: str) -> int:
+    # Appends the replacement of a comma (which ends at `start` and follows the text of out) to out.
+    #  Returns the position of the text after the comma, or -1 if there is nothing else to read.
+    end = len(word)
+    if start == end:  # if it is the last character
+        if out[-1][-1].isdigit():
+            out.append(" κόμμα")  # e.g. if word=102, then we expect another digit after that
+        return -1
+    # So, for example, if word == 102 , 98 then convert it to 102,98 (ignore the spaces)
+    if out[-1][-1] == " ":
+        out[-1] = out[-1][:-1]
+        if not out[-1]:
+            out.pop()
+    # The character before the comma (the last one of the word if the comma became the first one)
+    before = out[-1][-1] if out else word[-1]
+    if word[start] == " ":
+        start += 1
+        if start == end and before.isdigit():
+            # Nothing after the comma, keep only the character before it
+            out[:] = [out[-1][-1] if out else comma_symbol]
+            return -1
+    if before.isdigit() and start < end and word[start].isdigit():
+        # if word=2,98 then convert it to δυο κόμμα ενενήντα οχτώ (keep the comma since it is pronounced)
+        out.append(" κόμμα ")
+    else:
+        # Otherwise, delete the comma
+        out.append(" ")
+    return start
+
 
+_whitespace = re.compile(r"\s+")
 
+
+@cached
 def handle_hours(word: str):
     # We will assume that the word is an hour if it contains a ":"
     # For example, convert 10:45 to 10 και 45
@@ -77,100 +103,89 @@ def handle_hours(word: str):
     if len(parts) != 2 or "" in parts:
         # Just ignore the ':'
         return word
+    hour, minutes = parts
     try:
-        if int(parts[0]) < 1 or int(parts[0]) > 12:
+        if int(hour) < 1 or int(hour) > 12:
             # then it is not an hour
             return word
-    except Exception as e:
-        # print("Exception:", e)
+    except ValueError:
         pass
-    word = re.sub(":", " και ", word)
-    if parts[0] == "1": word = re.sub("1", "μία", word[0]) + word[1:]
-    elif parts[0] == "3": word = re.sub("3", "τρείς", word[0]) + word[1:]
-    elif parts[0] == "4": word = re.sub("4", "τέσσερις", word[0]) + word[1:]
-    if parts[1] == "15":
-        word = re.sub("15", "τέταρτο", word)
-    elif parts[1] == "30":
-        word = re.sub("30", "μισή", word)
-    return word
-
-
-_standard_ordinals = {
-    1: "πρώτ",
-    2: "δεύτερ",
-    3: "τρίτ",
-    4: "τέταρτ",
-    5: "πέμπτ",
-    6: "έκτ",
-    7: "έβδομ",
-    8: "όγδο",
-    9: "ένατ",
-    20: "εικοστ",
-    30: "τριαντακοστ",
-    40: "τεσσαρακοστ",
-    50: "πεντηκοστ",
-    60: "εξηκοστ",
-    70: "εβδομηκοστ",
-    80: "ογδοηκοστ",
-    90: "ενενηκοστ",
-    100: "εκατοστ",
-    200: "διακοσιοστ",
-    300: "τριακοσιοστ",
-    400: "τετρακοσιοστ",
-    500: "πεντακοσιοστ",
-    600: "εξακοσιοστ",
-    700: "εφτακοσιοστ",
-    800: "οχτακοσιοστ",
-    900: "εννιακοσιοστ",
-    1000: "χιλιοστ"
+    if hour in ["1", "3", "4"]:
+        hour = triad_words(int(hour), "feminine")  # η ώρα -> μία, τρεις, τέσσερις
+    return hour + " και " + _hour_minutes.get(minutes, minutes)
+
+
+_hour_minutes = {
+    "15": "τέταρτο",
+    "30": "μισή"
 }
 
-def intonate(syllabel):
-    out = syllabel
-    if 'ο' in syllabel: out = re.sub("ο", "ό", syllabel)
-    if 'ι' in syllabel: out = re.sub("ι", "ί", syllabel)
-    if 'α' in syllabel: out = re.sub("α", "ά", syllabel)
-    if 'η' in syllabel: out = re.sub("η", "ή", syllabel)
-    if 'ε' in syllabel: out = re.sub("ε", "έ", syllabel)
-    if 'υ' in syllabel: out = re.sub("υ", "ύ", syllabel)
-    if 'ω' in syllabel: out = re.sub("ω", "ώ", syllabel)
-    return out
+
+_ordinal_suffixes = {'ος', 'ες', 'ο', 'η', 'α', 'οι'}
 
 
+@cached
 def convert_ordinals(word):
-    out_words = ""
+    """ Converts the ordinals (a number followed by one of the suffixes ος, η, ο, οι, ες, α)
+        of a text to words. E.g. "ήρθε 23η" -> "ήρθε εικοστή τρίτη". The rest of the words
+        are returned as they are.
+    """
+    out_words = []
     for w in word.split(" "):
-        # Step 1: Separate the word from the number (e.g. 10ος -> (10, ος)])
-        words = re.split(r"(\d+)", w)  # may have spaces
-        words = (w for w in words if w.strip() != "")  # remove spaces from list
-        try:
-            number, suffix = words
-            number = int(number)
-        except ValueError:  
-            # This is not an ordinal since it is either sth like 10α10 (probably some typo)
-            #       OR
-            # sth like να10 (the word is first)
-            out_words += w + " "
+        # Step 1: Separate the word from the number (e.g. 10ος -> (10, ος))
+        end = 0
+        while end < len(w) and "0" <= w[end] <= "9":  # Only ascii digits, like the number rules
+            end += 1
+        suffix = w[end:]
+        # This is not an ordinal if there is no number, if it is sth like 10α10 (probably
+        #  some typo) or sth like να10 (the word is first)
+        if end == 0 or suffix.lower() not in _ordinal_suffixes:
+            out_words.append(w)
             continue
-        if suffix.lower() not in ['ος', 'ες', 'ο', 'η', 'α', 'οι']: out_words += w + " "; continue
-        if number < 1: out_words += w + " "; continue
-        if 1 <= number <= 9: out_words += _standard_ordinals[number] + suffix + " "; continue
-        if number in _standard_ordinals.keys(): out_words += _standard_ordinals[number] + intonate(suffix) + " "; continue  # catch 20, 30, 40...
-        if number in [10, 11, 12]: out_words += convert_numbers(str(number)) + "τ" + suffix + " "; continue
-        if 13 <= number <= 19: out_words+= "δέκατ" + suffix + " " + _standard_ordinals[int(str(number)[-1])] + suffix + " "; continue
-        try:
-            num_of_digits = len(str(number))
-            # e.g. from 23ος keep the 2 and write εικοστός (which is 2 * 10^(2-1))
-            # e.g. from 401ος keep the 4 and write τετρακοσιοστός (which is 4 * 10^(3-1)) (3 is the number of digits in 401)
-            out =  _standard_ordinals[int(str(number)[0]) * (10**(num_of_digits-1))] + intonate(suffix)
-            for i in range(1, num_of_digits):  # for the remaining digits
-                temp_word = str(number)[i:] + suffix
-                if temp_word.startswith("0"): continue  # e.g. if word is "103ος" then in this loop we will start from 03 and we want to ignore the 0
-                out += " " + convert_ordinals(temp_word)
-                break
-            out_words += out
-        except KeyError:
-            # This will happen if a number bigger than 1999 is given
-            out_words += w
-        out_words += " "
-    return out_words.strip()
+        triads = _split_triads(w[:end])
+        out_words.append(_ordinal_triads(triads, suffix) if any(triads) else w)
+    return " ".join(out_words).strip()
+
+
+def ordinal_words(number: int, suffix: str = "ος") -> str:
+    """ Returns the ordinal of a positive integer of any size, with the given suffix
+        appended to each of its words. E.g. ordinal_words(2023, "η") -> "δισχιλιοστή εικοστή τρίτη".
+        Args:
+            number: The integer to convert (0 gives the empty string).
+            suffix: One of "ος", "η", "ο", "οι", "ες" and "α" (in any case).
+        Returns:
+            The words of the ordinal.
+    """
+    return _ordinal_triads(_split_triads(str(number)), suffix)
+
+
+def _ordinal_triads(triads: list, suffix: str) -> str:
+    if len(triads) <= _block_size:
+        return _ordinal_block(triads, suffix)
+    # Larger numbers are read as a (cardinal) multiple of the largest scale word,
+    #  followed by the ordinal of the rest. E.g. 2 * 10^33 -> "δύο δεκάκις εκατομμυριοστός"
+    high, low = triads[_block_size:], triads[:_block_size]
+    out = [_ordinal_scales[-1] + accented_suffix(suffix)]
+    if high[0] != 1 or any(high[1:]):
+        out.insert(0, _convert_triads(*high))
+    if any(low):
+        out.append(_ordinal_block(low, suffix))
+    return " ".join(out)
+
+
+def _ordinal_block(triads: list, suffix: str) -> str:
+    # The ordinal of (at most _block_size) triads, starting from the least significant one
+    accented = accented_suffix(suffix)
+    out = []
+    for index in range(len(triads) - 1, 0, -1):
+        triad = triads[index]
+        if not triad:
+            continue
+        if index == 1:
+            stem = _ordinal_thousands.get(triad) or triad_words(triad) + " " + _ordinal_thousands[1]
+        else:
+            stem = _ordinal_scales[index - 2] if triad == 1 else triad_words(triad) + " " + _ordinal_scales[index - 2]
+        out.append(stem + accented)
+    if triads[0]:
+        out.append(get_ordinal_table(suffix)[triads[0]])
+    return " ".join(out)
@@ -0,0 +1,388 @@
+# MIT License
+#
+# Copyright (c) [year] [fullname]
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+""" The inverse of numbers2words: reads the greek words of the numbers of a sentence
+    back as digits, e.g. "πλήρωσα δυο χιλιάδες πεντακόσια ευρώ" -> "πλήρωσα 2500 ευρώ".
+    The words are taken from the same tables as the forward conversion (every gender and
+    case of the cardinals and every suffix of the ordinals) and compiled into a trie of
+    words, so that a sentence is scanned in a single pass. Accents and capitals are ignored.
+"""
+
+import re
+import sys
+
+from num2word_greek.prefixes import (CASES, GENDERS, _inflected_thousand, _ordinal_hundreds, _ordinal_scales,
+                                     _ordinal_tens, _ordinal_thousands, _ordinal_units, _prefixes, _scale_words,
+                                     get_inflection, get_triad_table)
+from num2word_greek.utils import _ordinal_suffixes
+
+
+# The kinds of the entries of the trie
+_ZERO = 0  # μηδέν
+_SMALL = 1  # 1-99, e.g. δεκατρία
+_HUNDRED = 2  # 100-900, e.g. διακόσια
+_THOUSAND = 3  # χίλια (1000 on its own)
+_SCALE = 4  # A multiplier of the preceding triad, e.g. χιλιάδες, εκατομμύρια
+_ORD_SMALL = 5  # 1-99, e.g. τρίτος
+_ORD_HUNDRED = 6  # 100-900, e.g. διακοσιοστός
+_ORD_SCALE = 7  # An ordinal multiplier of the preceding triad, e.g. χιλιοστός, εκατομμυριοστός
+_ORD_FIXED = 8  # 2000-10000 on their own, e.g. δισχιλιοστός
+_COMMA = 9  # κόμμα
+_MINUS = 10  # μείον
+
+_accents = str.maketrans("άέήίόύώΐΰϊϋ", "αεηιουωιυιυ")
+_word = re.compile(r"\w+")
+_end = None  # The key of the entry of a trie node
+
+_trie = None
+
+
+def _normalize(word: str) -> str:
+    # The key of a word in the trie, e.g. "Τρείς" -> "τρεις"
+    return word.lower().translate(_accents)
+
+
+def _add(trie: dict, words: str, kind: int, value: int, suffix: str = None):
+    node = trie
+    for word in words.split():
+        node = node.setdefault(_normalize(word), {})
+    node.setdefault(_end, (kind, value, suffix))
+
+
+def _build_trie() -> dict:
+    trie = {}
+    _add(trie, _prefixes['1digit']['0'], _ZERO, 0)
+    _add(trie, "κόμμα", _COMMA, 0)
+    _add(trie, "μείον", _MINUS, 0)
+    tables = [get_triad_table("neuter"), get_triad_table("feminine")]
+    tables += [get_inflection(gender, case).units for gender in GENDERS for case in CASES]
+    for table in tables:
+        for number in range(1, 100):
+            _add(trie, table[number], _SMALL, number)
+        for hundreds in range(100, 1000, 100):
+            _add(trie, table[hundreds], _HUNDRED, hundreds)
+            _add(trie, table[hundreds + 1].split()[0], _HUNDRED, hundreds)  # E.g. εκατόν, διακοσια
+    for forms in _inflected_thousand:
+        for form in forms:
+            _add(trie, form, _THOUSAND, 1000)
+    for case in CASES:
+        inflection = get_inflection("neuter", case)
+        _add(trie, inflection.thousands, _SCALE, 1000)
+        for index, (singular, plural) in enumerate(inflection.scales):
+            _add(trie, singular, _SCALE, 1000 ** (index + 2))
+            _add(trie, plural, _SCALE, 1000 ** (index + 2))
+    for suffix in _ordinal_suffixes:
+        stems = [(stem, _ORD_SMALL, units) for units, stem in _ordinal_units.items()]
+        stems += [(stem, _ORD_SMALL, tens * 10) for tens, stem in _ordinal_tens.items()]
+        stems += [("δέκατ", _ORD_SMALL, 10), ("έντεκατ", _ORD_SMALL, 11), ("δώδεκατ", _ORD_SMALL, 12)]
+        stems += [(stem, _ORD_HUNDRED, hundreds * 100) for hundreds, stem in _ordinal_hundreds.items()]
+        stems += [(stem, _ORD_FIXED, thousands * 1000) for thousands, stem in _ordinal_thousands.items()]
+        stems[-len(_ordinal_thousands)] = (_ordinal_thousands[1], _ORD_SCALE, 1000)  # χιλιοστ
+        stems += [(stem, _ORD_SCALE, 1000 ** (index + 2)) for index, stem in enumerate(_ordinal_scales)]
+        for stem, kind, value in stems:
+            _add(trie, stem + suffix, kind, value, suffix)
+    return trie
+
+
+def _get_trie() -> dict:
+    global _trie
+    if _trie is None:
+        _trie = _build_trie()
+    return _trie
+
+
+class _Scanner:
+    """ The words of a sentence and the numbers that they form. """
+
+    __slots__ = ("keys", "joined", "trie", "ordinals")
+
+    def __init__(self, keys: list, joined: list, ordinals: bool):
+        self.keys = keys  # The normalized words
+        self.joined = joined  # Whether only whitespace separates each word from the previous one
+        self.trie = _get_trie()
+        self.ordinals = ordinals
+
+    def lookup(self, index: int, first: bool):
+        # The (longest) entry which starts at the index-th word and the index after it
+        keys, joined = self.keys, self.joined
+        if index >= len(keys) or not (first or joined[index]):
+            return None, index
+        node = self.trie.get(keys[index])
+        entry, end = None, index
+        while node is not None:
+            index += 1
+            if _end in node:
+                entry, end = node[_end], index
+            if index >= len(keys) or not joined[index]:
+                break
+            node = node.get(keys[index])
+        if entry is not None and entry[2] is not None and not self.ordinals:
+            return None, end
+        return entry, end
+
+    def number(self, start: int, decimals: bool = True):
+        """ Reads the number which starts at the start-th word.
+            Returns:
+                The index after its last word and its digits, or None if no number starts there.
+        """
+        entry, index = self.lookup(start, True)
+        if entry is None:
+            return None
+        if entry[0] == _ZERO:
+            return index, "0"
+        if entry[0] == _MINUS:
+            return self.negative(index, decimals)
+        number = _Number()
+        best = None
+        while entry is not None and number.add(*entry):
+            if not number.pending:
+                best = index, number.digits()
+            entry, index = self.lookup(index, False)
+        if best is None:
+            return None
+        if decimals and number.suffix is None and entry is not None and entry[0] == _COMMA:
+            fraction = self.fraction(index)
+            if fraction is not None:
+                return fraction[0], best[1] + "," + fraction[1]
+        return best
+
+    def negative(self, start: int, decimals: bool):
+        # The number after "μείον", e.g. "μείον πέντε" -> "-5"
+        read = self.number(start, decimals) if self.joined[start:start + 1] == [True] else None
+        if read is None or not read[1][0].isdigit() or not read[1][-1].isdigit():
+            return None  # Only cardinals have a sign
+        return read[0], "-" + read[1]
+
+    def fraction(self, start: int):
+        # The digits after "κόμμα", e.g. "μηδέν πέντε" -> "05"
+        digits = []
+        index = start
+        while True:
+            entry, end = self.lookup(index, False)
+            if entry is None or entry[0] != _ZERO:
+                break
+            digits.append("0")
+            index = end
+        read = self.number(index, decimals=False) if self.joined[index:index + 1] == [True] else None
+        if read is not None and read[1][0] != "-" and read[1][-1].isdigit() and read[1] != "0":
+            index = read[0]
+            digits.append(read[1])
+        return (index, "".join(digits)) if digits else None
+
+
+class _Number:
+    """ A number whose words are being read (see _Scanner.number), e.g. "δυο χιλιάδες τρία". """
+
+    __slots__ = ("total", "current", "last_scale", "suffix", "pending")
+
+    def __init__(self):
+        self.total = 0  # The value of the words before the current triad
+        self.current = 0  # The current triad
+        self.last_scale = None  # The last scale word, the next ones must be smaller
+        self.suffix = None  # The suffix of an ordinal
+        self.pending = False  # Whether current is the cardinal multiplier of an ordinal scale
+
+    def add(self, kind: int, value: int, suffix: str) -> bool:
+        """ Adds the next word to the number. Returns False if it is not a part of the number. """
+        if suffix is not None and self.suffix is not None and suffix != self.suffix:
+            return False
+        read = _readers.get(kind)
+        if read is None or not read(self, kind, value):
+            return False
+        if kind >= _ORD_SMALL:
+            self.suffix = suffix
+        return True
+
+    def digits(self) -> str:
+        return str(self.total + self.current) + (self.suffix or "")
+
+    def _small(self, kind: int, value: int) -> bool:
+        if self.current and (kind == _ORD_SMALL) != (self.suffix is not None and not self.pending):
+            return False  # The words of a triad are all ordinals or all cardinals, not e.g. "εικοστός δύο"
+        rest = self.current % 100
+        if rest and not (value < 10 and rest in (_tens if kind == _SMALL else _ordinal_tens_values)):
+            return False
+        self.current += value
+        self.pending = self.suffix is not None and kind == _SMALL
+        return True
+
+    def _hundred(self, kind: int, value: int) -> bool:
+        if self.current:
+            return False
+        self.current = value
+        self.pending = self.suffix is not None and kind == _HUNDRED
+        return True
+
+    def _thousand(self, kind: int, value: int) -> bool:
+        if self.current or self.suffix is not None or (self.last_scale is not None and self.last_scale <= 1000):
+            return False
+        self.total, self.last_scale = self.total + value, value
+        return True
+
+    def _scale(self, kind: int, value: int) -> bool:
+        if value == _nested_scale and self.suffix is None:
+            return self._nested(kind, value)
+        if self.last_scale is not None and value >= self.last_scale:
+            return False
+        if self.suffix is not None and not self.pending and (self.current or kind == _SCALE):
+            return False
+        if kind == _SCALE and (not self.current or self.suffix is not None):
+            return False
+        self.total += (self.current or 1) * value
+        self.current, self.last_scale, self.pending = 0, value, False
+        return True
+
+    def _nested(self, kind: int, value: int) -> bool:
+        # The largest scale word multiplies all the words before it, e.g. 10^36 is "χίλια δεκάκις
+        #  εκατομμύρια" and 10^66 "ένα δεκάκις εκατομμύριο δεκάκις εκατομμύρια" (see convert_numbers)
+        multiplier = self.total + self.current
+        if kind == _SCALE and not multiplier:
+            return False
+        self.total, self.current, self.last_scale = (multiplier or 1) * value, 0, None
+        return True
+
+    def _fixed(self, kind: int, value: int) -> bool:
+        if self.current or (self.last_scale is not None and self.last_scale <= 1000):
+            return False
+        self.total, self.last_scale = self.total + value, 1000
+        return True
+
+
+_tens = (20, 30, 40, 50, 60, 70, 80, 90)  # The tens which may be followed by units
+_ordinal_tens_values = (10,) + _tens
+_nested_scale = 1000 ** (len(_scale_words) + 1)  # The largest scale word, δεκάκις εκατομμύριο
+_readers = {
+    _SMALL: _Number._small, _ORD_SMALL: _Number._small,
+    _HUNDRED: _Number._hundred, _ORD_HUNDRED: _Number._hundred,
+    _THOUSAND: _Number._thousand,
+    _SCALE: _Number._scale, _ORD_SCALE: _Number._scale,
+    _ORD_FIXED: _Number._fixed,
+}
+
+
+def convert_words(sentence: str, ordinals: bool = True) -> str:
+    """ Replaces the greek words of the numbers of a sentence with digits. This is the inverse
+        of convert_sentence, e.g. "δύο κόμμα μηδέν πέντε" -> "2,05" and "εικοστή τρίτη" -> "23η".
+        Args:
+            sentence: The sentence to convert (accented or not, in any case).
+            ordinals: Whether to also convert the ordinals. Some of them are common words too
+                      (e.g. Τρίτη/Tuesday or "και τέταρτο"), so you may want to disable them.
+        Returns:
+            The sentence where each (maximal) sequence of number words, separated by whitespace,
+            is replaced by its digits. Everything else (including the whitespace) is unchanged.
+    """
+    matches = list(_word.finditer(sentence))
+    if not matches:
+        return sentence
+    keys = [_normalize(match.group()) for match in matches]
+    joined = [False] + [sentence[previous.end():match.start()].isspace()
+                        for previous, match in zip(matches, matches[1:])]
+    scanner = _Scanner(keys, joined, ordinals)
+    out = []
+    position = 0  # The end of the sentence that has been copied to out
+    index = 0
+    while index < len(matches):
+        read = scanner.number(index)
+        if read is None:
+            index += 1
+            continue
+        end, digits = read
+        out.append(sentence[position:matches[index].start()])
+        out.append(digits)
+        position = matches[end - 1].end()
+        index = end
+    out.append(sentence[position:])
+    return "".join(out)
+
+
+def _canonical(sentence: str) -> list:
+    # The words of a sentence where the number words are replaced by their entries, so that
+    #  e.g. "μία" (feminine) and "ένα" (neuter) are the same
+    trie = _get_trie()
+    keys = (_normalize(match.group()) for match in _word.finditer(sentence))
+    return [trie.get(key, {}).get(_end, key) for key in keys]
+
+
+def verify_round_trip(path: str, encoding: str = "utf-8") -> list:
+    """ Checks that the words of a converted file are read back as the same numbers. Each line
+        is converted with convert_sentence, read back with convert_words and converted again.
+        The two conversions must give the same words (up to their gender, their case and the
+        punctuation, since e.g. the hours are read in the feminine: 1:30 -> "μία και μισή").
+        Args:
+            path: A text file with numbers (e.g. one of the transcripts before converting it).
+            encoding: The encoding of the file.
+        Returns:
+            A list with a (line number, line, words, digits) tuple for each line whose words
+            are read back as different numbers (an empty list if all of them round trip).
+    """
+    from num2word_greek.numbers2words import convert_sentence
+
+    mismatches = []
+    with open(path, "r", encoding=encoding) as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.rstrip("\n")
+            words = convert_sentence(line)
+            digits = convert_words(words)
+            if _canonical(convert_sentence(digits)) != _canonical(words):
+                mismatches.append((line_number, line, words, digits))
+    return mismatches
+
+
+def add_arguments(parser):
+    """ Adds the options of the words to numbers conversion to an argparse parser. """
+    parser.add_argument("text", nargs="*", help="Sentences to convert.")
+    parser.add_argument("--file", default=None,
+                        help="A text file to convert (the result is written to the standard output).")
+    parser.add_argument("--verify", default=None,
+                        help="A text file with numbers. Exits with 1 if the words of a line are not "
+                             "read back as the same numbers.")
+    parser.add_argument("--no-ordinals", action="store_true", help="Do not convert the ordinals.")
+
+
+def run(args):
+    """ Runs the conversion for the options of add_arguments. """
+    ordinals = not args.no_ordinals
+    for text in args.text:
+        print(convert_words(text, ordinals=ordinals))
+    if args.file is not None:
+        with open(args.file, "r", encoding="utf-8") as f:
+            for line in f:
+                sys.stdout.write(convert_words(line, ordinals=ordinals))
+    if args.verify is not None:
+        mismatches = verify_round_trip(args.verify)
+        for line_number, line, words, digits in mismatches:
+            print("{}:{}: {!r} -> {!r} -> {!r}".format(args.verify, line_number, line, words, digits))
+        print("{} line(s) did not round trip.".format(len(mismatches)))
+        if mismatches:
+            sys.exit(1)
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Convert the greek words of numbers back to digits.")
+    add_arguments(parser)
+    run(parser.parse_args(argv))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+"""Test cases for the aio module."""
+import asyncio
+
+import pytest
+
+from num2word_greek.aio import AsyncConverter
+
+
+def test_async_converter_batches() -> None:
+    """It converts concurrent sentences in batches, keeping their order."""
+
+    async def run():
+        async with AsyncConverter(max_batch_size=3, max_wait=0.01) as converter:
+            return await converter.convert_many([f"{i} ευρώ" for i in range(1, 8)])
+
+    out = asyncio.run(run())
+    assert out[0] == "ένα ευρώ"
+    assert out[6] == "εφτά ευρώ"
+
+
+def test_async_converter_errors() -> None:
+    """It only fails the sentences which cannot be converted."""
+
+    async def run():
+        converter = AsyncConverter(max_wait=0)
+        bad = asyncio.ensure_future(converter.convert_sentence("١٢ κιλά"))
+        good = await converter.convert_sentence("2 κιλά")
+        with pytest.raises(ValueError):
+            await bad
+        return good
+
+    assert asyncio.run(run()) == "δύο κιλά"
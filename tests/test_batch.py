@@ -0,0 +1,57 @@
+"""Test cases for the batch module."""
+import pytest
+
+from num2word_greek import batch
+from num2word_greek.batch import convert_numbers_batch
+from num2word_greek.convert_numbers import convert_numbers, set_long_number_policy
+
+
+NUMBERS = [0, 7, 13, 7, 1000, 2500, 13000, 1000000, 2001000, 999999999999, 13, 10 ** 12, 2 ** 63 - 1]
+
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(request, monkeypatch):
+    """Run a test with and without numpy."""
+    if request.param == "numpy" and batch.np is None:
+        pytest.skip("numpy is not installed")
+    if request.param == "python":
+        monkeypatch.setattr(batch, "np", None)
+    return request.param
+
+
+def test_convert_numbers_batch(backend) -> None:
+    """It gives the same words as convert_numbers."""
+    expected = [convert_numbers(str(number)) for number in NUMBERS]
+    assert convert_numbers_batch(NUMBERS) == expected
+    if backend == "numpy":
+        assert convert_numbers_batch(batch.np.array(NUMBERS)) == expected
+
+
+def test_convert_numbers_batch_negative(backend) -> None:
+    """It rejects negative numbers."""
+    with pytest.raises(ValueError):
+        convert_numbers_batch([-1, 2])
+
+
+def test_convert_numbers_batch_long(backend) -> None:
+    """It converts integers of any size and follows the long number policy."""
+    numbers = [10 ** 40, 5, 6912345678]
+    assert convert_numbers_batch(numbers) == [convert_numbers(str(number)) for number in numbers]
+    set_long_number_policy(max_digits=4, read_as="digits")
+    try:
+        assert convert_numbers_batch(numbers[1:]) == ["πέντε", "έξι εννιά ένα δύο τρία τέσσερα πέντε έξι εφτά οχτώ"]
+    finally:
+        set_long_number_policy()
+
+
+def test_convert_numbers_batch_not_integers(backend) -> None:
+    """It rejects non integer values."""
+    with pytest.raises(TypeError):
+        convert_numbers_batch([1.5, 2])
+
+
+def test_convert_numbers_batch_inflected(backend) -> None:
+    """It converts all the numbers in the same gender and case."""
+    expected = [convert_numbers(str(number), "masculine", "genitive") for number in NUMBERS]
+    assert convert_numbers_batch(NUMBERS, gender="masculine", case="genitive") == expected
+    assert convert_numbers_batch([1, 3, 1], gender="feminine") == ["μία", "τρεις", "μία"]
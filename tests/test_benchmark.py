@@ -0,0 +1,39 @@
+"""Test cases for the benchmark module."""
+from num2word_greek import benchmark
+
+
+def test_compare() -> None:
+    """Only slowdowns above the tolerance are reported."""
+    baseline = {"meta": {"version": "0"},
+                "functions": {"handle_hours_us": 1.0, "convert_ordinals_us": 1.0},
+                "files": {"file_mb_per_second": 10.0, "file_peak_memory_bytes": 100}}
+    results = {"meta": {"version": "1"},
+               "functions": {"handle_hours_us": 1.05, "convert_ordinals_us": 2.0},
+               "files": {"file_mb_per_second": 5.0, "file_peak_memory_bytes": 1000}}
+    regressions = benchmark.compare(results, baseline, tolerance=0.1)
+    assert regressions == [("functions.convert_ordinals_us", 1.0, 2.0, 1.0),
+                           ("files.file_mb_per_second", 10.0, 5.0, 0.5)]
+    assert benchmark.compare(baseline, baseline) == []
+
+
+def test_bench_functions() -> None:
+    """Every digit length is timed."""
+    results = benchmark.bench_functions(number=10, repeat=1)
+    assert all("convert_numbers_{}_digits_us".format(i) in results for i in range(1, 13))
+    assert results["handle_hours_us"] > 0
+
+
+def test_bench_startup() -> None:
+    """Importing the library does not load the command line modules."""
+    results = benchmark.bench_startup(runs=1, budget_ms=1000)
+    assert results["cli_modules"] == []
+    assert results["import_us"] > 0 and not results["over_budget"]
+
+
+def test_bench_rules() -> None:
+    """The registered rules are removed afterwards."""
+    from num2word_greek import rules
+
+    results = benchmark.bench_rules(counts=(0, 20), count=10, repeat=1)
+    assert results["rules_20_us"] > 0 and results["separate_passes_20_us"] > 0
+    assert len(rules.get_rules()) == 5
@@ -0,0 +1,33 @@
+"""Test cases for the cache module."""
+import pytest
+
+from num2word_greek import cache
+from num2word_greek.convert_numbers import convert_numbers
+from num2word_greek.utils import handle_hours
+
+
+@pytest.fixture
+def lru():
+    """Enable a small cache for the duration of a test."""
+    cache.enable_cache(maxsize=2)
+    yield
+    cache.disable_cache()
+
+
+def test_cache_statistics(lru) -> None:
+    """It counts hits, misses and evictions."""
+    assert convert_numbers("10") == "δέκα"
+    assert convert_numbers("10") == "δέκα"
+    handle_hours("3:30")
+    convert_numbers("20")
+    info = cache.cache_info()
+    assert (info.hits, info.misses, info.evictions, info.currsize) == (1, 3, 1, 2)
+    assert info.hit_rate == 0.25
+    cache.cache_clear()
+    assert cache.cache_info().currsize == 0
+
+
+def test_cache_disabled() -> None:
+    """It reports an empty cache when disabled."""
+    convert_numbers("10")
+    assert cache.cache_info() == cache.CacheInfo(0, 0, 0, 0, 0)
@@ -0,0 +1,41 @@
+"""Test cases for the compression module."""
+import bz2
+import gzip
+import lzma
+
+import pytest
+
+from num2word_greek.compression import open_text, resolve_compression
+from num2word_greek.numbers2words import _convert_file_contents
+
+
+@pytest.mark.parametrize("extension, module", [(".gz", gzip), (".bz2", bz2), (".xz", lzma)])
+def test_convert_compressed_file(tmp_path, extension: str, module) -> None:
+    """Compressed files are converted based on their extensions."""
+    src, out = tmp_path / ("in.txt" + extension), tmp_path / ("out.txt" + extension)
+    src.write_bytes(module.compress("Στις 10:15\n2 κιλά\n".encode("utf-8")))
+    _convert_file_contents(str(src), str(out), buffer_size=16, compress_level=1)
+    assert module.decompress(out.read_bytes()).decode("utf-8") == "Στις δέκα και τέταρτο\nδύο κιλά\n"
+    _convert_file_contents(str(src), str(src), io_mode="mmap")  # In place
+    assert module.decompress(src.read_bytes()).decode("utf-8") == "Στις δέκα και τέταρτο\nδύο κιλά\n"
+
+
+def test_explicit_compression(tmp_path) -> None:
+    """The compression may be given for files without an extension."""
+    src, out = tmp_path / "in", tmp_path / "out.gz"
+    src.write_bytes(gzip.compress("2 κιλά\n".encode("utf-8")))
+    _convert_file_contents(str(src), str(out), compression="gzip")
+    with open_text(str(out), "r", "gzip") as f:
+        assert f.read() == "δύο κιλά\n"
+    plain = tmp_path / "plain.gz"
+    plain.write_text("3 κιλά\n", encoding="utf-8")
+    _convert_file_contents(str(plain), str(plain), compression=None)
+    assert plain.read_text(encoding="utf-8") == "τρία κιλά\n"
+
+
+def test_resolve_compression() -> None:
+    """The compression of each extension is used."""
+    assert [resolve_compression(name) for name in ["a.txt.GZ", "a.bz2", "a.xz", "a.txt"]] == ["gzip", "bz2", "xz", None]
+    assert resolve_compression("a.txt", "xz") == "xz"
+    with pytest.raises(ValueError):
+        resolve_compression("a.txt", "zip")
@@ -0,0 +1,149 @@
+"""Test cases for the convert_numbers module."""
+import pytest
+
+from num2word_greek.convert_numbers import convert_numbers, set_long_number_policy
+from num2word_greek.prefixes import get_triad_table
+
+
+@pytest.mark.parametrize(
+    "word, expected",
+    [
+        ("0", "μηδέν"),
+        ("000", ""),
+        ("7", "εφτά"),
+        ("13", "δεκατρία"),
+        ("100", "εκατό"),
+        ("187", "εκατόν ογδονταεφτά"),
+        ("1000", "χίλια"),
+        ("2500", "δυο χιλιάδες πεντακόσια"),
+        ("13000", "δεκατρείς χιλιάδες"),
+        ("24000", "εικοσιτέσσερις χιλιάδες"),
+        ("1000000", "ένα εκατομμύριο"),
+        ("2001000", "δύο εκατομμύρια χίλια"),
+        ("1000000000", "ένα δισεκατομμύριο"),
+        ("3001000000", "τρία δισεκατομμύρια ένα εκατομμύριο"),
+        ("λέξη", "λέξη"),
+    ],
+)
+def test_convert_numbers(word: str, expected: str) -> None:
+    """It converts integers to their greek words."""
+    assert convert_numbers(word) == expected
+
+
+@pytest.mark.parametrize(
+    "word, expected",
+    [
+        ("1" + "0" * 12, "ένα τρισεκατομμύριο"),
+        ("2" + "0" * 15 + "5", "είκοσι τετράκις εκατομμύρια πέντε"),
+        ("1" + "0" * 33, "ένα δεκάκις εκατομμύριο"),
+        ("1" + "0" * 36, "χίλια δεκάκις εκατομμύρια"),
+        ("2" + "0" * 66, "δύο δεκάκις εκατομμύρια δεκάκις εκατομμύρια"),
+        ("0" * 40 + "7", "εφτά"),
+    ],
+)
+def test_convert_numbers_long(word: str, expected: str) -> None:
+    """It reads integers of any size with the greek scale words."""
+    assert convert_numbers(word) == expected
+
+
+def test_convert_numbers_linear_time() -> None:
+    """It converts very long integers (one triad at a time)."""
+    assert convert_numbers("9" * 300000).count("δεκάκις εκατομμύρια") == 300000 // 33
+
+
+@pytest.mark.parametrize(
+    "read_as, group_size, expected",
+    [
+        ("digits", 3, "έξι εννιά μηδέν ένα δύο"),
+        ("groups", 2, "εξηνταεννιά μηδέν ένα δύο"),
+        ("groups", 3, "εξακοσια ενενήντα δώδεκα"),
+    ],
+)
+def test_long_number_policy(read_as: str, group_size: int, expected: str) -> None:
+    """It reads the integers with more than max_digits digits digit by digit or in groups."""
+    set_long_number_policy(max_digits=4, read_as=read_as, group_size=group_size)
+    try:
+        assert convert_numbers("69012") == expected
+        assert convert_numbers("6901") == "έξι χιλιάδες εννιακοσια ένα"
+    finally:
+        set_long_number_policy()
+    with pytest.raises(ValueError):
+        set_long_number_policy(max_digits=4, read_as="words")
+
+
+def test_triad_tables() -> None:
+    """It exposes the words of every triad in both forms."""
+    neuter, feminine = get_triad_table("neuter"), get_triad_table("feminine")
+    assert len(neuter) == len(feminine) == 1000
+    assert (neuter[0], neuter[13], neuter[200]) == ("", "δεκατρία", "διακόσια")
+    assert (feminine[4], feminine[13], feminine[200]) == ("τέσσερις", "δεκατρείς", "διακόσιες")
+    with pytest.raises(ValueError):
+        get_triad_table("masculine")
+
+
+@pytest.mark.parametrize(
+    "word, gender, case, expected",
+    [
+        ("1", "masculine", "nominative", "ένας"),
+        ("1", "masculine", "accusative", "έναν"),
+        ("1", "feminine", "genitive", "μιας"),
+        ("21", "feminine", "nominative", "είκοσι μία"),
+        ("13", "masculine", "genitive", "δεκατριών"),
+        ("234", "masculine", "nominative", "διακόσιοι τριαντατέσσερις"),
+        ("1201", "feminine", "nominative", "χίλιες διακόσιες μία"),
+        ("1201", "masculine", "accusative", "χίλιους διακόσιους έναν"),
+        ("3004", "neuter", "genitive", "τριών χιλιάδων τεσσάρων"),
+        ("1001003", "masculine", "genitive", "ενός εκατομμυρίου χιλίων τριών"),
+        ("2000000", "feminine", "accusative", "δύο εκατομμύρια"),
+        ("13", "neuter", "accusative", "δεκατρία"),
+    ],
+)
+def test_convert_numbers_inflected(word: str, gender: str, case: str, expected: str) -> None:
+    """It agrees with the gender and the case of the following noun."""
+    assert convert_numbers(word, gender=gender, case=case) == expected
+
+
+# The multipliers of "χιλιάδες" are feminine whatever the gender of the noun
+THOUSANDS = {
+    "3000": ("τρεις χιλιάδες", "τριών χιλιάδων"),
+    "4000": ("τέσσερις χιλιάδες", "τεσσάρων χιλιάδων"),
+    "21000": ("είκοσι μία χιλιάδες", "είκοσι μιας χιλιάδων"),
+    "201000": ("διακόσιες μία χιλιάδες", "διακοσίων μιας χιλιάδων"),
+    "203000": ("διακόσιες τρεις χιλιάδες", "διακοσίων τριών χιλιάδων"),
+}
+# The default form (neuter nominative) is not changed
+DEFAULT_THOUSANDS = {
+    "21000": "εικοσιένα χιλιάδες",
+    "201000": "διακοσια ένα χιλιάδες",
+    "203000": "διακοσια τρείς χιλιάδες",
+    "21021": "εικοσιένα χιλιάδες εικοσιένα",
+}
+FORMS = [(gender, case) for gender in ("masculine", "feminine", "neuter")
+         for case in ("nominative", "genitive", "accusative") if (gender, case) != ("neuter", "nominative")]
+
+
+@pytest.mark.parametrize("gender, case", FORMS)
+def test_convert_numbers_inflected_thousands(gender: str, case: str) -> None:
+    """The thousands agree with "χιλιάδες" in the requested case, whatever the gender."""
+    for word, (direct, genitive) in THOUSANDS.items():
+        assert convert_numbers(word, gender=gender, case=case) == (genitive if case == "genitive" else direct)
+    one_thousand = {("masculine", "nominative"): "χίλιοι", ("masculine", "accusative"): "χίλιους",
+                    ("feminine", "nominative"): "χίλιες", ("feminine", "accusative"): "χίλιες"}
+    expected = "χιλίων" if case == "genitive" else one_thousand.get((gender, case), "χίλια")
+    assert convert_numbers("1000", gender=gender, case=case) == expected
+
+
+@pytest.mark.parametrize("word, expected", DEFAULT_THOUSANDS.items())
+def test_convert_numbers_default_thousands(word: str, expected: str) -> None:
+    """The default form keeps its words before "χιλιάδες"."""
+    assert convert_numbers(word) == convert_numbers(word, "neuter", "nominative") == expected
+
+
+def test_convert_numbers_inflected_default() -> None:
+    """The neuter nominative is the default form and unknown forms are rejected."""
+    for number in (7, 203, 13000, 2001003, 10 ** 40 + 3):
+        assert convert_numbers(str(number), "neuter", "nominative") == convert_numbers(str(number))
+    with pytest.raises(ValueError):
+        convert_numbers("3", gender="plural")
+    with pytest.raises(ValueError):
+        convert_numbers("3", case="vocative")
@@ -0,0 +1,39 @@
+"""Test cases for the discovery module."""
+import os
+
+import pytest
+
+from num2word_greek.discovery import find_files
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    """A nested speaker/session tree."""
+    for name in ["a.txt", "spk1/s1/b.txt", "spk1/c.lab", "spk2/d.txt", "spk2/tmp/e.txt", "notes.md"]:
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("1\n", encoding="utf-8")
+    return tmp_path
+
+
+def _find(root, *args, **kwargs) -> list:
+    return [path.replace(os.sep, "/") for path in find_files(str(root), *args, **kwargs)]
+
+
+def test_find_files(corpus) -> None:
+    """It finds the matching files of the whole tree, in a stable order."""
+    assert _find(corpus, ["*.txt"]) == ["a.txt", "spk1/s1/b.txt", "spk2/d.txt", "spk2/tmp/e.txt"]
+    assert _find(corpus, ["*.txt", "*.lab"], ["tmp", "/a.txt"]) == ["spk1/c.lab", "spk1/s1/b.txt", "spk2/d.txt"]
+    assert _find(corpus, ["spk1/*"]) == ["spk1/c.lab", "spk1/s1/b.txt"]
+    assert _find(corpus, ["*"], recursive=False) == ["a.txt", "notes.md"]
+
+
+def _raise(error: OSError):
+    raise error
+
+
+def test_find_files_errors(corpus) -> None:
+    """A directory which cannot be read is skipped, unless onerror raises."""
+    assert _find(corpus / "missing") == []
+    with pytest.raises(FileNotFoundError):
+        _find(corpus / "missing", onerror=_raise)
@@ -0,0 +1,83 @@
+"""Test cases for the error policies of the line based conversions."""
+import io
+import json
+
+import pytest
+
+from num2word_greek import rules
+from num2word_greek.errors import ErrorRecord, ErrorReport
+from num2word_greek.numbers2words import _convert_file_task, convert_lines, convert_stream
+
+
+def _fail(match) -> str:
+    raise ValueError("cannot read " + match.group())
+
+
+@pytest.fixture(autouse=True)
+def failing_rule():
+    """A rule which always fails, like a bad token."""
+    rules.register_rule("failing", r"(?<!\S)XX\d+", _fail)
+    yield
+    rules.reset_rules()
+
+
+LINES = ["Στις 10:15 το  XX1\n", "2 κιλά\n"]
+
+
+def test_keep_token() -> None:
+    """Only the tokens which failed are kept unchanged."""
+    report = ErrorReport()
+    assert list(convert_lines(LINES, errors="keep_token", report=report, source="a.txt")) == [
+        "Στις δέκα και τέταρτο το XX1\n", "δύο κιλά\n"]
+    assert report.records == [ErrorRecord("a.txt", 1, "XX1", "ValueError", "cannot read XX1")]
+
+
+def test_skip_line() -> None:
+    """The lines which failed are kept unchanged."""
+    report = ErrorReport()
+    assert list(convert_lines(LINES, errors="skip_line", report=report)) == ["Στις 10:15 το  XX1\n", "δύο κιλά\n"]
+    assert [(record.line, record.token) for record in report.records] == [(1, "XX1")]
+
+
+def test_fail() -> None:
+    """The first failure is raised (and reported once)."""
+    report = ErrorReport()
+    with pytest.raises(ValueError):
+        list(convert_lines(LINES, report=report))
+    assert len(report) == 1
+    with pytest.raises(ValueError):
+        list(convert_lines(LINES, errors="ignore"))
+
+
+def test_records() -> None:
+    """The policy also applies to the fields of the records and to records which cannot be read."""
+    report = ErrorReport()
+    lines = ['{"text": "το XX1 και 2"}\n', "not json\n"]
+    assert list(convert_lines(lines, record_format="jsonl", errors="keep_token", report=report)) == [
+        '{"text": "το XX1 και δύο"}\n', "not json\n"]
+    assert [(record.line, record.token) for record in report.records] == [(1, "XX1"), (2, None)]
+
+
+def test_report_file(tmp_path) -> None:
+    """The report is written as JSON lines, with the path of the file."""
+    src = tmp_path / "a.txt"
+    src.write_text("".join(LINES), encoding="utf-8")
+    out = tmp_path / "b.txt"
+    result = _convert_file_task((str(src), str(out)), report_errors=True, errors="skip_line")
+    assert result[:3] == (str(src), "processed", None)
+    assert out.read_text(encoding="utf-8") == "Στις 10:15 το  XX1\nδύο κιλά\n"
+    with ErrorReport.open(str(tmp_path / "errors.jsonl")) as report:
+        report.add_record(result[3][0])
+    assert json.loads((tmp_path / "errors.jsonl").read_text(encoding="utf-8")) == {
+        "file": str(src), "line": 1, "token": "XX1", "error": "ValueError", "message": "cannot read XX1"}
+    result = _convert_file_task((str(src), str(out)), report_errors=True)
+    assert result[1] == "failed" and len(result[3]) == 1
+
+
+def test_convert_stream_report() -> None:
+    """The failures are written as soon as they happen."""
+    dst = io.StringIO()
+    report = ErrorReport(dst)
+    convert_stream(io.StringIO("".join(LINES * 2)), io.StringIO(), errors="keep_token", report=report)
+    assert [json.loads(line)["line"] for line in dst.getvalue().splitlines()] == [1, 3]
+    assert len(report) == 2 and report.records == []
@@ -1,6 +1,10 @@
 """Test cases for the __main__ module."""
+import json
+
 import pytest
 
+from num2word_greek.convert_numbers import set_long_number_policy
+from num2word_greek.manifest import Manifest
 from num2word_greek.numbers2words import cmdline
 
 
@@ -15,3 +19,83 @@ def test_main_succeeds(runner) -> None:
     # result = runner.invoke(cmdline)
     # assert result.exit_code == 0
     return
+
+
+def test_directory_jobs(tmp_path, monkeypatch, capsys) -> None:
+    """It converts a directory with a pool of processes and reports failures."""
+    src, out = tmp_path / "in", tmp_path / "out"
+    src.mkdir()
+    for i in range(5):
+        (src / f"{i}.txt").write_text(f"Πλήρωσα {i + 10} ευρώ\n", encoding="utf-8")
+    (src / "bad.txt").write_text("١٢ ευρώ\n", encoding="utf-8")  # Not ascii digits
+    monkeypatch.setattr("sys.argv", ["num2word_greek", "-p", str(src), "-o", str(out), "-j", "2"])
+    with pytest.raises(SystemExit) as exit_info:
+        cmdline()
+    assert exit_info.value.code == 1
+    assert "Processed: 5, skipped: 0, failed: 1" in capsys.readouterr().out
+    assert (out / "3.txt").read_text(encoding="utf-8") == "Πλήρωσα δεκατρία ευρώ\n"
+
+
+def test_directory_incremental(tmp_path, monkeypatch, capsys) -> None:
+    """It skips the files which did not change since the previous run."""
+    src, out = tmp_path / "in", tmp_path / "out"
+    src.mkdir()
+    for i in range(3):
+        (src / f"{i}.txt").write_text(f"{i} ευρώ\n", encoding="utf-8")
+    argv = ["num2word_greek", "-p", str(src), "-o", str(out), "-j", "1", "--incremental"]
+    monkeypatch.setattr("sys.argv", argv)
+    for expected in ["Processed: 3, skipped: 0", "Processed: 0, skipped: 3"]:
+        with pytest.raises(SystemExit):
+            cmdline()
+        assert expected in capsys.readouterr().out
+    (src / "1.txt").write_text("10 ευρώ\n", encoding="utf-8")
+    with pytest.raises(SystemExit):
+        cmdline()
+    assert "Processed: 1, skipped: 2" in capsys.readouterr().out
+    assert (out / "1.txt").read_text(encoding="utf-8") == "δέκα ευρώ\n"
+    monkeypatch.setattr("sys.argv", argv + ["--force"])
+    with pytest.raises(SystemExit):
+        cmdline()
+    assert "Processed: 3, skipped: 0" in capsys.readouterr().out
+
+
+def test_directory_incremental_options(tmp_path, monkeypatch, capsys) -> None:
+    """It converts everything again when the options change and forgets the deleted files."""
+    src, out = tmp_path / "in", tmp_path / "out"
+    src.mkdir()
+    for i in range(2):
+        (src / f"{i}.txt").write_text(f"{i + 1000} ευρώ\n", encoding="utf-8")
+    argv = ["num2word_greek", "-p", str(src), "-o", str(out), "-j", "1", "--incremental"]
+    try:
+        for extra, expected in [([], "Processed: 2, skipped: 0"), ([], "Processed: 0, skipped: 2"),
+                                (["--max-digits", "3"], "Processed: 2, skipped: 0"),
+                                (["--max-digits", "3"], "Processed: 0, skipped: 2")]:
+            monkeypatch.setattr("sys.argv", argv + extra)
+            with pytest.raises(SystemExit):
+                cmdline()
+            assert expected in capsys.readouterr().out
+        assert (out / "1.txt").read_text(encoding="utf-8") == "ένα μηδέν μηδέν ένα ευρώ\n"
+        (src / "0.txt").unlink()
+        with pytest.raises(SystemExit):
+            cmdline()
+        manifest = json.loads((out / Manifest.filename).read_text(encoding="utf-8"))
+        assert list(manifest["files"]) == ["1.txt"]
+    finally:
+        set_long_number_policy()  # Set by --max-digits
+
+
+def test_directory_recursive(tmp_path, monkeypatch, capsys) -> None:
+    """It mirrors the tree of the matching files under the output directory."""
+    src = tmp_path / "in"
+    for name in ["a.txt", "spk1/s1/b.txt", "spk1/c.lab", "tmp/d.txt"]:
+        (src / name).parent.mkdir(parents=True, exist_ok=True)
+        (src / name).write_text("2 ευρώ\n", encoding="utf-8")
+    argv = ["num2word_greek", "-p", str(src), "-o", str(src / "out"), "-j", "2", "-r",
+            "--include", "*.txt", "--include", "*.lab", "--exclude", "tmp"]
+    monkeypatch.setattr("sys.argv", argv)
+    for _ in range(2):  # The output directory is not searched
+        with pytest.raises(SystemExit):
+            cmdline()
+        assert "Processed: 3, skipped: 0" in capsys.readouterr().out
+    assert (src / "out" / "spk1" / "s1" / "b.txt").read_text(encoding="utf-8") == "δύο ευρώ\n"
+    assert sorted(path.name for path in (src / "out").rglob("*") if path.is_file()) == ["a.txt", "b.txt", "c.lab"]
@@ -0,0 +1,106 @@
+"""Test cases for the numbers2words module."""
+import io
+from pathlib import Path
+
+import pytest
+
+from num2word_greek.numbers2words import _convert_file_contents
+from num2word_greek.numbers2words import convert_lines
+from num2word_greek.numbers2words import convert_sentence
+from num2word_greek.numbers2words import convert_stream
+from num2word_greek.numbers2words import set_number_format
+
+
+DATA = Path(__file__).parent
+
+
+def _read_lines(name: str) -> list:
+    return (DATA / name).read_text(encoding="utf-8").splitlines()
+
+
+@pytest.mark.parametrize(
+    "sentence, expected",
+    list(zip(_read_lines("golden_input.txt"), _read_lines("golden_output.txt"))),
+)
+def test_convert_sentence_golden(sentence: str, expected: str) -> None:
+    """It gives the same output as the reference corpus."""
+    assert convert_sentence(sentence) == expected
+
+
+@pytest.mark.parametrize(
+    "sentence, expected",
+    [
+        ("", ""),
+        ("  \n", "  \n"),
+        ("Γεια σου , τι κάνεις ;", "Γεια σου τι κάνεις ;"),
+        ("είναι2 ευρώ .", "είναι δύο ευρώ."),
+        ("Η 2η  φορά\tστις 3:30", "Η δεύτερη φορά στις τρεις και μισή"),
+        ("πλήρωσα 2,50", "πλήρωσα δύο κόμμα πενήντα"),
+        ("ΣΤΙΣ 10:15", "ΣΤΙΣ δέκα και τέταρτο"),
+    ],
+)
+def test_convert_sentence(sentence: str, expected: str) -> None:
+    """It converts the numbers of a sentence and normalizes its whitespace."""
+    assert convert_sentence(sentence) == expected
+
+
+def test_convert_sentence_to_lower() -> None:
+    """It lowercases the sentence if asked to."""
+    assert convert_sentence("ΣΤΙΣ 10:15", to_lower=True) == "στις δέκα και τέταρτο"
+
+
+def test_convert_lines() -> None:
+    """It lazily converts an iterable of lines."""
+    lines = convert_lines(iter(["Στις 10:15\n", "\n", "2 κιλά"]))
+    assert next(lines) == "Στις δέκα και τέταρτο\n"
+    assert list(lines) == ["\n", "δύο κιλά\n"]
+
+
+@pytest.mark.parametrize("buffer_size", [0, 1 << 16])
+def test_convert_stream(buffer_size: int) -> None:
+    """It writes the converted lines of a text stream to another one."""
+    src = io.StringIO((DATA / "myday.txt").read_text(encoding="utf-8"))
+    dst = io.StringIO()
+    assert convert_stream(src, dst, buffer_size=buffer_size) == 7
+    assert dst.getvalue() == (DATA / "output.txt").read_text(encoding="utf-8")
+
+
+@pytest.mark.parametrize("io_mode", ["lines", "mmap"])
+def test_convert_file_contents_in_place(tmp_path, io_mode: str) -> None:
+    """It replaces the contents of a file with the converted ones."""
+    path = tmp_path / "myday.txt"
+    path.write_bytes((DATA / "myday.txt").read_bytes())
+    _convert_file_contents(str(path), str(path), io_mode=io_mode, buffer_size=16)
+    assert path.read_text(encoding="utf-8") == (DATA / "output.txt").read_text(encoding="utf-8")
+    assert [p.name for p in tmp_path.iterdir()] == ["myday.txt"]
+
+
+@pytest.mark.parametrize(
+    "sentence, expected",
+    [
+        ("1.000.000 ευρώ", "ένα εκατομμύριο ευρώ"),
+        ("1\u2009000\u2009000 ευρώ", "ένα εκατομμύριο ευρώ"),
+        ("1.234,56 ευρώ", "χίλια διακοσια τριαντατέσσερα κόμμα πενηνταέξι ευρώ"),
+        ("2,05 κιλά", "δύο κόμμα μηδέν πέντε κιλά"),
+        ("-5 βαθμούς", "μείον πέντε βαθμούς"),
+        ("100- ευρώ", "μείον εκατό ευρώ"),
+        ("ήρθαν 12.345.", "ήρθαν δώδεκα χιλιάδες τριακοσια σαρανταπέντε."),
+        ("3.14", "τρία. δεκατέσσερα"),
+        ("10-15", "δέκα - δεκαπέντε"),
+        ("+3- βαθμούς", "+ τρία - βαθμούς"),  # Two signs, not a literal
+    ],
+)
+def test_convert_sentence_literals(sentence: str, expected: str) -> None:
+    """It reads the thousands separators, the decimals and the signs of the numbers."""
+    assert convert_sentence(sentence) == expected
+
+
+def test_set_number_format() -> None:
+    """It also accepts a decimal point if configured."""
+    set_number_format(decimal=",.")
+    try:
+        assert convert_sentence("3.14 και 1.000") == "τρία κόμμα δεκατέσσερα και χίλια"
+    finally:
+        set_number_format()
+    with pytest.raises(ValueError):
+        set_number_format(decimal="")
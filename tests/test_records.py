@@ -0,0 +1,56 @@
+"""Test cases for the records module."""
+import pytest
+
+from num2word_greek.numbers2words import _convert_file_contents
+from num2word_greek.numbers2words import convert_lines
+
+
+def test_kaldi() -> None:
+    """It converts the transcripts but not the utterance IDs."""
+    lines = ["utt_001 πλήρωσα 25 ευρώ\n", "utt_2\n", "\n", "utt_3   στις 10:15\r\n"]
+    assert list(convert_lines(lines, record_format="kaldi")) == [
+        "utt_001 πλήρωσα εικοσιπέντε ευρώ\n", "utt_2\n", "\n", "utt_3   στις δέκα και τέταρτο\r\n"]
+
+
+def test_csv() -> None:
+    """It converts the selected (quoted or not) columns, even across lines."""
+    lines = ["id,text,n\n", 'a1,"ήρθαν ""3"" φίλοι",3\n', 'b2,"πολλές\n', 'γραμμές 2",5\n', "c3,10 κιλά,7"]
+    assert list(convert_lines(lines, record_format="csv", fields=["text"], header=True)) == [
+        "id,text,n\n", 'a1,"ήρθαν "" τρία "" φίλοι",3\n', 'b2,"πολλές γραμμές δύο",5\n', "c3,δέκα κιλά,7\n"]
+    with pytest.raises(ValueError):
+        list(convert_lines(lines, record_format="csv", fields=["text"]))  # No header
+
+
+def test_tsv() -> None:
+    """It converts the columns of the given indices."""
+    assert list(convert_lines(["12\t3 μήλα\t4\n"], record_format="tsv", fields=[1])) == ["12\tτρία μήλα\t4\n"]
+
+
+def test_jsonl() -> None:
+    """It converts the string values of the selected keys and keeps the rest byte for byte."""
+    line = '{"id": "utt_12",  "text":"πλήρωσα 25 ευρώ", "n": 12, "meta": {"title": "Η 2η φορά", "x": [1, "2"]}}\n'
+    assert list(convert_lines([line, "{}\n"], record_format="jsonl", fields=["text", "meta.title"])) == [
+        '{"id": "utt_12",  "text":"πλήρωσα εικοσιπέντε ευρώ", "n": 12, '
+        '"meta": {"title": "Η δεύτερη φορά", "x": [1, "2"]}}\n', "{}\n"]
+    with pytest.raises(ValueError):
+        list(convert_lines(["[1, 2]\n"], record_format="jsonl"))
+
+
+@pytest.mark.parametrize("io_mode", ["lines", "mmap"])
+def test_convert_file_contents_records(tmp_path, io_mode: str) -> None:
+    """The files are converted with the same streaming path."""
+    path = tmp_path / "text"
+    path.write_text("spk1-utt2 2 κιλά\nspk1-utt3 3η φορά\n", encoding="utf-8")
+    out = tmp_path / "out"
+    _convert_file_contents(str(path), str(out), io_mode=io_mode, record_format="kaldi")
+    assert out.read_text(encoding="utf-8") == "spk1-utt2 δύο κιλά\nspk1-utt3 τρίτη φορά\n"
+
+
+@pytest.mark.parametrize("io_mode", ["lines", "mmap"])
+def test_convert_file_contents_records_crlf(tmp_path, io_mode: str) -> None:
+    """The line endings of the records are kept byte for byte."""
+    path = tmp_path / "text"
+    path.write_bytes("utt1 έχω 2 μήλα\r\nutt2 3 ευρώ\r\nutt3 4".encode("utf-8"))
+    out = tmp_path / "out"
+    _convert_file_contents(str(path), str(out), io_mode=io_mode, record_format="kaldi")
+    assert out.read_bytes().decode("utf-8") == "utt1 έχω δύο μήλα\r\nutt2 τρία ευρώ\r\nutt3 τέσσερα\n"
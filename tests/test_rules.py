@@ -0,0 +1,75 @@
+"""Test cases for the rules module."""
+import pytest
+
+from num2word_greek import rules
+from num2word_greek.convert_numbers import convert_numbers
+from num2word_greek.numbers2words import convert_sentence
+
+
+@pytest.fixture(autouse=True)
+def default_rules():
+    """Restore the default rules after each test."""
+    yield
+    rules.reset_rules()
+
+
+def _percent(match) -> str:
+    return " " + convert_numbers(match.group("percent_value")) + " τοις εκατό "
+
+
+def test_default_rules() -> None:
+    """The built-in conversions are the default rules."""
+    assert [rule.name for rule in rules.get_rules()] == ["literal", "hours", "commas", "ordinal", "integer"]
+
+
+def test_register_rule() -> None:
+    """The registered rules are applied in the same scan as the default ones."""
+    rules.register_rule("percent", r"(?<!\S)(?P<percent_value>\d+)%", _percent)
+    rules.register_rule("abbreviation", r"(?<!\S)κ\.λπ\.", lambda match: "και λοιπά")
+    assert convert_sentence("Έκπτωση 25% στις 10:15 κ.λπ.") == "Έκπτωση εικοσιπέντε τοις εκατό στις δέκα και τέταρτο και λοιπά"
+    assert convert_sentence("φρούτα κ.λπ.") == "φρούτα και λοιπά"  # Even without any digits
+    assert convert_sentence("ακ.λπ.") == "ακ.λπ."  # Not at the start of a word
+
+
+def test_rule_priority() -> None:
+    """At the same position, the rule with the highest priority wins."""
+    rules.register_rule("percent", r"(?<!\S)(?P<percent_value>\d+)%", _percent, priority=5)
+    assert convert_sentence("25%") == "εικοσιπέντε %"  # The integer rule (priority 10) wins
+    rules.register_rule("percent", r"(?<!\S)(?P<percent_value>\d+)%", _percent, replace=True)
+    assert convert_sentence("25%") == "εικοσιπέντε τοις εκατό"
+    rules.register_rule("euro_5", r"€5", lambda match: " πέντε ευρώ ")
+    rules.register_rule("euro", r"€(?P<euro_value>\d+)", lambda match: " ευρώ ")
+    assert convert_sentence("€5 €6") == "πέντε ευρώ ευρώ"
+
+
+def test_replace_default_rule() -> None:
+    """The default rules may be replaced or removed."""
+    rules.register_rule("hours", r"(?<!\S)[^\s,:]*:\S*", lambda match: " ώρα ", priority=30, replace=True)
+    assert convert_sentence("στις 10:15") == "στις ώρα"
+    rules.unregister_rule("ordinal")
+    assert convert_sentence("η 2η") == "η δύο η"
+    rules.reset_rules()
+    assert convert_sentence("η 2η στις 10:15") == "η δεύτερη στις δέκα και τέταρτο"
+
+
+@pytest.mark.parametrize(
+    "name, pattern",
+    [("integer", r"\d"), ("bad-name", r"x"), ("empty", r"x*"), ("invalid", r"("), ("suffix", r"(?P<suffix>x)"),
+     ("numbered", r"(\d+)%"), ("backreference", r"(?P<twice>x)\1"), ("conditional", r"(?P<maybe>x)?(?(1)y|z)")],
+)
+def test_register_rule_invalid(name: str, pattern: str) -> None:
+    """Invalid rules are rejected and the registry is left as it was."""
+    with pytest.raises(ValueError):
+        rules.register_rule(name, pattern, str)
+    assert [rule.name for rule in rules.get_rules()] == ["literal", "hours", "commas", "ordinal", "integer"]
+    assert convert_sentence("η 2η") == "η δεύτερη"
+
+
+def test_register_rule_named_groups() -> None:
+    """The named groups and backreferences of a rule refer to its own groups."""
+    rules.register_rule("repeated", r"(?<!\S)(?P<repeated_value>\d+)x(?P=repeated_value)(?!\S)",
+                        lambda match: " " + match.group("repeated_value") + " φορές ")
+    try:
+        assert convert_sentence("2x2 και 2x3") == "2 φορές και δύο x τρία"
+    finally:
+        rules.reset_rules()
@@ -0,0 +1,41 @@
+"""Test cases for the server module."""
+import asyncio
+import threading
+
+import pytest
+
+from num2word_greek.server import Client
+from num2word_greek.server import Server
+
+
+@pytest.fixture
+def server():
+    """Run a server on a free localhost port in a background thread."""
+    loop = asyncio.new_event_loop()
+    server = Server(port=0, queue_size=4, max_batch_size=2)
+    loop.run_until_complete(server.start())
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    yield server
+    asyncio.run_coroutine_threadsafe(server.shutdown(), loop).result(timeout=10)
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(timeout=10)
+    loop.close()
+
+
+def test_server_requests(server) -> None:
+    """It answers single and batch requests over newline delimited JSON."""
+    with Client(port=server.port, fallback=False) as client:
+        assert client.convert("Στις 10:15") == "Στις δέκα και τέταρτο"
+        assert client.convert_batch([f"{i} ευρώ" for i in range(1, 11)])[9] == "δέκα ευρώ"
+        with pytest.raises(ValueError):
+            client.convert("١٢ κιλά")
+        assert client.convert("2 κιλά") == "δύο κιλά"
+
+
+def test_client_fallback() -> None:
+    """It converts in-process when the server is unavailable."""
+    client = Client(port=1, timeout=1)
+    assert client.convert_batch(["3 ευρώ"]) == ["τρία ευρώ"]
+    with pytest.raises(OSError):
+        Client(port=1, timeout=1, fallback=False).convert("3")
@@ -0,0 +1,33 @@
+"""Test cases for the stats module."""
+from num2word_greek import stats
+from num2word_greek.numbers2words import convert_sentence
+
+
+def test_collect_stats() -> None:
+    """It counts the stages, tokens and numbers of each sentence."""
+    sentences = []
+    with stats.collect_stats(hook=sentences.append) as collected:
+        assert convert_sentence("Στις 10:15 θα αγοράσω 2 κιλά") == "Στις δέκα και τέταρτο θα αγοράσω δύο κιλά"
+        assert convert_sentence("Ήρθε 2η με 1500 ψήφους") == "Ήρθε δεύτερη με χίλια πεντακόσια ψήφους"
+    assert stats.get_stats() is None
+    assert [s.tokens for s in sentences] == [6, 5]
+    assert (collected.sentences, collected.tokens) == (2, 11)
+    assert collected.numbers == {1: 1, 2: 1, 4: 1}  # "15" of 10:15 is "τέταρτο"
+    assert collected.calls["hours"] == 1 and collected.calls["ordinals"] == 2
+    assert collected.calls["numbers"] == 3 and collected.calls["cleanup"] == 2
+    assert sum(collected.seconds.values()) <= collected.total_seconds
+    assert set(collected.as_dict()["stages"]) <= set(stats.STAGES)
+
+
+def test_enable_stats() -> None:
+    """It accumulates until disabled."""
+    collected = stats.enable_stats()
+    try:
+        convert_sentence("1 2 3")
+        convert_sentence("κανένας αριθμός")
+        assert stats.get_stats() is collected
+        assert (collected.sentences, collected.numbers[1]) == (2, 3)
+    finally:
+        stats.disable_stats()
+    convert_sentence("1 2 3")
+    assert collected.sentences == 2
@@ -0,0 +1,79 @@
+"""Test cases for the tokens module."""
+import re
+from pathlib import Path
+
+import pytest
+
+from num2word_greek import rules
+from num2word_greek.numbers2words import convert_sentence
+from num2word_greek.tokens import KINDS, Token, convert_tokens
+
+
+DATA = Path(__file__).parent
+
+
+def test_convert_tokens() -> None:
+    """Each token has its span of the original sentence, its text and its kind."""
+    sentence = "Στις  10:15 ήρθαν 2,5 και η 2η\n"
+    tokens = convert_tokens(sentence)
+    assert list(tokens) == [
+        Token(0, 4, "Στις", "text"),
+        Token(6, 11, "δέκα και τέταρτο", "time"),
+        Token(12, 17, "ήρθαν", "text"),
+        Token(18, 21, "δύο κόμμα πέντε", "decimal"),
+        Token(22, 25, "και", "text"),
+        Token(26, 27, "η", "text"),
+        Token(28, 30, "δεύτερη", "ordinal"),
+    ]
+    assert tokens.text == convert_sentence(sentence)
+    assert tokens[-1] == Token(28, 30, "δεύτερη", "ordinal")
+
+
+def test_convert_tokens_normalized() -> None:
+    """The spans point to the original sentence even if it is lowercased or its digits are grouped."""
+    sentence = "ΕΙΝΑΙ\t1\u2009000\u2009000 και είναι2"
+    tokens = convert_tokens(sentence, to_lower=True)
+    assert [(sentence[token.start:token.end], token.text, token.kind) for token in tokens] == [
+        ("ΕΙΝΑΙ", "ειναι", "text"),
+        ("1\u2009000\u2009000", "ένα εκατομμύριο", "integer"),
+        ("και", "και", "text"),
+        ("είναι", "είναι", "text"),
+        ("2", "δύο", "integer"),
+    ]
+    assert tokens.text == convert_sentence(sentence, to_lower=True)
+
+
+@pytest.mark.parametrize("sentence", ["İ3 x", "ΑΒİ050.-3;", "İİ 5\u2009000 2η İ"])
+def test_convert_tokens_longer_lowercase(sentence: str) -> None:
+    """The spans do not overlap even if a lowercase letter is longer than the uppercase one."""
+    tokens = convert_tokens(sentence, to_lower=True)
+    end = 0
+    for token in tokens:
+        assert end <= token.start < token.end
+        end = token.end
+    assert [sentence[token.start:token.end] for token in tokens if token.kind != "text"] == [
+        match.group() for match in re.finditer(r"\d+(?:\u2009\d+)*(?:η)?", sentence)]
+
+
+def test_convert_tokens_rules() -> None:
+    """The tokens of a registered rule have the name of the rule as their kind."""
+    rules.register_rule("percent", r"(?<!\S)\d+%", lambda match: "τοις εκατό")
+    try:
+        kinds = list(KINDS)
+        assert "percent" in kinds
+        assert list(convert_tokens("5%")) == [Token(0, 2, "τοις εκατό", "percent")]
+        assert KINDS == kinds  # Only changed by the registration
+    finally:
+        rules.reset_rules()
+
+
+@pytest.mark.parametrize("to_lower", [False, True])
+def test_convert_tokens_golden(to_lower: bool) -> None:
+    """The text of the tokens is the same as convert_sentence and the spans are in order."""
+    for sentence in (DATA / "golden_input.txt").read_text(encoding="utf-8").splitlines(keepends=True):
+        tokens = convert_tokens(sentence, to_lower)
+        assert tokens.text == convert_sentence(sentence, to_lower)
+        end = 0
+        for token in tokens:
+            assert end <= token.start < token.end
+            end = token.end
@@ -0,0 +1,59 @@
+"""Test cases for the utils module."""
+import pytest
+
+from num2word_greek.utils import convert_ordinals
+from num2word_greek.utils import handle_commas
+from num2word_greek.utils import ordinal_words
+
+
+@pytest.mark.parametrize(
+    "word, expected",
+    [
+        ("1ος", "πρώτος"),
+        ("2η", "δεύτερη"),
+        ("10ο", "δέκατο"),
+        ("13οι", "δέκατοι τρίτοι"),
+        ("23ες", "εικοστές τρίτες"),
+        ("100α", "εκατοστά"),
+        ("1010ος", "χιλιοστός δέκατος"),
+        ("2023η", "δισχιλιοστή εικοστή τρίτη"),
+        ("25000ος", "εικοσιπέντε χιλιοστός"),
+        ("2000001ο", "δύο εκατομμυριοστό πρώτο"),
+        ("1" + "0" * 33 + "ος", "δεκάκις εκατομμυριοστός"),
+        ("10ΟΣ", "δέκατΟΣ"),
+        ("0ος", "0ος"),
+        ("10ης", "10ης"),
+        ("να10", "να10"),
+        ("ήρθε 3η", "ήρθε τρίτη"),
+    ],
+)
+def test_convert_ordinals(word: str, expected: str) -> None:
+    """It converts the ordinals of any size and keeps the other words."""
+    assert convert_ordinals(word) == expected
+
+
+def test_ordinal_words() -> None:
+    """It accents the suffix of the stems without an accent."""
+    assert ordinal_words(40, "οι") == "τεσσαρακοστοί"
+    assert ordinal_words(8, "οι") == "όγδοοι"
+
+
+@pytest.mark.parametrize(
+    "word, expected",
+    [
+        ("2,98", "2 κόμμα 98"),
+        ("102 , 98", "102 κόμμα 98"),
+        ("102,", "102 κόμμα"),
+        (",5", "5"),
+        ("a,b", "a b"),
+        ("1,2,,3", "1 κόμμα 2 κόμμα 3"),
+    ],
+)
+def test_handle_commas(word: str, expected: str) -> None:
+    """It pronounces the commas between digits and removes the rest."""
+    assert handle_commas(word) == expected
+
+
+def test_handle_commas_linear_time() -> None:
+    """It handles tokens with many commas in a single pass."""
+    assert handle_commas(",".join(["12"] * 100000)).count("κόμμα") == 99999
@@ -0,0 +1,76 @@
+"""Test cases for the words2numbers module."""
+from pathlib import Path
+
+import pytest
+
+from num2word_greek.convert_numbers import convert_numbers
+from num2word_greek.numbers2words import cmdline
+from num2word_greek.utils import convert_ordinals
+from num2word_greek.words2numbers import convert_words
+from num2word_greek.words2numbers import verify_round_trip
+
+
+DATA = Path(__file__).parent
+
+
+@pytest.mark.parametrize(
+    "sentence, expected",
+    [
+        ("πλήρωσα δυο χιλιάδες πεντακόσια ευρώ", "πλήρωσα 2500 ευρώ"),
+        ("ΔΕΚΑΤΡΕΙΣ χιλιάδες", "13000"),
+        ("διακοσιων τριαντατεσσαρων ανθρωπων", "234 ανθρωπων"),
+        ("είκοσι δύο και τρία", "22 και 3"),
+        ("δύο, τρία", "2, 3"),
+        ("δύο κόμμα μηδέν πέντε κιλά", "2,05 κιλά"),
+        ("μείον πέντε βαθμούς", "-5 βαθμούς"),
+        ("Η δέκατη τρίτη φορά", "Η 13η φορά"),
+        ("δισχιλιοστή εικοστή τρίτη", "2023η"),
+        ("εικοσιένα χιλιοστός", "21000ος"),
+        ("εκατομμύρια ευρώ", "εκατομμύρια ευρώ"),
+        ("μηδέν μηδέν", "0 0"),
+    ],
+)
+def test_convert_words(sentence: str, expected: str) -> None:
+    """It replaces the number words of a sentence with digits."""
+    assert convert_words(sentence) == expected
+
+
+def test_convert_words_no_ordinals() -> None:
+    """It may leave the ordinals as they are."""
+    assert convert_words("την Τρίτη στις τρεις", ordinals=False) == "την Τρίτη στις 3"
+
+
+@pytest.mark.parametrize("number", [1, 13, 101, 2500, 13000, 1001003, 10 ** 12 + 7, 2 * 10 ** 35 + 21000,
+                                    10 ** 36, 2001 * 10 ** 33 + 5, 10 ** 66, 5 * 10 ** 66 + 3 * 10 ** 33 + 2])
+def test_convert_words_inverse(number: int) -> None:
+    """It reads back every form of the cardinals and the ordinals."""
+    for gender in ("masculine", "feminine", "neuter"):
+        for case in ("nominative", "genitive", "accusative"):
+            assert convert_words(convert_numbers(str(number), gender, case)) == str(number)
+    for suffix in ("ος", "η", "ο", "οι", "ες", "α"):
+        assert convert_words(convert_ordinals(str(number) + suffix)) == str(number) + suffix
+
+
+def test_convert_words_linear_time() -> None:
+    """It scans a long sentence in one pass."""
+    sentence = " ".join(["δύο χιλιάδες πεντακόσια ευρώ και εικοστή τρίτη"] * 20000)
+    assert convert_words(sentence) == " ".join(["2500 ευρώ και 23η"] * 20000)
+
+
+def test_verify_round_trip(tmp_path) -> None:
+    """It reports the lines whose words are read back as different numbers."""
+    assert verify_round_trip(str(DATA / "golden_input.txt")) == []
+    path = tmp_path / "list.txt"
+    path.write_text("20 3\n", encoding="utf-8")  # είκοσι τρία is read as 23
+    assert verify_round_trip(str(path)) == [(1, "20 3", "είκοσι τρία", "23")]
+    path.write_text("{} ευρώ, {}η\n".format(10 ** 36 + 7, 3 * 10 ** 66), encoding="utf-8")  # Nested scales
+    assert verify_round_trip(str(path)) == []
+
+
+def test_words_command(tmp_path, monkeypatch, capsys) -> None:
+    """It is available as a subcommand."""
+    monkeypatch.setattr("sys.argv", ["num2word_greek", "words", "δέκα ευρώ"])
+    with pytest.raises(SystemExit) as exit_info:
+        cmdline()
+    assert exit_info.value.code == 0
+    assert capsys.readouterr().out == "10 ευρώ\n"